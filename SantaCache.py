@@ -0,0 +1,154 @@
+import sqlite3, hashlib, json, threading, time
+
+from SantaSearch import shortestRoute
+
+"""
+On-disk cache of computed routes shared between runs (and between processes) through SQLite.
+Routes are keyed by (graph content hash, engine, source, destination), so a cache never
+returns routes computed on a different graph. The database runs in WAL mode so several
+processes can read and write it at once, and least recently used routes are evicted once
+the stored routes pass maxBytes. Lookups stay reads: a hit only marks a route as recently used
+if its stored time is over touchInterval seconds old, and those marks are written in batches
+"""
+
+#Returns a hash of every city, route and distance in a graph
+def graphHash(graph):
+        digest = hashlib.sha256()
+        for node in graph.get_nodes():
+                digest.update(node.encode("utf-8") + b"\0")
+                for neighbor in graph.getNeighbors(node):
+                        digest.update(f"{neighbor}\0{graph.value(node, neighbor)!r}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+class RouteCache(object):
+        def __init__(self, path="SantaRoutes.sqlite", maxBytes=64*1024*1024, touchInterval=60.0, touchBatch=256):
+                self.path = path
+                self.maxBytes = maxBytes
+                self.touchInterval = touchInterval
+                self.touchBatch = touchBatch
+                #New lastUsed times of routes hit since they were last written, keyed like the table
+                self.touched = {}
+                #One connection shared by every thread, used under a lock
+                self.lock = threading.Lock()
+                self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
+                self.connection.executescript("""
+                        CREATE TABLE IF NOT EXISTS routes (
+                                graph TEXT, engine TEXT, source TEXT, destination TEXT,
+                                distance REAL, path TEXT, size INTEGER, lastUsed REAL,
+                                PRIMARY KEY (graph, engine, source, destination));
+                        CREATE INDEX IF NOT EXISTS routesLastUsed ON routes (lastUsed);
+                        CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER);
+                        INSERT OR IGNORE INTO totals VALUES ('bytes', 0);
+                """)
+                self.hits = 0
+                self.misses = 0
+                self.lookupSeconds = 0.0
+
+        #Looks up a route. Returns (True, (distance, path)) on a hit, where (distance, path) is
+        #None for a cached "no route", or (False, None) on a miss
+        def get(self, graph, engine, source, destination):
+                start = time.perf_counter()
+                with self.lock:
+                        row = self.connection.execute("SELECT distance, path, lastUsed FROM routes WHERE graph=? AND engine=? AND source=? AND destination=?",
+                                                      (graph, engine, source, destination)).fetchone()
+                        if row is not None:
+                                now = time.time()
+                                if now - row[2] >= self.touchInterval:
+                                        self.touched[(graph, engine, source, destination)] = now
+                                        if len(self.touched) >= self.touchBatch:
+                                                self.flushTouched()
+                                self.hits += 1
+                        else:
+                                self.misses += 1
+                        self.lookupSeconds += time.perf_counter() - start
+                if row is None:
+                        return False, None
+                if row[1] is None:
+                        return True, None
+                return True, (row[0], json.loads(row[1]))
+
+        #Stores a route (or None for "no route"), then evicts the least recently used routes
+        #until the cache is back under maxBytes
+        def put(self, graph, engine, source, destination, route):
+                distance, path = route if route is not None else (None, None)
+                path = json.dumps(path) if path is not None else None
+                size = len(graph) + len(engine) + len(source) + len(destination) + len(path or "") + 16
+                with self.lock:
+                        self.connection.execute("BEGIN IMMEDIATE")
+                        try:
+                                old = self.connection.execute("SELECT size FROM routes WHERE graph=? AND engine=? AND source=? AND destination=?",
+                                                              (graph, engine, source, destination)).fetchone()
+                                self.connection.execute("INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                                        (graph, engine, source, destination, distance, path, size, time.time()))
+                                self.connection.execute("UPDATE totals SET value = value + ? WHERE name='bytes'", (size - (old[0] if old else 0),))
+                                #Write the pending hits first, so eviction sees which routes were used
+                                self.writeTouched()
+                                self.evict()
+                                self.connection.execute("COMMIT")
+                        except BaseException:
+                                self.connection.execute("ROLLBACK")
+                                raise
+
+        #Writes the lastUsed times of the routes hit since the last write, inside the caller's
+        #transaction
+        def writeTouched(self):
+                if self.touched:
+                        self.connection.executemany("UPDATE routes SET lastUsed=max(lastUsed, ?) WHERE graph=? AND engine=? AND source=? AND destination=?",
+                                                    [(lastUsed,) + key for key, lastUsed in self.touched.items()])
+                        self.touched.clear()
+
+        #Writes the pending lastUsed times in one transaction. Called with the lock held
+        def flushTouched(self):
+                if not self.touched:
+                        return
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                        self.writeTouched()
+                        self.connection.execute("COMMIT")
+                except BaseException:
+                        self.connection.execute("ROLLBACK")
+                        raise
+
+        #Deletes the least recently used routes while the cache is over maxBytes
+        def evict(self):
+                total, = self.connection.execute("SELECT value FROM totals WHERE name='bytes'").fetchone()
+                while total > self.maxBytes:
+                        rows = self.connection.execute("SELECT rowid, size FROM routes ORDER BY lastUsed LIMIT 64").fetchall()
+                        if not rows:
+                                break
+                        for rowid, size in rows:
+                                if total <= self.maxBytes:
+                                        break
+                                self.connection.execute("DELETE FROM routes WHERE rowid=?", (rowid,))
+                                total -= size
+                self.connection.execute("UPDATE totals SET value=? WHERE name='bytes'", (total,))
+
+        #Returns the shortest route from the cache, computing and storing it on a miss.
+        #Pass contentHash when it's already known to skip hashing the graph
+        def route(self, graph, source, destination, engine=shortestRoute, contentHash=None):
+                contentHash = contentHash or graphHash(graph)
+                found, route = self.get(contentHash, engine.__name__, source, destination)
+                if not found:
+                        route = engine(graph, source, destination)
+                        self.put(contentHash, engine.__name__, source, destination, route)
+                return route
+
+        #Returns the hit rate, mean lookup latency and size of the cache
+        def stats(self):
+                lookups = self.hits + self.misses
+                with self.lock:
+                        count, = self.connection.execute("SELECT COUNT(*) FROM routes").fetchone()
+                        total, = self.connection.execute("SELECT value FROM totals WHERE name='bytes'").fetchone()
+                return {"hits": self.hits,
+                        "misses": self.misses,
+                        "hitRate": self.hits/lookups if lookups else 0.0,
+                        "meanLookupMs": 1000*self.lookupSeconds/lookups if lookups else 0.0,
+                        "routes": count,
+                        "bytes": total}
+
+        def close(self):
+                with self.lock:
+                        self.flushTouched()
+                        self.connection.close()
@@ -0,0 +1,122 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import heapq, os
+
+"""
+Brandes' betweenness centrality: how many shortest paths between other cities pass through
+each city (and along each route). The single-source searches are independent, so sources are
+split into chunks across a process pool and each worker's partial sums are added at the end
+"""
+
+#Graph used by the worker processes, set once per worker by initWorker
+workerAdjacency = None
+
+#Converts a graph to adjacency lists of (neighbor index, distance) so it can be sent to workers
+def adjacencyLists(graph):
+        nodes = list(graph.get_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        return nodes, [[(index[neighbor], graph.value(node, neighbor)) for neighbor in graph.getNeighbors(node)] for node in nodes]
+
+def initWorker(adjacency):
+        global workerAdjacency
+        workerAdjacency = adjacency
+
+#Accumulates the node and edge dependencies of every source in sources (Brandes' algorithm
+#with Dijkstra's algorithm for weighted routes). Edge dependencies are keyed by (i, j) with i < j
+def accumulate(sources, adjacency=None):
+        adjacency = adjacency or workerAdjacency
+        nodeCount = len(adjacency)
+        nodeBetweenness = [0.0]*nodeCount
+        edgeBetweenness = {}
+        for source in sources:
+                #Dijkstra's algorithm, counting the number of shortest paths (sigma) to every node
+                #and keeping every predecessor that lies on one of them
+                shortestDistance = [None]*nodeCount
+                sigma = [0]*nodeCount
+                predecessors = [[] for _ in range(nodeCount)]
+                order = []
+                best = {source: 0}
+                sigma[source] = 1
+                queue = [(0, source)]
+                while queue:
+                        distance, node = heapq.heappop(queue)
+                        if shortestDistance[node] is not None:
+                                continue
+                        shortestDistance[node] = distance
+                        order.append(node)
+                        for neighbor, weight in adjacency[node]:
+                                newDistance = distance + weight
+                                if shortestDistance[neighbor] is not None:
+                                        continue
+                                if neighbor not in best or newDistance < best[neighbor]:
+                                        best[neighbor] = newDistance
+                                        sigma[neighbor] = sigma[node]
+                                        predecessors[neighbor] = [node]
+                                        heapq.heappush(queue, (newDistance, neighbor))
+                                elif newDistance == best[neighbor]:
+                                        sigma[neighbor] += sigma[node]
+                                        predecessors[neighbor].append(node)
+
+                #Walk back from the furthest node, passing each node's dependency to its predecessors
+                delta = [0.0]*nodeCount
+                for node in reversed(order):
+                        for predecessor in predecessors[node]:
+                                credit = sigma[predecessor]/sigma[node]*(1 + delta[node])
+                                edge = (predecessor, node) if predecessor < node else (node, predecessor)
+                                edgeBetweenness[edge] = edgeBetweenness.get(edge, 0.0) + credit
+                                delta[predecessor] += credit
+                        if node != source:
+                                nodeBetweenness[node] += delta[node]
+        return nodeBetweenness, edgeBetweenness
+
+#Returns the betweenness of every city and every route as dictionaries {city: value} and
+#{(cityA, cityB): value}. Sources are split into chunks across worker processes
+#(workers=1 runs in this process). normalized scales node values to the 0-1 range
+def betweenness(graph, workers=None, normalized=False):
+        nodes, adjacency = adjacencyLists(graph)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+                partials = [accumulate(range(len(nodes)), adjacency)]
+        else:
+                #Interleave sources so every chunk gets a similar mix of cities
+                chunks = [range(worker, len(nodes), workers) for worker in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers, initializer=initWorker, initargs=(adjacency,)) as pool:
+                        partials = list(pool.map(accumulate, chunks))
+
+        nodeBetweenness = [0.0]*len(nodes)
+        edgeBetweenness = {}
+        for partialNodes, partialEdges in partials:
+                for i, value in enumerate(partialNodes):
+                        nodeBetweenness[i] += value
+                for edge, value in partialEdges.items():
+                        edgeBetweenness[edge] = edgeBetweenness.get(edge, 0.0) + value
+
+        #Routes are undirected, so every pair of cities was counted from both ends
+        scale = 0.5
+        if normalized and len(nodes) > 2:
+                scale = 1/((len(nodes) - 1)*(len(nodes) - 2))
+        return ({node: nodeBetweenness[i]*scale for i, node in enumerate(nodes)},
+                {(nodes[i], nodes[j]): value/2 for (i, j), value in edgeBetweenness.items()})
+
+#Recolors the plotted cities and routes by their betweenness, from dark (few shortest paths)
+#to bright (critical hubs). Routes are also drawn thicker the more shortest paths use them
+def plotBetweenness(nodeBetweenness, edgeBetweenness, colormap='plasma'):
+        from matplotlib import colormaps
+        from SantaGraph import cities, plotCulled
+
+        colors = colormaps[colormap]
+        nodeMax = max(nodeBetweenness.values()) or 1
+        edgeMax = max(edgeBetweenness.values()) or 1
+        #Every route and city has its own color, so each is its own line culled by updateScene
+        for (cityA, cityB), value in edgeBetweenness.items():
+                plotCulled(cities.coordsOf([cityA, cityB]), linestyle='-', color=colors(value/edgeMax), linewidth=1 + 3*value/edgeMax)
+        for city, value in nodeBetweenness.items():
+                plotCulled(cities.coord(city), marker='o', color=colors(value/nodeMax))
+
+#Prints the cities that carry the most shortest paths
+if __name__ == "__main__":
+        from SantaGraph import Graph, nodes, cityRoutes
+
+        nodeBetweenness, edgeBetweenness = betweenness(Graph(nodes, cityRoutes))
+        for city, value in sorted(nodeBetweenness.items(), key=lambda item: -item[1])[:10]:
+                print(f"{city:<28}{value:8.1f}")
@@ -0,0 +1,178 @@
+import numpy as np
+
+from SantaGraph import cities, landmasses, EARTH_RADIUS, ARC_STEP
+from SantaMatrix import csrArrays
+
+"""
+Walking cost profiles: alternative route weights for the same graph.
+The share of every route Santa swims at sea is found by sampling its great-circle arc every
+ARC_STEP km and testing each sample against the landmass outlines with a vectorized
+point-in-polygon test. That share of the route's weight in the graph is its sea km. A profile
+turns (graph weight, sea km, coastline crossings) into a weight, so "walking" is exactly the
+graph's own weights. Each profile's weight array is computed once, in the graph's CSR order, and
+cached, and profile(name) returns a view of the graph using those weights, so queries can switch
+profiles without rebuilding the Graph
+"""
+
+#How many times slower swimming a km is than walking one
+SWIM_PENALTY = 3.0
+#Extra cost, in km of walking, of wading into or out of the sea at a coastline
+COAST_PENALTY = 200.0
+
+#Weight of a route under each profile, from arrays of the route's weight in the graph, the km
+#of it at sea and its coastline crossings
+PROFILES = {"walking": lambda distance, sea, coasts: distance,
+            "swimming": lambda distance, sea, coasts: distance + (SWIM_PENALTY - 1)*sea,
+            "terrain": lambda distance, sea, coasts: distance + (SWIM_PENALTY - 1)*sea + COAST_PENALTY*coasts}
+
+#Returns the edges (x1, y1, x2, y2) of the landmass outlines in (longitude, latitude) degrees.
+#Longitudes are unwrapped along each outline, so outlines crossing the antimeridian (Eurasia)
+#continue past 180 degrees instead of jumping across the map
+def outlineEdges(outlines=landmasses):
+        edges = []
+        for outline in outlines:
+                points = np.asarray(outline, dtype=np.float64)
+                lat = np.degrees(np.arcsin(points[:, 2]/np.linalg.norm(points, axis=1)))
+                long = np.degrees(np.unwrap(np.arctan2(points[:, 1], points[:, 0])))
+                #Close the outline back to its first point
+                long = np.append(long, long[0])
+                lat = np.append(lat, lat[0])
+                edges.append(np.column_stack([long[:-1], lat[:-1], long[1:], lat[1:]]))
+        return np.concatenate(edges)
+
+#Returns True for every (latitude, longitude) point on land. A ray is cast from each point
+#along its latitude, and a point is on land when it crosses the outlines an odd number of
+#times, so seas enclosed by land (the Mediterranean) count as sea. Points are tested against
+#every outline edge at once, chunkSize points at a time
+def onLand(lat, long, edges=None, chunkSize=4096):
+        edges = outlineEdges() if edges is None else edges
+        x1, y1, x2, y2 = (edges[:, k] for k in range(4))
+        #Edges that aren't horizontal, so the crossing point is defined
+        slope = np.where(y1 != y2, (x2 - x1)/np.where(y1 != y2, y2 - y1, 1), 0.0)
+        lat = np.asarray(lat, dtype=np.float64).ravel()
+        long = np.asarray(long, dtype=np.float64).ravel()
+        land = np.zeros(len(lat), dtype=bool)
+        for start in range(0, len(lat), chunkSize):
+                y = lat[start:start + chunkSize, None]
+                spans = (y1 > y) != (y2 > y)
+                crossingX = x1 + (y - y1)*slope
+                #Unwrapped outlines may reach past 180 degrees, so also test each point a turn east and west
+                inside = np.zeros(len(y), dtype=bool)
+                for turn in (-360, 0, 360):
+                        x = long[start:start + chunkSize, None] + turn
+                        inside ^= (spans & (x < crossingX)).sum(axis=1) % 2 == 1
+                land[start:start + chunkSize] = inside
+        return land
+
+#Splits routes between (x, y, z) points into km on land and at sea, and counts how often each
+#crosses a coastline. Every route is sampled at least every step km along its great circle
+#and each piece between samples is classified by its midpoint
+def landAndSea(starts, ends, step=ARC_STEP):
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        a = starts/np.linalg.norm(starts, axis=1, keepdims=True)
+        b = ends/np.linalg.norm(ends, axis=1, keepdims=True)
+        omega = np.arccos(np.clip(np.einsum('ij,ij->i', a, b), -1.0, 1.0))
+        pieces = np.maximum(1, np.ceil(omega*EARTH_RADIUS/step)).astype(np.int64)
+        #Midpoint of every piece of every route, slerped along its great circle
+        route = np.repeat(np.arange(len(a)), pieces)
+        t = (np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces) + 0.5)/pieces[route]
+        angle = omega[route]
+        sinAngle = np.sin(angle)
+        short = sinAngle < 1e-9
+        safeSin = np.where(short, 1.0, sinAngle)
+        weightA = np.where(short, 1 - t, np.sin((1 - t)*angle)/safeSin)
+        weightB = np.where(short, t, np.sin(t*angle)/safeSin)
+        middles = weightA[:, None]*a[route] + weightB[:, None]*b[route]
+        lat = np.degrees(np.arcsin(np.clip(middles[:, 2]/np.linalg.norm(middles, axis=1), -1.0, 1.0)))
+        long = np.degrees(np.arctan2(middles[:, 1], middles[:, 0]))
+        land = onLand(lat, long)
+
+        pieceKm = (omega*EARTH_RADIUS/pieces)[route]
+        landKm = np.bincount(route, weights=pieceKm*land, minlength=len(a))
+        seaKm = np.bincount(route, weights=pieceKm*~land, minlength=len(a))
+        #A coastline is crossed wherever consecutive pieces of the same route change between land and sea
+        changes = (land[1:] != land[:-1]) & (route[1:] == route[:-1])
+        coasts = np.bincount(route[1:][changes], minlength=len(a))
+        return landKm, seaKm, coasts
+
+"""
+Cost profiles for a graph. The land/sea split of every route is computed once when it's built,
+and each profile's weights the first time the profile is used. landKm and seaKm split each
+route's weight in the graph in the same proportions as its arc. coords are the (x, y, z) of
+the graph's nodes, by default taken from a Snapshot or from the city registry
+"""
+class CostProfiles(object):
+        def __init__(self, graph, profiles=PROFILES, coords=None):
+                self.graph = graph
+                self.profiles = dict(profiles)
+                self.nodes = list(graph.get_nodes())
+                self.indptr, self.indices, self.distances = (np.asarray(array) for array in csrArrays(graph))
+                if coords is None:
+                        coords = graph.coords if hasattr(graph, "coords") else cities.coordsOf(self.nodes)
+                sources = np.repeat(np.arange(len(self.nodes)), np.diff(self.indptr))
+                coords = np.asarray(coords, dtype=np.float64)
+                arcLand, arcSea, self.coasts = landAndSea(coords[sources], coords[self.indices])
+                arcLength = arcLand + arcSea
+                seaShare = np.divide(arcSea, arcLength, out=np.zeros_like(arcSea), where=arcLength > 0)
+                self.distances = self.distances.astype(np.float64)
+                self.seaKm = self.distances*seaShare
+                self.landKm = self.distances - self.seaKm
+                #Position of every route in the CSR arrays, for looking up a route's weight by its cities
+                self.edgeIndex = {(self.nodes[i], self.nodes[j]): k for k, (i, j) in enumerate(zip(sources.tolist(), self.indices.tolist()))}
+                self.cache = {}
+
+        #Adds (or replaces) a profile, dropping its cached weights
+        def addProfile(self, name, profile):
+                self.profiles[name] = profile
+                self.cache.pop(name, None)
+
+        #Returns the weight of every route under a profile, in the graph's CSR order
+        def weights(self, name):
+                if name not in self.cache:
+                        self.cache[name] = np.ascontiguousarray(self.profiles[name](self.distances, self.seaKm, self.coasts), dtype=np.float64)
+                return self.cache[name]
+
+        #Returns the graph with the weights of a profile, for any of the searches
+        def profile(self, name):
+                return ProfileGraph(self, name)
+
+"""
+A graph with the routes of another graph and the weights of a cost profile. Implements the
+get_nodes/getNeighbors/value interface, and exposes CSR arrays for the array engines
+"""
+class ProfileGraph(object):
+        def __init__(self, costs, name):
+                self.costs = costs
+                self.name = name
+                self.indptr = costs.indptr
+                self.indices = costs.indices
+                self.weights = costs.weights(name)
+
+        def get_nodes(self):
+                return self.costs.nodes
+
+        def getNeighbors(self, node):
+                return self.costs.graph.getNeighbors(node)
+
+        def value(self, cityA, cityB):
+                return float(self.weights[self.costs.edgeIndex[(cityA, cityB)]])
+
+        def connected(self, cityA, cityB):
+                return self.costs.graph.connected(cityA, cityB)
+
+#Prints the share of every route that's at sea, and how the shortest routes change per profile
+if __name__ == "__main__":
+        from SantaGraph import Graph, nodes, cityRoutes
+        from SantaSearch import shortestRoute
+
+        graph = Graph(nodes, cityRoutes)
+        costs = CostProfiles(graph)
+        print("Routes crossing the sea:")
+        for (cityA, cityB), k in costs.edgeIndex.items():
+                if cityA < cityB and costs.seaKm[k] > 0:
+                        print(f"  {cityA} - {cityB}: {costs.seaKm[k]:.0f} of {costs.landKm[k] + costs.seaKm[k]:.0f}km at sea")
+        for source, destination in (("New York, USA", "Moscow, Russia"), ("Manila, Philippines", "Dhaka, Bangladesh")):
+                for name in costs.profiles:
+                        cost, path = shortestRoute(costs.profile(name), source, destination)
+                        print(f"{name:>9}: {cost:7.0f} {' -> '.join(path)}")
@@ -0,0 +1,136 @@
+import numpy as np
+
+import sys, time
+
+from SantaMatrix import csrArrays
+
+"""
+Delta-stepping single-source shortest paths over the graph's CSR arrays.
+Cities are kept in buckets of width delta by tentative distance. The lowest bucket is emptied by
+relaxing the light routes (at most delta km) of all its cities at once, repeating while that
+adds cities back into it, then the heavy routes of every city settled in the bucket are relaxed
+once. Each relaxation is a batch of numpy operations over every route leaving the bucket instead
+of one heap operation per route, so large graphs with many short routes are searched in far
+fewer Python steps. A small delta behaves like Dijkstra's algorithm (more, smaller buckets) and a
+large one like Bellman-Ford (fewer buckets, more re-relaxed routes)
+"""
+class DeltaStepping(object):
+        def __init__(self, graph, delta=None):
+                self.nodes = list(graph.get_nodes())
+                self.index = {node: i for i, node in enumerate(self.nodes)}
+                indptr, indices, weights = (np.asarray(array) for array in csrArrays(graph))
+                #By default a bucket is as wide as the average route
+                self.delta = float(delta) if delta is not None else (float(weights.mean()) if len(weights) else 1.0)
+                sources = np.repeat(np.arange(len(self.nodes)), np.diff(indptr))
+                light = weights <= self.delta
+                self.light = self.split(sources[light], indices[light], weights[light])
+                self.heavy = self.split(sources[~light], indices[~light], weights[~light])
+
+        #Returns CSR arrays (indptr, indices, weights) for a subset of the routes, already
+        #grouped by their starting city
+        def split(self, sources, indices, weights):
+                indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+                np.cumsum(np.bincount(sources, minlength=len(self.nodes)), out=indptr[1:])
+                return indptr, indices.astype(np.int64), weights.astype(np.float64)
+
+        #Relaxes every route in edges leaving the cities in frontier. Returns the cities whose
+        #distance went down
+        def relax(self, edges, frontier, distances, predecessors):
+                indptr, indices, weights = edges
+                starts = indptr[frontier]
+                counts = indptr[frontier + 1] - starts
+                total = counts.sum()
+                if total == 0:
+                        return frontier[:0]
+                #Position of every route leaving the frontier in indices/weights
+                offsets = np.cumsum(counts) - counts
+                routes = np.repeat(starts - offsets, counts) + np.arange(total)
+                origins = np.repeat(frontier, counts)
+                targets = indices[routes]
+                candidates = distances[origins] + weights[routes]
+                #Keep the best candidate for each target, then only those that improve on it
+                order = np.lexsort((candidates, targets))
+                targets, candidates, origins = targets[order], candidates[order], origins[order]
+                first = np.concatenate([[True], targets[1:] != targets[:-1]])
+                targets, candidates, origins = targets[first], candidates[first], origins[first]
+                better = candidates < distances[targets]
+                targets = targets[better]
+                distances[targets] = candidates[better]
+                predecessors[targets] = origins[better]
+                return targets
+
+        #Returns the distance from source to every city (inf if unreachable) and each city's
+        #previous city on its shortest path (-1 for the source and unreachable cities) as arrays
+        def distances(self, source):
+                count = len(self.nodes)
+                distances = np.full(count, np.inf)
+                predecessors = np.full(count, -1, dtype=np.int64)
+                settled = np.zeros(count, dtype=bool)
+                distances[self.index[source]] = 0.0
+                #Cities with a tentative distance that aren't settled yet
+                waiting = np.array([self.index[source]], dtype=np.int64)
+                while len(waiting):
+                        buckets = np.floor(distances[waiting]/self.delta)
+                        bucket = buckets.min()
+                        current = waiting[buckets == bucket]
+                        waiting = waiting[buckets != bucket]
+                        emptied = []
+                        #Light routes can put cities back into the current bucket, so repeat until it stays empty
+                        while len(current):
+                                emptied.append(current)
+                                improved = self.relax(self.light, current, distances, predecessors)
+                                inBucket = np.floor(distances[improved]/self.delta) == bucket
+                                current = improved[inBucket]
+                                waiting = np.concatenate([waiting, improved[~inBucket]])
+                        emptied = np.unique(np.concatenate(emptied))
+                        settled[emptied] = True
+                        #Heavy routes are longer than delta, so they always land in a later bucket
+                        waiting = np.concatenate([waiting, self.relax(self.heavy, emptied, distances, predecessors)])
+                        waiting = np.unique(waiting)
+                        waiting = waiting[~settled[waiting]]
+                return distances, predecessors
+
+        #Returns prevNodeInPath and shortestDistance in the same form as dijkstra_algorithm
+        #(unreachable cities have a shortestDistance of sys.maxsize)
+        def search(self, source):
+                distances, predecessors = self.distances(source)
+                shortestDistance = {node: (float(distance) if distance != np.inf else sys.maxsize)
+                                    for node, distance in zip(self.nodes, distances.tolist())}
+                prevNodeInPath = {self.nodes[i]: self.nodes[j] for i, j in enumerate(predecessors.tolist()) if j >= 0}
+                return prevNodeInPath, shortestDistance
+
+#Times a full single-source search with the heap engines (boundedSearch over the graph interface,
+#and the CSR heap search of SantaMatrix) and with delta-stepping at several deltas, on the demo
+#graph and on synthetic graphs: python SantaDelta.py [cities ...]
+if __name__ == "__main__":
+        from SantaGraph import Graph, nodes, cityRoutes
+        from SantaMatrix import distanceMatrix
+        from SantaSearch import boundedSearch
+        from SantaSnapshot import loadSnapshot
+        from SantaSynthetic import SyntheticGraph
+
+        #Times fn, repeating it until at least a tenth of a second has passed
+        def timed(fn):
+                runs = 0
+                start = time.perf_counter()
+                while runs == 0 or time.perf_counter() - start < 0.1:
+                        result = fn()
+                        runs += 1
+                return result, (time.perf_counter() - start)/runs
+
+        graphs = [("Demo", Graph(nodes, cityRoutes))]
+        for count in [int(arg) for arg in sys.argv[1:]] or [10000, 100000]:
+                SyntheticGraph(count, seed=0).writeSnapshot(f"SantaDelta{count}.snap")
+                graphs.append((f"Synthetic {count}", loadSnapshot(f"SantaDelta{count}.snap")))
+        for label, graph in graphs:
+                allNodes = list(graph.get_nodes())
+                source = allNodes[0]
+                expected, heap = timed(lambda: boundedSearch(graph, source)[1])
+                _, csrHeap = timed(lambda: distanceMatrix(graph, [source], allNodes, workers=1))
+                print(f"{label} ({len(allNodes)} cities): heap {1000*heap:.2f}ms, CSR heap {1000*csrHeap:.2f}ms")
+                meanRoute = float(np.mean(csrArrays(graph)[2]))
+                for scale in (0.5, 1, 2, 4):
+                        engine = DeltaStepping(graph, delta=meanRoute*scale)
+                        (distances, _), seconds = timed(lambda: engine.distances(source))
+                        exact = all(distances[engine.index[node]] == distance for node, distance in expected.items())
+                        print(f"  delta {engine.delta:7.1f}km: {1000*seconds:8.2f}ms ({csrHeap/seconds:.1f}x the CSR heap), exact: {exact}")
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import threading, time
+
+from SantaSearch import shortestRoute
+from SantaCache import graphHash
+
+"""
+Immutable copy of a graph that is safe to share between threads.
+Every city's neighbors and distances are copied into read-only mappings when it is built,
+so nothing can modify it afterwards. Implements the same get_nodes/getNeighbors/value
+interface as Graph, with neighbors precomputed instead of scanned for on every call
+"""
+class FrozenGraph(object):
+        def __init__(self, graph, version=0):
+                self.nodes = tuple(graph.get_nodes())
+                self.version = version
+                self.neighbors = MappingProxyType({node: tuple(graph.getNeighbors(node)) for node in self.nodes})
+                self.edges = MappingProxyType({node: MappingProxyType({neighbor: graph.value(node, neighbor) for neighbor in self.neighbors[node]})
+                                               for node in self.nodes})
+                #Label every city with the first city of its connected component
+                components = {}
+                for start in self.nodes:
+                        if start in components:
+                                continue
+                        components[start] = start
+                        stack = [start]
+                        while stack:
+                                for neighbor in self.neighbors[stack.pop()]:
+                                        if neighbor not in components:
+                                                components[neighbor] = start
+                                                stack.append(neighbor)
+                self.components = MappingProxyType(components)
+                #Identifies the graph's contents, e.g. for keys in a RouteCache
+                self.contentHash = graphHash(self)
+
+        #Returns the list of every city in the graph
+        def get_nodes(self):
+                return self.nodes
+
+        #Returns the neighbors of the provided node
+        def getNeighbors(self, node):
+                return self.neighbors[node]
+
+        #Returns the distance stored in the graph between two city nodes
+        def value(self, cityA, cityB):
+                return self.edges[cityA][cityB]
+
+        #Returns True if there is a route between two cities
+        def connected(self, cityA, cityB):
+                return self.components[cityA] == self.components[cityB]
+
+        #Returns a new FrozenGraph with a route added (or its distance changed) in both directions
+        def withRoute(self, cityA, cityB, distance):
+                from SantaGraph import Graph
+
+                cityRoutes = {node: dict(edges) for node, edges in self.edges.items()}
+                cityRoutes.setdefault(cityA, {})[cityB] = distance
+                cityRoutes.setdefault(cityB, {})[cityA] = distance
+                nodes = list(self.nodes) + [city for city in (cityA, cityB) if city not in self.edges]
+                return FrozenGraph(Graph(nodes, cityRoutes), self.version + 1)
+
+"""
+Answers route queries concurrently from a thread pool over an immutable graph, optionally
+through a RouteCache. Readers never take a lock on the graph: each query reads the current graph reference once and runs
+entirely against that snapshot. Writers build a new FrozenGraph and publish it by swapping
+the reference, so queries already running finish on the graph they started with
+"""
+class QueryEngine(object):
+        def __init__(self, graph, workers=4, cache=None):
+                self.graph = graph if isinstance(graph, FrozenGraph) else FrozenGraph(graph)
+                self.workers = workers
+                #Optional RouteCache shared with other runs
+                self.cache = cache
+                #Only serializes writers with each other, readers never touch it
+                self.writeLock = threading.Lock()
+
+        #Returns (distance, path) for the shortest route, or None if there's no route
+        def route(self, source, destination):
+                graph = self.graph
+                if self.cache is not None:
+                        return self.cache.route(graph, source, destination, contentHash=graph.contentHash)
+                return shortestRoute(graph, source, destination)
+
+        #Answers many (source, destination) queries concurrently, in the order given
+        def routeMany(self, pairs, workers=None):
+                with ThreadPoolExecutor(max_workers=workers or self.workers) as pool:
+                        return list(pool.map(lambda pair: self.route(*pair), pairs))
+
+        #Atomically replaces the graph queries run against
+        def publish(self, graph):
+                with self.writeLock:
+                        self.graph = graph if isinstance(graph, FrozenGraph) else FrozenGraph(graph, self.graph.version + 1)
+
+        #Adds a route (or changes its distance) and publishes the new graph
+        def addRoute(self, cityA, cityB, distance):
+                with self.writeLock:
+                        self.graph = self.graph.withRoute(cityA, cityB, distance)
+
+#Measures query throughput (queries per second) for each number of threads
+def measureThroughput(engine, pairs, threadCounts=(1, 2, 4, 8)):
+        throughput = {}
+        for threads in threadCounts:
+                start = time.perf_counter()
+                engine.routeMany(pairs, workers=threads)
+                throughput[threads] = len(pairs)/(time.perf_counter() - start)
+        return throughput
+
+#Prints how query throughput scales with threads over every pair of the demo cities
+if __name__ == "__main__":
+        from SantaGraph import Graph, nodes, cityRoutes
+
+        engine = QueryEngine(Graph(nodes, cityRoutes))
+        pairs = [(source, destination) for source in nodes for destination in nodes if source != destination]
+        baseline = None
+        for threads, rate in measureThroughput(engine, pairs).items():
+                baseline = baseline or rate
+                print(f"{threads} threads: {rate:10.0f} queries/s ({rate/baseline:.2f}x)")
@@ -0,0 +1,314 @@
+from collections import OrderedDict
+
+import numpy as np
+
+import os, queue, threading
+
+import SantaGraph
+from SantaGraph import (fig, ax, Graph, nodes, cityRoutes, plotCities, plotLandmass, plotRoutes,
+                        plotPath, makeAnimation, animate, updateScene)
+from SantaSearch import shortestRoute
+
+"""
+Renders route animations to image frames for export, reusing rasterized base layers.
+The landmasses, cities and routes look the same for every route at a given camera angle, so
+they are rendered once per quantized (elevation, azimuth) and cached as RGBA buffers. Each frame
+then only rasterizes the red path, Santa's marker and the title on a transparent background and
+composites them over the cached base layer, so exporting many routes is bound by the overlay
+rather than by redrawing the whole globe
+"""
+
+#Size of the camera angle grid in degrees. Exported frames snap the camera to it so the
+#overlay lines up exactly with the cached base layer
+ANGLE_QUANTUM = 1.0
+
+#Most memory the cached base layers may take (each is an RGBA copy of the canvas, about 1.2MB
+#at the default figure size)
+MAX_LAYER_BYTES = 256 << 20
+
+class BaseLayerCache(object):
+        def __init__(self, quantum=ANGLE_QUANTUM, maxBytes=MAX_LAYER_BYTES):
+                self.quantum = quantum
+                self.maxBytes = maxBytes
+                self.layers = OrderedDict()
+                self.size = 0
+                self.hits = 0
+                self.misses = 0
+
+        #Returns the quantized (elevation, azimuth) for a camera angle, with azimuth in [-180, 180)
+        def quantize(self, lat, long):
+                elevation = round(lat/self.quantum)*self.quantum
+                azimuth = (round(long/self.quantum)*self.quantum + 180) % 360 - 180
+                return elevation, azimuth
+
+        #Returns the RGBA base layer for a quantized angle, rendering it with render() on a miss.
+        #Least recently used layers are dropped once the layers take more than maxBytes
+        def get(self, angle, render):
+                if angle in self.layers:
+                        self.hits += 1
+                        self.layers.move_to_end(angle)
+                        return self.layers[angle]
+                self.misses += 1
+                layer = render()
+                self.layers[angle] = layer
+                self.size += layer.nbytes
+                #The newest layer is kept even if it alone is larger than maxBytes
+                while self.size > self.maxBytes and len(self.layers) > 1:
+                        self.size -= self.layers.popitem(last=False)[1].nbytes
+                return layer
+
+        def clear(self):
+                self.layers.clear()
+                self.size = 0
+
+#Returns the artists that change from route to route: the path, Santa's marker and the title
+def overlayArtists():
+        return [artist for artist in (SantaGraph.pathLine, SantaGraph.pathCityLine, SantaGraph.santaMarker, ax.title) if artist is not None]
+
+#Draws the figure and returns a copy of the Agg canvas as an (h, w, 4) uint8 array
+def rasterize():
+        fig.canvas.draw()
+        return np.array(fig.canvas.buffer_rgba())
+
+#Renders the base layer (everything but the overlay) at the current camera angle. The title
+#is made transparent rather than hidden, so drawing the axes still places it where
+#renderOverlay, which draws the title without redoing the layout, expects it
+def renderBase():
+        overlay = [artist for artist in overlayArtists() if artist is not ax.title]
+        titleAlpha = ax.title.get_alpha()
+        for artist in overlay:
+                artist.set_visible(False)
+        ax.title.set_alpha(0.0)
+        try:
+                return rasterize()
+        finally:
+                for artist in overlay:
+                        artist.set_visible(True)
+                ax.title.set_alpha(titleAlpha)
+
+#Renders only the overlay, on a transparent background. Just the overlay artists are drawn,
+#into the cleared canvas renderer, after setting up the camera projection the way drawing the
+#whole axes would
+def renderOverlay():
+        renderer = fig.canvas.get_renderer()
+        renderer.clear()
+        ax.M = ax.get_proj()
+        ax.invM = np.linalg.inv(ax.M)
+        for artist in sorted(overlayArtists(), key=lambda artist: artist.get_zorder()):
+                artist.draw(renderer)
+        return np.array(renderer.buffer_rgba())
+
+#Alpha-composites an RGBA overlay over an RGBA base layer
+def composite(base, overlay):
+        alpha = overlay[..., 3:4].astype(np.float32)/255
+        frame = base.astype(np.float32)*(1 - alpha) + overlay.astype(np.float32)*alpha
+        frame[..., 3] = 255
+        return frame.astype(np.uint8)
+
+#Yields the animation frames of a path as (h, w, 4) RGBA arrays. The base map must already be
+#plotted (plotCities/plotLandmass/plotRoutes); the path is plotted here and removed afterwards
+def renderFrames(path, cache):
+        pathArtists = plotPath(path)
+        SantaGraph.path = path
+        makeAnimation(path)
+        try:
+                for i in range(len(SantaGraph.cameraFrames)):
+                        #animate moves Santa and the camera, then the camera is snapped to the grid
+                        animate(i)
+                        elevation, azimuth = cache.quantize(ax.elev, ax.azim)
+                        ax.view_init(elev=elevation, azim=azimuth)
+                        updateScene(elevation, azimuth)
+                        base = cache.get((elevation, azimuth), renderBase)
+                        yield composite(base, renderOverlay())
+        finally:
+                for artist in pathArtists:
+                        artist.remove()
+
+#Saves the frames of a path as an animated GIF
+def saveGif(frames, filename, interval=40):
+        from PIL import Image
+
+        images = [Image.fromarray(frame[..., :3]) for frame in frames]
+        images[0].save(filename, save_all=True, append_images=images[1:], duration=interval, loop=0)
+
+"""
+Streams animation frames to a writer without copying them.
+A few Agg renderers are kept in a pool and swapped into the canvas in turn, so each frame is
+drawn into its own buffer. The buffer goes through a bounded queue, as the memoryview
+returned by buffer_rgba(), to a writer thread. The writer encodes it and hands the renderer
+back to the pool. Rendering the next frames overlaps encoding the previous ones, and drawing
+blocks once depth frames are waiting, so memory stays bounded
+"""
+class FrameCapture(object):
+        def __init__(self, writer, figure=fig, depth=3):
+                from matplotlib.backends.backend_agg import RendererAgg
+
+                self.writer = writer
+                self.canvas = figure.canvas
+                if not hasattr(self.canvas, "buffer_rgba"):
+                        raise TypeError("FrameCapture needs an Agg based canvas")
+                #Drawing once sets up the canvas' renderer for the current size, which the pool matches
+                self.canvas.draw()
+                self.original = self.canvas.renderer
+                self.width, self.height = self.canvas.get_width_height(physical=True)
+                self.free = queue.Queue()
+                for _ in range(depth):
+                        self.free.put(RendererAgg(self.width, self.height, figure.dpi))
+                self.frames = queue.Queue(maxsize=depth)
+                self.error = None
+                self.count = 0
+                self.thread = threading.Thread(target=self.encode, daemon=True)
+                self.thread.start()
+
+        #Draws the figure as it is now into a free renderer and queues it for the writer
+        def capture(self):
+                renderer = self.free.get()
+                if self.error is not None:
+                        raise self.error
+                self.canvas.renderer = renderer
+                self.canvas.draw()
+                self.frames.put(renderer)
+                self.count += 1
+
+        #Writer thread: encodes each frame straight from its renderer's buffer, then frees the renderer
+        def encode(self):
+                while True:
+                        renderer = self.frames.get()
+                        if renderer is None:
+                                break
+                        try:
+                                if self.error is None:
+                                        self.writer.write(renderer.buffer_rgba())
+                        except Exception as error:
+                                self.error = error
+                        self.free.put(renderer)
+
+        #Waits for the writer to finish every queued frame, then closes it. The writer is closed
+        #even when a frame failed, so the partly written file isn't left open, and the error is raised
+        def close(self):
+                self.frames.put(None)
+                self.thread.join()
+                self.canvas.renderer = self.original
+                try:
+                        if self.error is not None:
+                                raise self.error
+                finally:
+                        self.writer.close()
+
+#Writes frames as raw RGBA (the canvas buffer as it is) or RGB bytes, one frame after another
+class RawWriter(object):
+        def __init__(self, filename, width, height, channels=4):
+                self.file = open(filename, "wb")
+                self.width = width
+                self.height = height
+                self.channels = channels
+
+        def write(self, buffer):
+                if self.channels == 4:
+                        self.file.write(buffer)
+                else:
+                        self.file.write(np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 4)[:, :3].tobytes())
+
+        def close(self):
+                self.file.close()
+
+#Writes frames as an uncompressed YUV4MPEG2 (.y4m) video with full resolution color (4:4:4),
+#which video tools such as ffmpeg read directly
+class Y4MWriter(object):
+        def __init__(self, filename, width, height, fps=25):
+                self.file = open(filename, "wb")
+                self.file.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C444\n".encode("ascii"))
+
+        def write(self, buffer):
+                rgb = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 4)[:, :3].astype(np.float32)
+                #BT.601 studio range
+                yuv = rgb @ np.array([[0.257, -0.148, 0.439], [0.504, -0.291, -0.368], [0.098, 0.439, -0.071]], dtype=np.float32)
+                yuv += np.array([16, 128, 128], dtype=np.float32)
+                self.file.write(b"FRAME\n")
+                self.file.write(np.clip(yuv + 0.5, 0, 255).astype(np.uint8).T.tobytes())
+
+        def close(self):
+                self.file.close()
+
+#Writes frames as an animated GIF. Each frame is quantized to a palette as it arrives, and
+#the file is saved from the palette images when the writer is closed: Pillow can't append
+#frames to a GIF it has written, so every frame stays in memory until then (about 300KB per
+#640x480 frame, a quarter of the RGBA frame). Use .y4m or .rgb to stream long animations
+class GifWriter(object):
+        def __init__(self, filename, width, height, interval=40):
+                self.filename = filename
+                self.size = (width, height)
+                self.interval = interval
+                self.images = []
+
+        def write(self, buffer):
+                from PIL import Image
+
+                image = Image.frombuffer("RGBA", self.size, buffer, "raw", "RGBA", 0, 1)
+                self.images.append(image.convert("RGB").quantize())
+
+        def close(self):
+                if self.images:
+                        self.images[0].save(self.filename, save_all=True, append_images=self.images[1:],
+                                            duration=self.interval, loop=0)
+
+#Writer class for each supported file extension
+FRAME_WRITERS = {".gif": GifWriter, ".y4m": Y4MWriter, ".rgba": RawWriter,
+                 ".rgb": lambda filename, width, height: RawWriter(filename, width, height, channels=3)}
+
+#Animates the shortest path between two cities and streams every frame to filename through a
+#FrameCapture, picking the writer from the extension. The base map must already be plotted.
+#Returns the number of frames written
+def captureRoute(source, destination, filename, depth=3):
+        route = shortestRoute(Graph(nodes, cityRoutes), source, destination)
+        if route is None:
+                return 0
+        pathArtists = plotPath(route[1])
+        SantaGraph.path = route[1]
+        makeAnimation(route[1])
+        width, height = fig.canvas.get_width_height(physical=True)
+        capture = FrameCapture(FRAME_WRITERS[os.path.splitext(filename)[1].lower()](filename, width, height), depth=depth)
+        try:
+                try:
+                        for i in range(len(SantaGraph.cameraFrames)):
+                                animate(i)
+                                capture.capture()
+                finally:
+                        capture.close()
+        finally:
+                #The path is removed even if the writer failed to close
+                for artist in pathArtists:
+                        artist.remove()
+        return capture.count
+
+#Exports an animated GIF for every (origin, destination) pair into directory, sharing one
+#base layer cache across all routes. Returns the cache so its hit rate can be checked
+def exportRoutes(pairs, directory, cache=None):
+        cache = cache or BaseLayerCache()
+        graph = Graph(nodes, cityRoutes)
+        os.makedirs(directory, exist_ok=True)
+        for source, destination in pairs:
+                route = shortestRoute(graph, source, destination)
+                if route is None:
+                        continue
+                filename = os.path.join(directory, f"{source.split(',')[0]} to {destination.split(',')[0]}.gif")
+                saveGif(renderFrames(route[1], cache), filename)
+        return cache
+
+#Plots the base map, then exports routes: python SantaExport.py directory origin destination [origin destination ...]
+#or streams one route to a video file: python SantaExport.py route.gif|route.y4m|route.rgb|route.rgba origin destination
+if __name__ == "__main__":
+        import sys, time
+
+        plotCities()
+        plotLandmass()
+        plotRoutes()
+        cities = SantaGraph.cities
+        indices = [int(arg) for arg in sys.argv[2:]]
+        if os.path.splitext(sys.argv[1])[1].lower() in FRAME_WRITERS:
+                start = time.perf_counter()
+                count = captureRoute(cities.name(indices[0]), cities.name(indices[1]), sys.argv[1])
+                print(f"Wrote {count} frames to {sys.argv[1]} ({count/(time.perf_counter() - start):.1f} frames/s)")
+        else:
+                cache = exportRoutes([(cities.name(a), cities.name(b)) for a, b in zip(indices[::2], indices[1::2])], sys.argv[1])
+                print(f"Base layer cache: {cache.hits} hits, {cache.misses} misses")
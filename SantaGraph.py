@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 from matplotlib import animation
 
+import numpy as np
+
 import sys, math
 
 #Initialize matplotlib plot
@@ -11,6 +13,43 @@ ax.set_box_aspect([6378.1, 6378.1, 6378.1])
 ax.grid(True)
 ax.set_axis_off() 
 
+"""
+Union-find (disjoint set) of the connected components of a graph
+Each city points toward a representative city of its component, so two cities
+are connected exactly when they lead to the same representative
+"""
+class Components(object):
+        def __init__(self, nodes):
+                self.parent = {node: node for node in nodes}
+                self.size = {node: 1 for node in nodes}
+
+        #Returns the representative city of node's component, halving the path as it goes
+        def find(self, node):
+                parent = self.parent
+                while parent[node] != node:
+                        parent[node] = parent[parent[node]]
+                        node = parent[node]
+                return node
+
+        #Merges the components of two cities, attaching the smaller under the larger
+        def union(self, cityA, cityB):
+                rootA = self.find(cityA)
+                rootB = self.find(cityB)
+                if rootA == rootB:
+                        return
+                if self.size[rootA] < self.size[rootB]:
+                        rootA, rootB = rootB, rootA
+                self.parent[rootB] = rootA
+                self.size[rootA] += self.size[rootB]
+
+        def add(self, node):
+                if node not in self.parent:
+                        self.parent[node] = node
+                        self.size[node] = 1
+
+        def connected(self, cityA, cityB):
+                return self.find(cityA) == self.find(cityB)
+
 """
 Creates a graph represented as a dictionary
 The keys of the graph are each of the cities, and the items
@@ -19,8 +58,13 @@ to keep track of neighboring nodes and their edges
 """
 class Graph(object):
         def __init__(self, nodes, cityRoutes):
-                self.nodes = nodes
-                self.graph = self.buildGraph(nodes, cityRoutes)
+                self.nodes = list(nodes)
+                self.graph = self.buildGraph(self.nodes, cityRoutes)
+                #Connected components, so unreachable destinations are rejected without a search
+                self.components = Components(self.nodes)
+                for node, edges in self.graph.items():
+                        for neighbor in edges:
+                                self.components.union(node, neighbor)
                 
         def buildGraph(self, nodes, cityRoutes):
                 #Declares the graph as an empty dictionary
@@ -30,7 +74,10 @@ class Graph(object):
                 for node in nodes:
                         graph[node] = {}
                         
-                graph.update(cityRoutes)
+                #Copy each city's routes so that making the graph undirected below
+                #doesn't modify the caller's cityRoutes
+                for node, edges in cityRoutes.items():
+                        graph.setdefault(node, {}).update(edges)
                 
                 #Ensures that the graph is undirected, meaning edges travel from A to B and B to A
                 for node, edges in graph.items():
@@ -62,8 +109,90 @@ class Graph(object):
         def value(self, cityA, cityB):
                 return self.graph[cityA][cityB]
 
+        #Adds a route between two cities (adding either city if it's new) in both directions,
+        #keeping the connected components up to date
+        def addRoute(self, cityA, cityB, distance):
+                for city in (cityA, cityB):
+                        if city not in self.graph:
+                                self.nodes.append(city)
+                                self.graph[city] = {}
+                                self.components.add(city)
+                self.graph[cityA][cityB] = distance
+                self.graph[cityB][cityA] = distance
+                self.components.union(cityA, cityB)
+
+        #Returns True if there is a route between two cities, in near constant time
+        def connected(self, cityA, cityB):
+                return self.components.connected(cityA, cityB)
+
+        #Returns the graph in compressed sparse row (CSR) form as three arrays:
+        #indptr[i]:indptr[i+1] slices indices/weights to the neighbors of nodes[i].
+        #Neighbors are kept in node order, the same order getNeighbors returns them
+        def toCSR(self):
+                index = {node: i for i, node in enumerate(self.nodes)}
+                indptr = [0]
+                indices = []
+                weights = []
+                for node in self.nodes:
+                        edges = sorted((index[neighbor], distance) for neighbor, distance in self.graph[node].items())
+                        for neighbor, distance in edges:
+                                indices.append(neighbor)
+                                weights.append(distance)
+                        indptr.append(len(indices))
+                return (np.array(indptr, dtype=np.int64),
+                        np.array(indices, dtype=np.int32),
+                        np.array(weights, dtype=np.float64))
+
+"""
+Registry of every city by integer id, in the same order as longLat and cityCoords.
+Names map to ids (and back) in constant time, and the (x, y, z) and latitude/longitude
+coordinates are held in contiguous arrays, so looking up the coordinates of a whole path
+is a single array index instead of a list scan per city
+"""
+class CityRegistry(object):
+        def __init__(self, names, coords, latLong):
+                self.names = list(names)
+                self.ids = {name: i for i, name in enumerate(self.names)}
+                self.coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 3)
+                self.latLong = np.ascontiguousarray(list(latLong), dtype=np.float64).reshape(-1, 2)
+
+        def __len__(self):
+                return len(self.names)
+
+        def __contains__(self, name):
+                return name in self.ids
+
+        #Returns the id of a city
+        def id(self, name):
+                return self.ids[name]
+
+        #Returns the name of the city with the given id
+        def name(self, i):
+                return self.names[i]
+
+        #Returns the ids of a list of cities as an array
+        def idsOf(self, names):
+                return np.fromiter((self.ids[name] for name in names), dtype=np.int64, count=len(names))
+
+        #Returns the (x, y, z) coordinates of a city
+        def coord(self, name):
+                return self.coords[self.ids[name]]
+
+        #Returns the (x, y, z) coordinates of a list of cities as an (n, 3) array
+        def coordsOf(self, names):
+                return self.coords[self.idsOf(names)]
+
+        #Returns the [latitude, longitude] of a list of cities as an (n, 2) array
+        def latLongOf(self, names):
+                return self.latLong[self.idsOf(names)]
+
 
 def printPath(prevNodeInPath, shortestDistance, source, destination):
+        #The destination was never reached, so there is no path to walk back along
+        if shortestDistance.get(destination, sys.maxsize) == sys.maxsize:
+                print(f"\nBah humbug! There is no route from {source} to {destination}.\n")
+                return None
+
         path = []
         node = destination
         
@@ -602,6 +731,14 @@ australia =[[-4963.61, 3821.52, -1199.46],
             [-5003.82, 3634.68, -1559.17],
             [-4963.61, 3821.52, -1199.46]]
 
+#Outlines of every landmass, each drawn as a connected line
+#(the last point of northSouth has never been part of the outline)
+landmasses = [northSouth[:71], eurasiaAfrica, mediterranean, uk, japan,
+              philippines, indonesia, indonesia2, indonesia3, australia]
+
+#Every city by id, with its coordinates, used by the plotting and animation code to find cities
+cities = CityRegistry(longLat.keys(), cityCoords, longLat.values())
+
 #List of all cities
 nodes = ["Tokyo, Japan", "Delhi, India", "Shanghai, China", "São Paulo, Brazil", "Mexico City, Mexico", 
          "Cairo, Egypt", "Mumbai, India", "Beijing, China", "Dhaka, Bangladesh", "Osaka, Japan",
@@ -700,558 +837,353 @@ cityRoutes["Jakarta, Indonesia"]["Bangkok, Thailand"] = distance(cityCoords[29],
 
 cityRoutes["Chennai, India"]["Hyderabad, India"] = distance(cityCoords[30], cityCoords[35])
 
+#Routes that cross open water, which are riskier for Santa to walk
+oceanCrossings = {frozenset(["New York, USA", "London, United Kingdom"]),
+                  frozenset(["Paris, France", "London, United Kingdom"]),
+                  frozenset(["Cairo, Egypt", "Istanbul, Turkey"]),
+                  frozenset(["Tokyo, Japan", "Seoul, South Korea"]),
+                  frozenset(["Shanghai, China", "Seoul, South Korea"]),
+                  frozenset(["Manila, Philippines", "Jakarta, Indonesia"]),
+                  frozenset(["Manila, Philippines", "Bangkok, Thailand"]),
+                  frozenset(["Manila, Philippines", "Shenzhen, China"]),
+                  frozenset(["Jakarta, Indonesia", "Bangkok, Thailand"])}
+
+#Returns the risk of walking a route: its length in km if it crosses open water, otherwise 0
+def routeRisk(cityA, cityB):
+        if frozenset([cityA, cityB]) not in oceanCrossings:
+                return 0
+        return distance(cities.coord(cityA), cities.coord(cityB))
+
 #Plots all 40 cities in orange, cities along the path will later be recolored red
+#All cities are drawn as a single line of markers so hidden ones can be culled each frame
 def plotCities():
+        global cityPoints, cityLine
         #Plot top 40 populated cities
-        ax.scatter(cityCoords[0][0], cityCoords[0][1], cityCoords[0][2], color='orange')
-        ax.scatter(cityCoords[1][0], cityCoords[1][1], cityCoords[1][2], color='orange')
-        ax.scatter(cityCoords[2][0], cityCoords[2][1], cityCoords[2][2], color='orange')
-        ax.scatter(cityCoords[3][0], cityCoords[3][1], cityCoords[3][2], color='orange')
-        ax.scatter(cityCoords[4][0], cityCoords[4][1], cityCoords[4][2], color='orange')
-        ax.scatter(cityCoords[5][0], cityCoords[5][1], cityCoords[5][2], color='orange')
-        ax.scatter(cityCoords[6][0], cityCoords[6][1], cityCoords[6][2], color='orange')
-        ax.scatter(cityCoords[7][0], cityCoords[7][1], cityCoords[7][2], color='orange')
-        ax.scatter(cityCoords[8][0], cityCoords[8][1], cityCoords[8][2], color='orange')
-        ax.scatter(cityCoords[9][0], cityCoords[9][1], cityCoords[9][2], color='orange')
-        ax.scatter(cityCoords[10][0], cityCoords[10][1], cityCoords[10][2], color='orange')
-        ax.scatter(cityCoords[11][0], cityCoords[11][1], cityCoords[11][2], color='orange')
-        ax.scatter(cityCoords[12][0], cityCoords[12][1], cityCoords[12][2], color='orange')
-        ax.scatter(cityCoords[13][0], cityCoords[13][1], cityCoords[13][2], color='orange')
-        ax.scatter(cityCoords[14][0], cityCoords[14][1], cityCoords[14][2], color='orange')
-        ax.scatter(cityCoords[15][0], cityCoords[15][1], cityCoords[15][2], color='orange')
-        ax.scatter(cityCoords[16][0], cityCoords[16][1], cityCoords[16][2], color='orange')
-        ax.scatter(cityCoords[17][0], cityCoords[17][1], cityCoords[17][2], color='orange')
-        ax.scatter(cityCoords[18][0], cityCoords[18][1], cityCoords[18][2], color='orange')
-        ax.scatter(cityCoords[19][0], cityCoords[19][1], cityCoords[19][2], color='orange')
-        ax.scatter(cityCoords[20][0], cityCoords[20][1], cityCoords[20][2], color='orange')
-        ax.scatter(cityCoords[21][0], cityCoords[21][1], cityCoords[21][2], color='orange')
-        ax.scatter(cityCoords[22][0], cityCoords[22][1], cityCoords[22][2], color='orange')
-        ax.scatter(cityCoords[23][0], cityCoords[23][1], cityCoords[23][2], color='orange')
-        ax.scatter(cityCoords[24][0], cityCoords[24][1], cityCoords[24][2], color='orange')
-        ax.scatter(cityCoords[25][0], cityCoords[25][1], cityCoords[25][2], color='orange')
-        ax.scatter(cityCoords[26][0], cityCoords[26][1], cityCoords[26][2], color='orange')
-        ax.scatter(cityCoords[27][0], cityCoords[27][1], cityCoords[27][2], color='orange')
-        ax.scatter(cityCoords[28][0], cityCoords[28][1], cityCoords[28][2], color='orange')
-        ax.scatter(cityCoords[29][0], cityCoords[29][1], cityCoords[29][2], color='orange')
-        ax.scatter(cityCoords[30][0], cityCoords[30][1], cityCoords[30][2], color='orange')
-        ax.scatter(cityCoords[31][0], cityCoords[31][1], cityCoords[31][2], color='orange')
-        ax.scatter(cityCoords[32][0], cityCoords[32][1], cityCoords[32][2], color='orange')
-        ax.scatter(cityCoords[33][0], cityCoords[33][1], cityCoords[33][2], color='orange')
-        ax.scatter(cityCoords[34][0], cityCoords[34][1], cityCoords[34][2], color='orange')
-        ax.scatter(cityCoords[35][0], cityCoords[35][1], cityCoords[35][2], color='orange')
-        ax.scatter(cityCoords[36][0], cityCoords[36][1], cityCoords[36][2], color='orange')
-        ax.scatter(cityCoords[37][0], cityCoords[37][1], cityCoords[37][2], color='orange')
-        ax.scatter(cityCoords[38][0], cityCoords[38][1], cityCoords[38][2], color='orange')
-        ax.scatter(cityCoords[39][0], cityCoords[39][1], cityCoords[39][2], color='orange')
+        cityPoints = cities.coords
+        cityLine, = ax.plot(*cityPoints.T, marker='o', linestyle='none', color='orange')
 
         #North Pole
         ax.scatter(0, 0, 6378, color='deepskyblue')
 
-#Plots the landmass outlines
+#Plots the landmass outlines as a single line, with a row of NaNs between landmasses
 def plotLandmass():
-        #plot North and South America
-        ax.plot([northSouth[0][0], northSouth[1][0]], [northSouth[0][1], northSouth[1][1]], [northSouth[0][2], northSouth[1][2]], color='green')
-        ax.plot([northSouth[1][0], northSouth[2][0]], [northSouth[1][1], northSouth[2][1]], [northSouth[1][2], northSouth[2][2]], color='green')
-        ax.plot([northSouth[2][0], northSouth[3][0]], [northSouth[2][1], northSouth[3][1]], [northSouth[2][2], northSouth[3][2]], color='green')
-        ax.plot([northSouth[3][0], northSouth[4][0]], [northSouth[3][1], northSouth[4][1]], [northSouth[3][2], northSouth[4][2]], color='green')
-        ax.plot([northSouth[4][0], northSouth[5][0]], [northSouth[4][1], northSouth[5][1]], [northSouth[4][2], northSouth[5][2]], color='green')
-        ax.plot([northSouth[5][0], northSouth[6][0]], [northSouth[5][1], northSouth[6][1]], [northSouth[5][2], northSouth[6][2]], color='green')
-        ax.plot([northSouth[6][0], northSouth[7][0]], [northSouth[6][1], northSouth[7][1]], [northSouth[6][2], northSouth[7][2]], color='green')
-        ax.plot([northSouth[7][0], northSouth[8][0]], [northSouth[7][1], northSouth[8][1]], [northSouth[7][2], northSouth[8][2]], color='green')
-        ax.plot([northSouth[8][0], northSouth[9][0]], [northSouth[8][1], northSouth[9][1]], [northSouth[8][2], northSouth[9][2]], color='green')
-        ax.plot([northSouth[9][0], northSouth[10][0]], [northSouth[9][1], northSouth[10][1]], [northSouth[9][2], northSouth[10][2]], color='green')
-        ax.plot([northSouth[10][0], northSouth[11][0]], [northSouth[10][1], northSouth[11][1]], [northSouth[10][2], northSouth[11][2]], color='green')
-        ax.plot([northSouth[11][0], northSouth[12][0]], [northSouth[11][1], northSouth[12][1]], [northSouth[11][2], northSouth[12][2]], color='green')
-        ax.plot([northSouth[12][0], northSouth[13][0]], [northSouth[12][1], northSouth[13][1]], [northSouth[12][2], northSouth[13][2]], color='green')
-        ax.plot([northSouth[13][0], northSouth[14][0]], [northSouth[13][1], northSouth[14][1]], [northSouth[13][2], northSouth[14][2]], color='green')
-        ax.plot([northSouth[14][0], northSouth[15][0]], [northSouth[14][1], northSouth[15][1]], [northSouth[14][2], northSouth[15][2]], color='green')
-        ax.plot([northSouth[15][0], northSouth[16][0]], [northSouth[15][1], northSouth[16][1]], [northSouth[15][2], northSouth[16][2]], color='green')
-        ax.plot([northSouth[16][0], northSouth[17][0]], [northSouth[16][1], northSouth[17][1]], [northSouth[16][2], northSouth[17][2]], color='green')
-        ax.plot([northSouth[17][0], northSouth[18][0]], [northSouth[17][1], northSouth[18][1]], [northSouth[17][2], northSouth[18][2]], color='green')
-        ax.plot([northSouth[18][0], northSouth[19][0]], [northSouth[18][1], northSouth[19][1]], [northSouth[18][2], northSouth[19][2]], color='green')
-        ax.plot([northSouth[19][0], northSouth[20][0]], [northSouth[19][1], northSouth[20][1]], [northSouth[19][2], northSouth[20][2]], color='green')
-        ax.plot([northSouth[20][0], northSouth[21][0]], [northSouth[20][1], northSouth[21][1]], [northSouth[20][2], northSouth[21][2]], color='green')
-        ax.plot([northSouth[21][0], northSouth[22][0]], [northSouth[21][1], northSouth[22][1]], [northSouth[21][2], northSouth[22][2]], color='green')
-        ax.plot([northSouth[22][0], northSouth[23][0]], [northSouth[22][1], northSouth[23][1]], [northSouth[22][2], northSouth[23][2]], color='green')
-        ax.plot([northSouth[23][0], northSouth[24][0]], [northSouth[23][1], northSouth[24][1]], [northSouth[23][2], northSouth[24][2]], color='green')
-        ax.plot([northSouth[24][0], northSouth[25][0]], [northSouth[24][1], northSouth[25][1]], [northSouth[24][2], northSouth[25][2]], color='green')
-        ax.plot([northSouth[25][0], northSouth[26][0]], [northSouth[25][1], northSouth[26][1]], [northSouth[25][2], northSouth[26][2]], color='green')
-        ax.plot([northSouth[26][0], northSouth[27][0]], [northSouth[26][1], northSouth[27][1]], [northSouth[26][2], northSouth[27][2]], color='green')
-        ax.plot([northSouth[27][0], northSouth[28][0]], [northSouth[27][1], northSouth[28][1]], [northSouth[27][2], northSouth[28][2]], color='green')
-        ax.plot([northSouth[28][0], northSouth[29][0]], [northSouth[28][1], northSouth[29][1]], [northSouth[28][2], northSouth[29][2]], color='green')
-        ax.plot([northSouth[29][0], northSouth[30][0]], [northSouth[29][1], northSouth[30][1]], [northSouth[29][2], northSouth[30][2]], color='green')
-        ax.plot([northSouth[30][0], northSouth[31][0]], [northSouth[30][1], northSouth[31][1]], [northSouth[30][2], northSouth[31][2]], color='green')
-        ax.plot([northSouth[31][0], northSouth[32][0]], [northSouth[31][1], northSouth[32][1]], [northSouth[31][2], northSouth[32][2]], color='green')
-        ax.plot([northSouth[32][0], northSouth[33][0]], [northSouth[32][1], northSouth[33][1]], [northSouth[32][2], northSouth[33][2]], color='green')
-        ax.plot([northSouth[33][0], northSouth[34][0]], [northSouth[33][1], northSouth[34][1]], [northSouth[33][2], northSouth[34][2]], color='green')
-        ax.plot([northSouth[34][0], northSouth[35][0]], [northSouth[34][1], northSouth[35][1]], [northSouth[34][2], northSouth[35][2]], color='green')
-        ax.plot([northSouth[35][0], northSouth[36][0]], [northSouth[35][1], northSouth[36][1]], [northSouth[35][2], northSouth[36][2]], color='green')
-        ax.plot([northSouth[36][0], northSouth[37][0]], [northSouth[36][1], northSouth[37][1]], [northSouth[36][2], northSouth[37][2]], color='green')
-        ax.plot([northSouth[37][0], northSouth[38][0]], [northSouth[37][1], northSouth[38][1]], [northSouth[37][2], northSouth[38][2]], color='green')
-        ax.plot([northSouth[38][0], northSouth[39][0]], [northSouth[38][1], northSouth[39][1]], [northSouth[38][2], northSouth[39][2]], color='green')
-        ax.plot([northSouth[39][0], northSouth[40][0]], [northSouth[39][1], northSouth[40][1]], [northSouth[39][2], northSouth[40][2]], color='green')
-        ax.plot([northSouth[40][0], northSouth[41][0]], [northSouth[40][1], northSouth[41][1]], [northSouth[40][2], northSouth[41][2]], color='green')
-        ax.plot([northSouth[41][0], northSouth[42][0]], [northSouth[41][1], northSouth[42][1]], [northSouth[41][2], northSouth[42][2]], color='green')
-        ax.plot([northSouth[42][0], northSouth[43][0]], [northSouth[42][1], northSouth[43][1]], [northSouth[42][2], northSouth[43][2]], color='green')
-        ax.plot([northSouth[43][0], northSouth[44][0]], [northSouth[43][1], northSouth[44][1]], [northSouth[43][2], northSouth[44][2]], color='green')
-        ax.plot([northSouth[44][0], northSouth[45][0]], [northSouth[44][1], northSouth[45][1]], [northSouth[44][2], northSouth[45][2]], color='green')
-        ax.plot([northSouth[45][0], northSouth[46][0]], [northSouth[45][1], northSouth[46][1]], [northSouth[45][2], northSouth[46][2]], color='green')
-        ax.plot([northSouth[46][0], northSouth[47][0]], [northSouth[46][1], northSouth[47][1]], [northSouth[46][2], northSouth[47][2]], color='green')
-        ax.plot([northSouth[47][0], northSouth[48][0]], [northSouth[47][1], northSouth[48][1]], [northSouth[47][2], northSouth[48][2]], color='green')
-        ax.plot([northSouth[48][0], northSouth[49][0]], [northSouth[48][1], northSouth[49][1]], [northSouth[48][2], northSouth[49][2]], color='green')
-        ax.plot([northSouth[49][0], northSouth[50][0]], [northSouth[49][1], northSouth[50][1]], [northSouth[49][2], northSouth[50][2]], color='green')
-        ax.plot([northSouth[50][0], northSouth[51][0]], [northSouth[50][1], northSouth[51][1]], [northSouth[50][2], northSouth[51][2]], color='green')
-        ax.plot([northSouth[51][0], northSouth[52][0]], [northSouth[51][1], northSouth[52][1]], [northSouth[51][2], northSouth[52][2]], color='green')
-        ax.plot([northSouth[52][0], northSouth[53][0]], [northSouth[52][1], northSouth[53][1]], [northSouth[52][2], northSouth[53][2]], color='green')
-        ax.plot([northSouth[53][0], northSouth[54][0]], [northSouth[53][1], northSouth[54][1]], [northSouth[53][2], northSouth[54][2]], color='green')
-        ax.plot([northSouth[54][0], northSouth[55][0]], [northSouth[54][1], northSouth[55][1]], [northSouth[54][2], northSouth[55][2]], color='green')
-        ax.plot([northSouth[55][0], northSouth[56][0]], [northSouth[55][1], northSouth[56][1]], [northSouth[55][2], northSouth[56][2]], color='green')
-        ax.plot([northSouth[56][0], northSouth[57][0]], [northSouth[56][1], northSouth[57][1]], [northSouth[56][2], northSouth[57][2]], color='green')
-        ax.plot([northSouth[57][0], northSouth[58][0]], [northSouth[57][1], northSouth[58][1]], [northSouth[57][2], northSouth[58][2]], color='green')
-        ax.plot([northSouth[58][0], northSouth[59][0]], [northSouth[58][1], northSouth[59][1]], [northSouth[58][2], northSouth[59][2]], color='green')
-        ax.plot([northSouth[59][0], northSouth[60][0]], [northSouth[59][1], northSouth[60][1]], [northSouth[59][2], northSouth[60][2]], color='green')
-        ax.plot([northSouth[60][0], northSouth[61][0]], [northSouth[60][1], northSouth[61][1]], [northSouth[60][2], northSouth[61][2]], color='green')
-        ax.plot([northSouth[61][0], northSouth[62][0]], [northSouth[61][1], northSouth[62][1]], [northSouth[61][2], northSouth[62][2]], color='green')
-        ax.plot([northSouth[62][0], northSouth[63][0]], [northSouth[62][1], northSouth[63][1]], [northSouth[62][2], northSouth[63][2]], color='green')
-        ax.plot([northSouth[63][0], northSouth[64][0]], [northSouth[63][1], northSouth[64][1]], [northSouth[63][2], northSouth[64][2]], color='green')
-        ax.plot([northSouth[64][0], northSouth[65][0]], [northSouth[64][1], northSouth[65][1]], [northSouth[64][2], northSouth[65][2]], color='green')
-        ax.plot([northSouth[65][0], northSouth[66][0]], [northSouth[65][1], northSouth[66][1]], [northSouth[65][2], northSouth[66][2]], color='green')
-        ax.plot([northSouth[66][0], northSouth[67][0]], [northSouth[66][1], northSouth[67][1]], [northSouth[66][2], northSouth[67][2]], color='green')
-        ax.plot([northSouth[67][0], northSouth[68][0]], [northSouth[67][1], northSouth[68][1]], [northSouth[67][2], northSouth[68][2]], color='green')
-        ax.plot([northSouth[68][0], northSouth[69][0]], [northSouth[68][1], northSouth[69][1]], [northSouth[68][2], northSouth[69][2]], color='green')
-        ax.plot([northSouth[69][0], northSouth[70][0]], [northSouth[69][1], northSouth[70][1]], [northSouth[69][2], northSouth[70][2]], color='green')
-
-        #plot Europe, Asia, Africa
-        ax.plot([eurasiaAfrica[0][0], eurasiaAfrica[1][0]], [eurasiaAfrica[0][1], eurasiaAfrica[1][1]], [eurasiaAfrica[0][2], eurasiaAfrica[1][2]], color='green')
-        ax.plot([eurasiaAfrica[1][0], eurasiaAfrica[2][0]], [eurasiaAfrica[1][1], eurasiaAfrica[2][1]], [eurasiaAfrica[1][2], eurasiaAfrica[2][2]], color='green')
-        ax.plot([eurasiaAfrica[2][0], eurasiaAfrica[3][0]], [eurasiaAfrica[2][1], eurasiaAfrica[3][1]], [eurasiaAfrica[2][2], eurasiaAfrica[3][2]], color='green')
-        ax.plot([eurasiaAfrica[3][0], eurasiaAfrica[4][0]], [eurasiaAfrica[3][1], eurasiaAfrica[4][1]], [eurasiaAfrica[3][2], eurasiaAfrica[4][2]], color='green')
-        ax.plot([eurasiaAfrica[4][0], eurasiaAfrica[5][0]], [eurasiaAfrica[4][1], eurasiaAfrica[5][1]], [eurasiaAfrica[4][2], eurasiaAfrica[5][2]], color='green')
-        ax.plot([eurasiaAfrica[5][0], eurasiaAfrica[6][0]], [eurasiaAfrica[5][1], eurasiaAfrica[6][1]], [eurasiaAfrica[5][2], eurasiaAfrica[6][2]], color='green')
-        ax.plot([eurasiaAfrica[6][0], eurasiaAfrica[7][0]], [eurasiaAfrica[6][1], eurasiaAfrica[7][1]], [eurasiaAfrica[6][2], eurasiaAfrica[7][2]], color='green')
-        ax.plot([eurasiaAfrica[7][0], eurasiaAfrica[8][0]], [eurasiaAfrica[7][1], eurasiaAfrica[8][1]], [eurasiaAfrica[7][2], eurasiaAfrica[8][2]], color='green')
-        ax.plot([eurasiaAfrica[8][0], eurasiaAfrica[9][0]], [eurasiaAfrica[8][1], eurasiaAfrica[9][1]], [eurasiaAfrica[8][2], eurasiaAfrica[9][2]], color='green')
-        ax.plot([eurasiaAfrica[9][0], eurasiaAfrica[10][0]], [eurasiaAfrica[9][1], eurasiaAfrica[10][1]], [eurasiaAfrica[9][2], eurasiaAfrica[10][2]], color='green')
-        ax.plot([eurasiaAfrica[10][0], eurasiaAfrica[11][0]], [eurasiaAfrica[10][1], eurasiaAfrica[11][1]], [eurasiaAfrica[10][2], eurasiaAfrica[11][2]], color='green')
-        ax.plot([eurasiaAfrica[11][0], eurasiaAfrica[12][0]], [eurasiaAfrica[11][1], eurasiaAfrica[12][1]], [eurasiaAfrica[11][2], eurasiaAfrica[12][2]], color='green')
-        ax.plot([eurasiaAfrica[12][0], eurasiaAfrica[13][0]], [eurasiaAfrica[12][1], eurasiaAfrica[13][1]], [eurasiaAfrica[12][2], eurasiaAfrica[13][2]], color='green')
-        ax.plot([eurasiaAfrica[13][0], eurasiaAfrica[14][0]], [eurasiaAfrica[13][1], eurasiaAfrica[14][1]], [eurasiaAfrica[13][2], eurasiaAfrica[14][2]], color='green')
-        ax.plot([eurasiaAfrica[14][0], eurasiaAfrica[15][0]], [eurasiaAfrica[14][1], eurasiaAfrica[15][1]], [eurasiaAfrica[14][2], eurasiaAfrica[15][2]], color='green')
-        ax.plot([eurasiaAfrica[15][0], eurasiaAfrica[16][0]], [eurasiaAfrica[15][1], eurasiaAfrica[16][1]], [eurasiaAfrica[15][2], eurasiaAfrica[16][2]], color='green')
-        ax.plot([eurasiaAfrica[16][0], eurasiaAfrica[17][0]], [eurasiaAfrica[16][1], eurasiaAfrica[17][1]], [eurasiaAfrica[16][2], eurasiaAfrica[17][2]], color='green')
-        ax.plot([eurasiaAfrica[17][0], eurasiaAfrica[18][0]], [eurasiaAfrica[17][1], eurasiaAfrica[18][1]], [eurasiaAfrica[17][2], eurasiaAfrica[18][2]], color='green')
-        ax.plot([eurasiaAfrica[18][0], eurasiaAfrica[19][0]], [eurasiaAfrica[18][1], eurasiaAfrica[19][1]], [eurasiaAfrica[18][2], eurasiaAfrica[19][2]], color='green')
-        ax.plot([eurasiaAfrica[19][0], eurasiaAfrica[20][0]], [eurasiaAfrica[19][1], eurasiaAfrica[20][1]], [eurasiaAfrica[19][2], eurasiaAfrica[20][2]], color='green')
-        ax.plot([eurasiaAfrica[20][0], eurasiaAfrica[21][0]], [eurasiaAfrica[20][1], eurasiaAfrica[21][1]], [eurasiaAfrica[20][2], eurasiaAfrica[21][2]], color='green')
-        ax.plot([eurasiaAfrica[21][0], eurasiaAfrica[22][0]], [eurasiaAfrica[21][1], eurasiaAfrica[22][1]], [eurasiaAfrica[21][2], eurasiaAfrica[22][2]], color='green')
-        ax.plot([eurasiaAfrica[22][0], eurasiaAfrica[23][0]], [eurasiaAfrica[22][1], eurasiaAfrica[23][1]], [eurasiaAfrica[22][2], eurasiaAfrica[23][2]], color='green')
-        ax.plot([eurasiaAfrica[23][0], eurasiaAfrica[24][0]], [eurasiaAfrica[23][1], eurasiaAfrica[24][1]], [eurasiaAfrica[23][2], eurasiaAfrica[24][2]], color='green')
-        ax.plot([eurasiaAfrica[24][0], eurasiaAfrica[25][0]], [eurasiaAfrica[24][1], eurasiaAfrica[25][1]], [eurasiaAfrica[24][2], eurasiaAfrica[25][2]], color='green')
-        ax.plot([eurasiaAfrica[25][0], eurasiaAfrica[26][0]], [eurasiaAfrica[25][1], eurasiaAfrica[26][1]], [eurasiaAfrica[25][2], eurasiaAfrica[26][2]], color='green')
-        ax.plot([eurasiaAfrica[26][0], eurasiaAfrica[27][0]], [eurasiaAfrica[26][1], eurasiaAfrica[27][1]], [eurasiaAfrica[26][2], eurasiaAfrica[27][2]], color='green')
-        ax.plot([eurasiaAfrica[27][0], eurasiaAfrica[28][0]], [eurasiaAfrica[27][1], eurasiaAfrica[28][1]], [eurasiaAfrica[27][2], eurasiaAfrica[28][2]], color='green')
-        ax.plot([eurasiaAfrica[28][0], eurasiaAfrica[29][0]], [eurasiaAfrica[28][1], eurasiaAfrica[29][1]], [eurasiaAfrica[28][2], eurasiaAfrica[29][2]], color='green')
-        ax.plot([eurasiaAfrica[29][0], eurasiaAfrica[30][0]], [eurasiaAfrica[29][1], eurasiaAfrica[30][1]], [eurasiaAfrica[29][2], eurasiaAfrica[30][2]], color='green')
-        ax.plot([eurasiaAfrica[30][0], eurasiaAfrica[31][0]], [eurasiaAfrica[30][1], eurasiaAfrica[31][1]], [eurasiaAfrica[30][2], eurasiaAfrica[31][2]], color='green')
-        ax.plot([eurasiaAfrica[31][0], eurasiaAfrica[32][0]], [eurasiaAfrica[31][1], eurasiaAfrica[32][1]], [eurasiaAfrica[31][2], eurasiaAfrica[32][2]], color='green')
-        ax.plot([eurasiaAfrica[32][0], eurasiaAfrica[33][0]], [eurasiaAfrica[32][1], eurasiaAfrica[33][1]], [eurasiaAfrica[32][2], eurasiaAfrica[33][2]], color='green')
-        ax.plot([eurasiaAfrica[33][0], eurasiaAfrica[34][0]], [eurasiaAfrica[33][1], eurasiaAfrica[34][1]], [eurasiaAfrica[33][2], eurasiaAfrica[34][2]], color='green')
-        ax.plot([eurasiaAfrica[34][0], eurasiaAfrica[35][0]], [eurasiaAfrica[34][1], eurasiaAfrica[35][1]], [eurasiaAfrica[34][2], eurasiaAfrica[35][2]], color='green')
-        ax.plot([eurasiaAfrica[35][0], eurasiaAfrica[36][0]], [eurasiaAfrica[35][1], eurasiaAfrica[36][1]], [eurasiaAfrica[35][2], eurasiaAfrica[36][2]], color='green')
-        ax.plot([eurasiaAfrica[36][0], eurasiaAfrica[37][0]], [eurasiaAfrica[36][1], eurasiaAfrica[37][1]], [eurasiaAfrica[36][2], eurasiaAfrica[37][2]], color='green')
-        ax.plot([eurasiaAfrica[37][0], eurasiaAfrica[38][0]], [eurasiaAfrica[37][1], eurasiaAfrica[38][1]], [eurasiaAfrica[37][2], eurasiaAfrica[38][2]], color='green')
-        ax.plot([eurasiaAfrica[38][0], eurasiaAfrica[39][0]], [eurasiaAfrica[38][1], eurasiaAfrica[39][1]], [eurasiaAfrica[38][2], eurasiaAfrica[39][2]], color='green')
-        ax.plot([eurasiaAfrica[39][0], eurasiaAfrica[40][0]], [eurasiaAfrica[39][1], eurasiaAfrica[40][1]], [eurasiaAfrica[39][2], eurasiaAfrica[40][2]], color='green')
-        ax.plot([eurasiaAfrica[40][0], eurasiaAfrica[41][0]], [eurasiaAfrica[40][1], eurasiaAfrica[41][1]], [eurasiaAfrica[40][2], eurasiaAfrica[41][2]], color='green')
-        ax.plot([eurasiaAfrica[41][0], eurasiaAfrica[42][0]], [eurasiaAfrica[41][1], eurasiaAfrica[42][1]], [eurasiaAfrica[41][2], eurasiaAfrica[42][2]], color='green')
-        ax.plot([eurasiaAfrica[42][0], eurasiaAfrica[43][0]], [eurasiaAfrica[42][1], eurasiaAfrica[43][1]], [eurasiaAfrica[42][2], eurasiaAfrica[43][2]], color='green')
-        ax.plot([eurasiaAfrica[43][0], eurasiaAfrica[44][0]], [eurasiaAfrica[43][1], eurasiaAfrica[44][1]], [eurasiaAfrica[43][2], eurasiaAfrica[44][2]], color='green')
-        ax.plot([eurasiaAfrica[44][0], eurasiaAfrica[45][0]], [eurasiaAfrica[44][1], eurasiaAfrica[45][1]], [eurasiaAfrica[44][2], eurasiaAfrica[45][2]], color='green')
-        ax.plot([eurasiaAfrica[45][0], eurasiaAfrica[46][0]], [eurasiaAfrica[45][1], eurasiaAfrica[46][1]], [eurasiaAfrica[45][2], eurasiaAfrica[46][2]], color='green')
-        ax.plot([eurasiaAfrica[46][0], eurasiaAfrica[47][0]], [eurasiaAfrica[46][1], eurasiaAfrica[47][1]], [eurasiaAfrica[46][2], eurasiaAfrica[47][2]], color='green')
-        ax.plot([eurasiaAfrica[47][0], eurasiaAfrica[48][0]], [eurasiaAfrica[47][1], eurasiaAfrica[48][1]], [eurasiaAfrica[47][2], eurasiaAfrica[48][2]], color='green')
-        ax.plot([eurasiaAfrica[48][0], eurasiaAfrica[49][0]], [eurasiaAfrica[48][1], eurasiaAfrica[49][1]], [eurasiaAfrica[48][2], eurasiaAfrica[49][2]], color='green')
-        ax.plot([eurasiaAfrica[49][0], eurasiaAfrica[50][0]], [eurasiaAfrica[49][1], eurasiaAfrica[50][1]], [eurasiaAfrica[49][2], eurasiaAfrica[50][2]], color='green')
-        ax.plot([eurasiaAfrica[50][0], eurasiaAfrica[51][0]], [eurasiaAfrica[50][1], eurasiaAfrica[51][1]], [eurasiaAfrica[50][2], eurasiaAfrica[51][2]], color='green')
-        ax.plot([eurasiaAfrica[51][0], eurasiaAfrica[52][0]], [eurasiaAfrica[51][1], eurasiaAfrica[52][1]], [eurasiaAfrica[51][2], eurasiaAfrica[52][2]], color='green')
-        ax.plot([eurasiaAfrica[52][0], eurasiaAfrica[53][0]], [eurasiaAfrica[52][1], eurasiaAfrica[53][1]], [eurasiaAfrica[52][2], eurasiaAfrica[53][2]], color='green')
-        ax.plot([eurasiaAfrica[53][0], eurasiaAfrica[54][0]], [eurasiaAfrica[53][1], eurasiaAfrica[54][1]], [eurasiaAfrica[53][2], eurasiaAfrica[54][2]], color='green')
-        ax.plot([eurasiaAfrica[54][0], eurasiaAfrica[55][0]], [eurasiaAfrica[54][1], eurasiaAfrica[55][1]], [eurasiaAfrica[54][2], eurasiaAfrica[55][2]], color='green')
-        ax.plot([eurasiaAfrica[55][0], eurasiaAfrica[56][0]], [eurasiaAfrica[55][1], eurasiaAfrica[56][1]], [eurasiaAfrica[55][2], eurasiaAfrica[56][2]], color='green')
-        ax.plot([eurasiaAfrica[56][0], eurasiaAfrica[57][0]], [eurasiaAfrica[56][1], eurasiaAfrica[57][1]], [eurasiaAfrica[56][2], eurasiaAfrica[57][2]], color='green')
-        ax.plot([eurasiaAfrica[57][0], eurasiaAfrica[58][0]], [eurasiaAfrica[57][1], eurasiaAfrica[58][1]], [eurasiaAfrica[57][2], eurasiaAfrica[58][2]], color='green')
-        ax.plot([eurasiaAfrica[58][0], eurasiaAfrica[59][0]], [eurasiaAfrica[58][1], eurasiaAfrica[59][1]], [eurasiaAfrica[58][2], eurasiaAfrica[59][2]], color='green')
-        ax.plot([eurasiaAfrica[59][0], eurasiaAfrica[60][0]], [eurasiaAfrica[59][1], eurasiaAfrica[60][1]], [eurasiaAfrica[59][2], eurasiaAfrica[60][2]], color='green')
-        ax.plot([eurasiaAfrica[60][0], eurasiaAfrica[61][0]], [eurasiaAfrica[60][1], eurasiaAfrica[61][1]], [eurasiaAfrica[60][2], eurasiaAfrica[61][2]], color='green')
-        ax.plot([eurasiaAfrica[61][0], eurasiaAfrica[62][0]], [eurasiaAfrica[61][1], eurasiaAfrica[62][1]], [eurasiaAfrica[61][2], eurasiaAfrica[62][2]], color='green')
-        ax.plot([eurasiaAfrica[62][0], eurasiaAfrica[63][0]], [eurasiaAfrica[62][1], eurasiaAfrica[63][1]], [eurasiaAfrica[62][2], eurasiaAfrica[63][2]], color='green')
-        ax.plot([eurasiaAfrica[63][0], eurasiaAfrica[64][0]], [eurasiaAfrica[63][1], eurasiaAfrica[64][1]], [eurasiaAfrica[63][2], eurasiaAfrica[64][2]], color='green')
-        ax.plot([eurasiaAfrica[64][0], eurasiaAfrica[65][0]], [eurasiaAfrica[64][1], eurasiaAfrica[65][1]], [eurasiaAfrica[64][2], eurasiaAfrica[65][2]], color='green')
-        ax.plot([eurasiaAfrica[65][0], eurasiaAfrica[66][0]], [eurasiaAfrica[65][1], eurasiaAfrica[66][1]], [eurasiaAfrica[65][2], eurasiaAfrica[66][2]], color='green')
-        ax.plot([eurasiaAfrica[66][0], eurasiaAfrica[67][0]], [eurasiaAfrica[66][1], eurasiaAfrica[67][1]], [eurasiaAfrica[66][2], eurasiaAfrica[67][2]], color='green')
-        ax.plot([eurasiaAfrica[67][0], eurasiaAfrica[68][0]], [eurasiaAfrica[67][1], eurasiaAfrica[68][1]], [eurasiaAfrica[67][2], eurasiaAfrica[68][2]], color='green')
-        ax.plot([eurasiaAfrica[68][0], eurasiaAfrica[69][0]], [eurasiaAfrica[68][1], eurasiaAfrica[69][1]], [eurasiaAfrica[68][2], eurasiaAfrica[69][2]], color='green')
-        ax.plot([eurasiaAfrica[69][0], eurasiaAfrica[70][0]], [eurasiaAfrica[69][1], eurasiaAfrica[70][1]], [eurasiaAfrica[69][2], eurasiaAfrica[70][2]], color='green')
-        ax.plot([eurasiaAfrica[70][0], eurasiaAfrica[71][0]], [eurasiaAfrica[70][1], eurasiaAfrica[71][1]], [eurasiaAfrica[70][2], eurasiaAfrica[71][2]], color='green')
-        ax.plot([eurasiaAfrica[71][0], eurasiaAfrica[72][0]], [eurasiaAfrica[71][1], eurasiaAfrica[72][1]], [eurasiaAfrica[71][2], eurasiaAfrica[72][2]], color='green')
-        ax.plot([eurasiaAfrica[72][0], eurasiaAfrica[73][0]], [eurasiaAfrica[72][1], eurasiaAfrica[73][1]], [eurasiaAfrica[72][2], eurasiaAfrica[73][2]], color='green')
-        ax.plot([eurasiaAfrica[73][0], eurasiaAfrica[74][0]], [eurasiaAfrica[73][1], eurasiaAfrica[74][1]], [eurasiaAfrica[73][2], eurasiaAfrica[74][2]], color='green')
-        ax.plot([eurasiaAfrica[74][0], eurasiaAfrica[75][0]], [eurasiaAfrica[74][1], eurasiaAfrica[75][1]], [eurasiaAfrica[74][2], eurasiaAfrica[75][2]], color='green')
-        ax.plot([eurasiaAfrica[75][0], eurasiaAfrica[76][0]], [eurasiaAfrica[75][1], eurasiaAfrica[76][1]], [eurasiaAfrica[75][2], eurasiaAfrica[76][2]], color='green')
-        ax.plot([eurasiaAfrica[76][0], eurasiaAfrica[77][0]], [eurasiaAfrica[76][1], eurasiaAfrica[77][1]], [eurasiaAfrica[76][2], eurasiaAfrica[77][2]], color='green')
-        ax.plot([eurasiaAfrica[77][0], eurasiaAfrica[78][0]], [eurasiaAfrica[77][1], eurasiaAfrica[78][1]], [eurasiaAfrica[77][2], eurasiaAfrica[78][2]], color='green')
-        ax.plot([eurasiaAfrica[78][0], eurasiaAfrica[79][0]], [eurasiaAfrica[78][1], eurasiaAfrica[79][1]], [eurasiaAfrica[78][2], eurasiaAfrica[79][2]], color='green')
-        ax.plot([eurasiaAfrica[79][0], eurasiaAfrica[80][0]], [eurasiaAfrica[79][1], eurasiaAfrica[80][1]], [eurasiaAfrica[79][2], eurasiaAfrica[80][2]], color='green')
-        ax.plot([eurasiaAfrica[80][0], eurasiaAfrica[81][0]], [eurasiaAfrica[80][1], eurasiaAfrica[81][1]], [eurasiaAfrica[80][2], eurasiaAfrica[81][2]], color='green')
-        ax.plot([eurasiaAfrica[81][0], eurasiaAfrica[82][0]], [eurasiaAfrica[81][1], eurasiaAfrica[82][1]], [eurasiaAfrica[81][2], eurasiaAfrica[82][2]], color='green')
-        ax.plot([eurasiaAfrica[82][0], eurasiaAfrica[83][0]], [eurasiaAfrica[82][1], eurasiaAfrica[83][1]], [eurasiaAfrica[82][2], eurasiaAfrica[83][2]], color='green')
-        ax.plot([eurasiaAfrica[83][0], eurasiaAfrica[84][0]], [eurasiaAfrica[83][1], eurasiaAfrica[84][1]], [eurasiaAfrica[83][2], eurasiaAfrica[84][2]], color='green')
-        ax.plot([eurasiaAfrica[84][0], eurasiaAfrica[85][0]], [eurasiaAfrica[84][1], eurasiaAfrica[85][1]], [eurasiaAfrica[84][2], eurasiaAfrica[85][2]], color='green')
-        ax.plot([eurasiaAfrica[85][0], eurasiaAfrica[86][0]], [eurasiaAfrica[85][1], eurasiaAfrica[86][1]], [eurasiaAfrica[85][2], eurasiaAfrica[86][2]], color='green')
-        ax.plot([eurasiaAfrica[86][0], eurasiaAfrica[87][0]], [eurasiaAfrica[86][1], eurasiaAfrica[87][1]], [eurasiaAfrica[86][2], eurasiaAfrica[87][2]], color='green')
-        ax.plot([eurasiaAfrica[87][0], eurasiaAfrica[88][0]], [eurasiaAfrica[87][1], eurasiaAfrica[88][1]], [eurasiaAfrica[87][2], eurasiaAfrica[88][2]], color='green')
-        ax.plot([eurasiaAfrica[88][0], eurasiaAfrica[89][0]], [eurasiaAfrica[88][1], eurasiaAfrica[89][1]], [eurasiaAfrica[88][2], eurasiaAfrica[89][2]], color='green')
-        ax.plot([eurasiaAfrica[89][0], eurasiaAfrica[90][0]], [eurasiaAfrica[89][1], eurasiaAfrica[90][1]], [eurasiaAfrica[89][2], eurasiaAfrica[90][2]], color='green')
-        ax.plot([eurasiaAfrica[90][0], eurasiaAfrica[91][0]], [eurasiaAfrica[90][1], eurasiaAfrica[91][1]], [eurasiaAfrica[90][2], eurasiaAfrica[91][2]], color='green')
-        ax.plot([eurasiaAfrica[91][0], eurasiaAfrica[92][0]], [eurasiaAfrica[91][1], eurasiaAfrica[92][1]], [eurasiaAfrica[91][2], eurasiaAfrica[92][2]], color='green')
-        ax.plot([eurasiaAfrica[92][0], eurasiaAfrica[93][0]], [eurasiaAfrica[92][1], eurasiaAfrica[93][1]], [eurasiaAfrica[92][2], eurasiaAfrica[93][2]], color='green')
-        ax.plot([eurasiaAfrica[93][0], eurasiaAfrica[94][0]], [eurasiaAfrica[93][1], eurasiaAfrica[94][1]], [eurasiaAfrica[93][2], eurasiaAfrica[94][2]], color='green')
-        ax.plot([eurasiaAfrica[94][0], eurasiaAfrica[95][0]], [eurasiaAfrica[94][1], eurasiaAfrica[95][1]], [eurasiaAfrica[94][2], eurasiaAfrica[95][2]], color='green')
-        ax.plot([eurasiaAfrica[95][0], eurasiaAfrica[96][0]], [eurasiaAfrica[95][1], eurasiaAfrica[96][1]], [eurasiaAfrica[95][2], eurasiaAfrica[96][2]], color='green')
-        ax.plot([eurasiaAfrica[96][0], eurasiaAfrica[97][0]], [eurasiaAfrica[96][1], eurasiaAfrica[97][1]], [eurasiaAfrica[96][2], eurasiaAfrica[97][2]], color='green')
-        ax.plot([eurasiaAfrica[97][0], eurasiaAfrica[98][0]], [eurasiaAfrica[97][1], eurasiaAfrica[98][1]], [eurasiaAfrica[97][2], eurasiaAfrica[98][2]], color='green')
-        ax.plot([eurasiaAfrica[98][0], eurasiaAfrica[99][0]], [eurasiaAfrica[98][1], eurasiaAfrica[99][1]], [eurasiaAfrica[98][2], eurasiaAfrica[99][2]], color='green')
-        ax.plot([eurasiaAfrica[99][0], eurasiaAfrica[100][0]], [eurasiaAfrica[99][1], eurasiaAfrica[100][1]], [eurasiaAfrica[99][2], eurasiaAfrica[100][2]], color='green')
-        ax.plot([eurasiaAfrica[100][0], eurasiaAfrica[101][0]], [eurasiaAfrica[100][1], eurasiaAfrica[101][1]], [eurasiaAfrica[100][2], eurasiaAfrica[101][2]], color='green')
-        ax.plot([eurasiaAfrica[101][0], eurasiaAfrica[102][0]], [eurasiaAfrica[101][1], eurasiaAfrica[102][1]], [eurasiaAfrica[101][2], eurasiaAfrica[102][2]], color='green')
-        ax.plot([eurasiaAfrica[102][0], eurasiaAfrica[103][0]], [eurasiaAfrica[102][1], eurasiaAfrica[103][1]], [eurasiaAfrica[102][2], eurasiaAfrica[103][2]], color='green')
-        ax.plot([eurasiaAfrica[103][0], eurasiaAfrica[104][0]], [eurasiaAfrica[103][1], eurasiaAfrica[104][1]], [eurasiaAfrica[103][2], eurasiaAfrica[104][2]], color='green')
-        ax.plot([eurasiaAfrica[104][0], eurasiaAfrica[105][0]], [eurasiaAfrica[104][1], eurasiaAfrica[105][1]], [eurasiaAfrica[104][2], eurasiaAfrica[105][2]], color='green')
-        ax.plot([eurasiaAfrica[105][0], eurasiaAfrica[106][0]], [eurasiaAfrica[105][1], eurasiaAfrica[106][1]], [eurasiaAfrica[105][2], eurasiaAfrica[106][2]], color='green')
-        ax.plot([eurasiaAfrica[106][0], eurasiaAfrica[107][0]], [eurasiaAfrica[106][1], eurasiaAfrica[107][1]], [eurasiaAfrica[106][2], eurasiaAfrica[107][2]], color='green')
-        ax.plot([eurasiaAfrica[107][0], eurasiaAfrica[108][0]], [eurasiaAfrica[107][1], eurasiaAfrica[108][1]], [eurasiaAfrica[107][2], eurasiaAfrica[108][2]], color='green')
-        ax.plot([eurasiaAfrica[108][0], eurasiaAfrica[109][0]], [eurasiaAfrica[108][1], eurasiaAfrica[109][1]], [eurasiaAfrica[108][2], eurasiaAfrica[109][2]], color='green')
-        ax.plot([eurasiaAfrica[109][0], eurasiaAfrica[110][0]], [eurasiaAfrica[109][1], eurasiaAfrica[110][1]], [eurasiaAfrica[109][2], eurasiaAfrica[110][2]], color='green')
-        ax.plot([eurasiaAfrica[110][0], eurasiaAfrica[111][0]], [eurasiaAfrica[110][1], eurasiaAfrica[111][1]], [eurasiaAfrica[110][2], eurasiaAfrica[111][2]], color='green')
-
-        #mediterranean sea
-        ax.plot([mediterranean[0][0], mediterranean[1][0]], [mediterranean[0][1], mediterranean[1][1]], [mediterranean[0][2], mediterranean[1][2]], color='green')
-        ax.plot([mediterranean[1][0], mediterranean[2][0]], [mediterranean[1][1], mediterranean[2][1]], [mediterranean[1][2], mediterranean[2][2]], color='green')
-        ax.plot([mediterranean[2][0], mediterranean[3][0]], [mediterranean[2][1], mediterranean[3][1]], [mediterranean[2][2], mediterranean[3][2]], color='green')
-        ax.plot([mediterranean[3][0], mediterranean[4][0]], [mediterranean[3][1], mediterranean[4][1]], [mediterranean[3][2], mediterranean[4][2]], color='green')
-        ax.plot([mediterranean[4][0], mediterranean[5][0]], [mediterranean[4][1], mediterranean[5][1]], [mediterranean[4][2], mediterranean[5][2]], color='green')
-        ax.plot([mediterranean[5][0], mediterranean[6][0]], [mediterranean[5][1], mediterranean[6][1]], [mediterranean[5][2], mediterranean[6][2]], color='green')
-        ax.plot([mediterranean[6][0], mediterranean[7][0]], [mediterranean[6][1], mediterranean[7][1]], [mediterranean[6][2], mediterranean[7][2]], color='green')
-        ax.plot([mediterranean[7][0], mediterranean[8][0]], [mediterranean[7][1], mediterranean[8][1]], [mediterranean[7][2], mediterranean[8][2]], color='green')
-        ax.plot([mediterranean[8][0], mediterranean[9][0]], [mediterranean[8][1], mediterranean[9][1]], [mediterranean[8][2], mediterranean[9][2]], color='green')
-        ax.plot([mediterranean[9][0], mediterranean[10][0]], [mediterranean[9][1], mediterranean[10][1]], [mediterranean[9][2], mediterranean[10][2]], color='green')
-        ax.plot([mediterranean[10][0], mediterranean[11][0]], [mediterranean[10][1], mediterranean[11][1]], [mediterranean[10][2], mediterranean[11][2]], color='green')
-        ax.plot([mediterranean[11][0], mediterranean[12][0]], [mediterranean[11][1], mediterranean[12][1]], [mediterranean[11][2], mediterranean[12][2]], color='green')
-        ax.plot([mediterranean[12][0], mediterranean[13][0]], [mediterranean[12][1], mediterranean[13][1]], [mediterranean[12][2], mediterranean[13][2]], color='green')
-        ax.plot([mediterranean[13][0], mediterranean[14][0]], [mediterranean[13][1], mediterranean[14][1]], [mediterranean[13][2], mediterranean[14][2]], color='green')
-        ax.plot([mediterranean[14][0], mediterranean[15][0]], [mediterranean[14][1], mediterranean[15][1]], [mediterranean[14][2], mediterranean[15][2]], color='green')
-        ax.plot([mediterranean[15][0], mediterranean[16][0]], [mediterranean[15][1], mediterranean[16][1]], [mediterranean[15][2], mediterranean[16][2]], color='green')
-        ax.plot([mediterranean[16][0], mediterranean[17][0]], [mediterranean[16][1], mediterranean[17][1]], [mediterranean[16][2], mediterranean[17][2]], color='green')
-        ax.plot([mediterranean[17][0], mediterranean[18][0]], [mediterranean[17][1], mediterranean[18][1]], [mediterranean[17][2], mediterranean[18][2]], color='green')
-        ax.plot([mediterranean[18][0], mediterranean[19][0]], [mediterranean[18][1], mediterranean[19][1]], [mediterranean[18][2], mediterranean[19][2]], color='green')
-        ax.plot([mediterranean[19][0], mediterranean[20][0]], [mediterranean[19][1], mediterranean[20][1]], [mediterranean[19][2], mediterranean[20][2]], color='green')
-        ax.plot([mediterranean[20][0], mediterranean[21][0]], [mediterranean[20][1], mediterranean[21][1]], [mediterranean[20][2], mediterranean[21][2]], color='green')
-        ax.plot([mediterranean[21][0], mediterranean[22][0]], [mediterranean[21][1], mediterranean[22][1]], [mediterranean[21][2], mediterranean[22][2]], color='green')
-        ax.plot([mediterranean[22][0], mediterranean[23][0]], [mediterranean[22][1], mediterranean[23][1]], [mediterranean[22][2], mediterranean[23][2]], color='green')
-        ax.plot([mediterranean[23][0], mediterranean[24][0]], [mediterranean[23][1], mediterranean[24][1]], [mediterranean[23][2], mediterranean[24][2]], color='green')
-        ax.plot([mediterranean[24][0], mediterranean[25][0]], [mediterranean[24][1], mediterranean[25][1]], [mediterranean[24][2], mediterranean[25][2]], color='green')
-        ax.plot([mediterranean[25][0], mediterranean[26][0]], [mediterranean[25][1], mediterranean[26][1]], [mediterranean[25][2], mediterranean[26][2]], color='green')
-        ax.plot([mediterranean[26][0], mediterranean[27][0]], [mediterranean[26][1], mediterranean[27][1]], [mediterranean[26][2], mediterranean[27][2]], color='green')
-        ax.plot([mediterranean[27][0], mediterranean[28][0]], [mediterranean[27][1], mediterranean[28][1]], [mediterranean[27][2], mediterranean[28][2]], color='green')
-        ax.plot([mediterranean[28][0], mediterranean[29][0]], [mediterranean[28][1], mediterranean[29][1]], [mediterranean[28][2], mediterranean[29][2]], color='green')
-        ax.plot([mediterranean[29][0], mediterranean[30][0]], [mediterranean[29][1], mediterranean[30][1]], [mediterranean[29][2], mediterranean[30][2]], color='green')
-        ax.plot([mediterranean[30][0], mediterranean[31][0]], [mediterranean[30][1], mediterranean[31][1]], [mediterranean[30][2], mediterranean[31][2]], color='green')
-        ax.plot([mediterranean[31][0], mediterranean[32][0]], [mediterranean[31][1], mediterranean[32][1]], [mediterranean[31][2], mediterranean[32][2]], color='green')
-        ax.plot([mediterranean[32][0], mediterranean[33][0]], [mediterranean[32][1], mediterranean[33][1]], [mediterranean[32][2], mediterranean[33][2]], color='green')
-        ax.plot([mediterranean[33][0], mediterranean[34][0]], [mediterranean[33][1], mediterranean[34][1]], [mediterranean[33][2], mediterranean[34][2]], color='green')
-        ax.plot([mediterranean[34][0], mediterranean[35][0]], [mediterranean[34][1], mediterranean[35][1]], [mediterranean[34][2], mediterranean[35][2]], color='green')
-        ax.plot([mediterranean[35][0], mediterranean[36][0]], [mediterranean[35][1], mediterranean[36][1]], [mediterranean[35][2], mediterranean[36][2]], color='green')
-        ax.plot([mediterranean[36][0], mediterranean[37][0]], [mediterranean[36][1], mediterranean[37][1]], [mediterranean[36][2], mediterranean[37][2]], color='green')
-        ax.plot([mediterranean[37][0], mediterranean[38][0]], [mediterranean[37][1], mediterranean[38][1]], [mediterranean[37][2], mediterranean[38][2]], color='green')
-        ax.plot([mediterranean[38][0], mediterranean[39][0]], [mediterranean[38][1], mediterranean[39][1]], [mediterranean[38][2], mediterranean[39][2]], color='green')
-        ax.plot([mediterranean[39][0], mediterranean[40][0]], [mediterranean[39][1], mediterranean[40][1]], [mediterranean[39][2], mediterranean[40][2]], color='green')
-        ax.plot([mediterranean[40][0], mediterranean[41][0]], [mediterranean[40][1], mediterranean[41][1]], [mediterranean[40][2], mediterranean[41][2]], color='green')
-        ax.plot([mediterranean[41][0], mediterranean[42][0]], [mediterranean[41][1], mediterranean[42][1]], [mediterranean[41][2], mediterranean[42][2]], color='green')
-        ax.plot([mediterranean[42][0], mediterranean[43][0]], [mediterranean[42][1], mediterranean[43][1]], [mediterranean[42][2], mediterranean[43][2]], color='green')
-        ax.plot([mediterranean[43][0], mediterranean[44][0]], [mediterranean[43][1], mediterranean[44][1]], [mediterranean[43][2], mediterranean[44][2]], color='green')
-
-        #UK
-        ax.plot([uk[0][0], uk[1][0]], [uk[0][1], uk[1][1]], [uk[0][2], uk[1][2]], color='green')
-        ax.plot([uk[1][0], uk[2][0]], [uk[1][1], uk[2][1]], [uk[1][2], uk[2][2]], color='green')
-        ax.plot([uk[2][0], uk[3][0]], [uk[2][1], uk[3][1]], [uk[2][2], uk[3][2]], color='green')
-        ax.plot([uk[3][0], uk[4][0]], [uk[3][1], uk[4][1]], [uk[3][2], uk[4][2]], color='green')
-        ax.plot([uk[4][0], uk[5][0]], [uk[4][1], uk[5][1]], [uk[4][2], uk[5][2]], color='green')
-        ax.plot([uk[5][0], uk[6][0]], [uk[5][1], uk[6][1]], [uk[5][2], uk[6][2]], color='green')
-        ax.plot([uk[6][0], uk[7][0]], [uk[6][1], uk[7][1]], [uk[6][2], uk[7][2]], color='green')
-        ax.plot([uk[7][0], uk[8][0]], [uk[7][1], uk[8][1]], [uk[7][2], uk[8][2]], color='green')
-        ax.plot([uk[8][0], uk[9][0]], [uk[8][1], uk[9][1]], [uk[8][2], uk[9][2]], color='green')
-        ax.plot([uk[9][0], uk[10][0]], [uk[9][1], uk[10][1]], [uk[9][2], uk[10][2]], color='green')
-        ax.plot([uk[10][0], uk[11][0]], [uk[10][1], uk[11][1]], [uk[10][2], uk[11][2]], color='green')
-        ax.plot([uk[11][0], uk[12][0]], [uk[11][1], uk[12][1]], [uk[11][2], uk[12][2]], color='green')
-        ax.plot([uk[12][0], uk[13][0]], [uk[12][1], uk[13][1]], [uk[12][2], uk[13][2]], color='green')
-        ax.plot([uk[13][0], uk[14][0]], [uk[13][1], uk[14][1]], [uk[13][2], uk[14][2]], color='green')
-        ax.plot([uk[14][0], uk[15][0]], [uk[14][1], uk[15][1]], [uk[14][2], uk[15][2]], color='green')
-        ax.plot([uk[15][0], uk[16][0]], [uk[15][1], uk[16][1]], [uk[15][2], uk[16][2]], color='green')
-        ax.plot([uk[16][0], uk[17][0]], [uk[16][1], uk[17][1]], [uk[16][2], uk[17][2]], color='green')
-        ax.plot([uk[17][0], uk[18][0]], [uk[17][1], uk[18][1]], [uk[17][2], uk[18][2]], color='green')
-        ax.plot([uk[18][0], uk[19][0]], [uk[18][1], uk[19][1]], [uk[18][2], uk[19][2]], color='green')
-        ax.plot([uk[19][0], uk[20][0]], [uk[19][1], uk[20][1]], [uk[19][2], uk[20][2]], color='green')
-        ax.plot([uk[20][0], uk[21][0]], [uk[20][1], uk[21][1]], [uk[20][2], uk[21][2]], color='green')
-        ax.plot([uk[21][0], uk[22][0]], [uk[21][1], uk[22][1]], [uk[21][2], uk[22][2]], color='green')
-        ax.plot([uk[22][0], uk[23][0]], [uk[22][1], uk[23][1]], [uk[22][2], uk[23][2]], color='green')
-        ax.plot([uk[23][0], uk[24][0]], [uk[23][1], uk[24][1]], [uk[23][2], uk[24][2]], color='green')
-        ax.plot([uk[24][0], uk[25][0]], [uk[24][1], uk[25][1]], [uk[24][2], uk[25][2]], color='green')
-
-        #Japan
-        ax.plot([japan[0][0], japan[1][0]], [japan[0][1], japan[1][1]], [japan[0][2], japan[1][2]], color='green')
-        ax.plot([japan[1][0], japan[2][0]], [japan[1][1], japan[2][1]], [japan[1][2], japan[2][2]], color='green')
-        ax.plot([japan[2][0], japan[3][0]], [japan[2][1], japan[3][1]], [japan[2][2], japan[3][2]], color='green')
-        ax.plot([japan[3][0], japan[4][0]], [japan[3][1], japan[4][1]], [japan[3][2], japan[4][2]], color='green')
-        ax.plot([japan[4][0], japan[5][0]], [japan[4][1], japan[5][1]], [japan[4][2], japan[5][2]], color='green')
-        ax.plot([japan[5][0], japan[6][0]], [japan[5][1], japan[6][1]], [japan[5][2], japan[6][2]], color='green')
-        ax.plot([japan[6][0], japan[7][0]], [japan[6][1], japan[7][1]], [japan[6][2], japan[7][2]], color='green')
-        ax.plot([japan[7][0], japan[8][0]], [japan[7][1], japan[8][1]], [japan[7][2], japan[8][2]], color='green')
-        ax.plot([japan[8][0], japan[9][0]], [japan[8][1], japan[9][1]], [japan[8][2], japan[9][2]], color='green')
-        ax.plot([japan[9][0], japan[10][0]], [japan[9][1], japan[10][1]], [japan[9][2], japan[10][2]], color='green')
-        ax.plot([japan[10][0], japan[11][0]], [japan[10][1], japan[11][1]], [japan[10][2], japan[11][2]], color='green')
-        ax.plot([japan[11][0], japan[12][0]], [japan[11][1], japan[12][1]], [japan[11][2], japan[12][2]], color='green')
-        ax.plot([japan[12][0], japan[13][0]], [japan[12][1], japan[13][1]], [japan[12][2], japan[13][2]], color='green')
-        ax.plot([japan[13][0], japan[14][0]], [japan[13][1], japan[14][1]], [japan[13][2], japan[14][2]], color='green')
-        ax.plot([japan[14][0], japan[15][0]], [japan[14][1], japan[15][1]], [japan[14][2], japan[15][2]], color='green')
-        ax.plot([japan[15][0], japan[16][0]], [japan[15][1], japan[16][1]], [japan[15][2], japan[16][2]], color='green')
-        ax.plot([japan[16][0], japan[17][0]], [japan[16][1], japan[17][1]], [japan[16][2], japan[17][2]], color='green')
-        ax.plot([japan[17][0], japan[18][0]], [japan[17][1], japan[18][1]], [japan[17][2], japan[18][2]], color='green')
-        ax.plot([japan[18][0], japan[19][0]], [japan[18][1], japan[19][1]], [japan[18][2], japan[19][2]], color='green')
-        ax.plot([japan[19][0], japan[20][0]], [japan[19][1], japan[20][1]], [japan[19][2], japan[20][2]], color='green')
-        ax.plot([japan[20][0], japan[21][0]], [japan[20][1], japan[21][1]], [japan[20][2], japan[21][2]], color='green')
-        ax.plot([japan[21][0], japan[22][0]], [japan[21][1], japan[22][1]], [japan[21][2], japan[22][2]], color='green')
-        ax.plot([japan[22][0], japan[23][0]], [japan[22][1], japan[23][1]], [japan[22][2], japan[23][2]], color='green')
-        ax.plot([japan[23][0], japan[24][0]], [japan[23][1], japan[24][1]], [japan[23][2], japan[24][2]], color='green')
-
-        #Philippines
-        ax.plot([philippines[0][0], philippines[1][0]], [philippines[0][1], philippines[1][1]], [philippines[0][2], philippines[1][2]], color='green')
-        ax.plot([philippines[1][0], philippines[2][0]], [philippines[1][1], philippines[2][1]], [philippines[1][2], philippines[2][2]], color='green')
-        ax.plot([philippines[2][0], philippines[3][0]], [philippines[2][1], philippines[3][1]], [philippines[2][2], philippines[3][2]], color='green')
-        ax.plot([philippines[3][0], philippines[4][0]], [philippines[3][1], philippines[4][1]], [philippines[3][2], philippines[4][2]], color='green')
-        ax.plot([philippines[4][0], philippines[5][0]], [philippines[4][1], philippines[5][1]], [philippines[4][2], philippines[5][2]], color='green')
-        ax.plot([philippines[5][0], philippines[6][0]], [philippines[5][1], philippines[6][1]], [philippines[5][2], philippines[6][2]], color='green')
-        ax.plot([philippines[6][0], philippines[7][0]], [philippines[6][1], philippines[7][1]], [philippines[6][2], philippines[7][2]], color='green')
-        ax.plot([philippines[7][0], philippines[8][0]], [philippines[7][1], philippines[8][1]], [philippines[7][2], philippines[8][2]], color='green')
-        ax.plot([philippines[8][0], philippines[9][0]], [philippines[8][1], philippines[9][1]], [philippines[8][2], philippines[9][2]], color='green')
-        ax.plot([philippines[9][0], philippines[10][0]], [philippines[9][1], philippines[10][1]], [philippines[9][2], philippines[10][2]], color='green')
-        ax.plot([philippines[10][0], philippines[11][0]], [philippines[10][1], philippines[11][1]], [philippines[10][2], philippines[11][2]], color='green')
-        ax.plot([philippines[11][0], philippines[12][0]], [philippines[11][1], philippines[12][1]], [philippines[11][2], philippines[12][2]], color='green')
-
-        #Indonesia
-        ax.plot([indonesia[0][0], indonesia[1][0]], [indonesia[0][1], indonesia[1][1]], [indonesia[0][2], indonesia[1][2]], color='green')
-        ax.plot([indonesia[1][0], indonesia[2][0]], [indonesia[1][1], indonesia[2][1]], [indonesia[1][2], indonesia[2][2]], color='green')
-        ax.plot([indonesia[2][0], indonesia[3][0]], [indonesia[2][1], indonesia[3][1]], [indonesia[2][2], indonesia[3][2]], color='green')
-        ax.plot([indonesia[3][0], indonesia[4][0]], [indonesia[3][1], indonesia[4][1]], [indonesia[3][2], indonesia[4][2]], color='green')
-        ax.plot([indonesia[4][0], indonesia[5][0]], [indonesia[4][1], indonesia[5][1]], [indonesia[4][2], indonesia[5][2]], color='green')
-        ax.plot([indonesia[5][0], indonesia[6][0]], [indonesia[5][1], indonesia[6][1]], [indonesia[5][2], indonesia[6][2]], color='green')
-        ax.plot([indonesia[6][0], indonesia[7][0]], [indonesia[6][1], indonesia[7][1]], [indonesia[6][2], indonesia[7][2]], color='green')
-        ax.plot([indonesia[7][0], indonesia[8][0]], [indonesia[7][1], indonesia[8][1]], [indonesia[7][2], indonesia[8][2]], color='green')
-        ax.plot([indonesia[8][0], indonesia[9][0]], [indonesia[8][1], indonesia[9][1]], [indonesia[8][2], indonesia[9][2]], color='green')
-        ax.plot([indonesia[9][0], indonesia[10][0]], [indonesia[9][1], indonesia[10][1]], [indonesia[9][2], indonesia[10][2]], color='green')
-        ax.plot([indonesia[10][0], indonesia[11][0]], [indonesia[10][1], indonesia[11][1]], [indonesia[10][2], indonesia[11][2]], color='green')
-        ax.plot([indonesia[11][0], indonesia[12][0]], [indonesia[11][1], indonesia[12][1]], [indonesia[11][2], indonesia[12][2]], color='green')
-        ax.plot([indonesia[12][0], indonesia[13][0]], [indonesia[12][1], indonesia[13][1]], [indonesia[12][2], indonesia[13][2]], color='green')
-        ax.plot([indonesia[13][0], indonesia[14][0]], [indonesia[13][1], indonesia[14][1]], [indonesia[13][2], indonesia[14][2]], color='green')
-        ax.plot([indonesia[14][0], indonesia[15][0]], [indonesia[14][1], indonesia[15][1]], [indonesia[14][2], indonesia[15][2]], color='green')
-        ax.plot([indonesia[15][0], indonesia[16][0]], [indonesia[15][1], indonesia[16][1]], [indonesia[15][2], indonesia[16][2]], color='green')
-        ax.plot([indonesia[16][0], indonesia[17][0]], [indonesia[16][1], indonesia[17][1]], [indonesia[16][2], indonesia[17][2]], color='green')
-        ax.plot([indonesia[17][0], indonesia[18][0]], [indonesia[17][1], indonesia[18][1]], [indonesia[17][2], indonesia[18][2]], color='green')
-        ax.plot([indonesia[18][0], indonesia[19][0]], [indonesia[18][1], indonesia[19][1]], [indonesia[18][2], indonesia[19][2]], color='green')
-        ax.plot([indonesia[19][0], indonesia[20][0]], [indonesia[19][1], indonesia[20][1]], [indonesia[19][2], indonesia[20][2]], color='green')
-
-        ax.plot([indonesia2[0][0], indonesia2[1][0]], [indonesia2[0][1], indonesia2[1][1]], [indonesia2[0][2], indonesia2[1][2]], color='green')
-        ax.plot([indonesia2[1][0], indonesia2[2][0]], [indonesia2[1][1], indonesia2[2][1]], [indonesia2[1][2], indonesia2[2][2]], color='green')
-        ax.plot([indonesia2[2][0], indonesia2[3][0]], [indonesia2[2][1], indonesia2[3][1]], [indonesia2[2][2], indonesia2[3][2]], color='green')
-        ax.plot([indonesia2[3][0], indonesia2[4][0]], [indonesia2[3][1], indonesia2[4][1]], [indonesia2[3][2], indonesia2[4][2]], color='green')
-        ax.plot([indonesia2[4][0], indonesia2[5][0]], [indonesia2[4][1], indonesia2[5][1]], [indonesia2[4][2], indonesia2[5][2]], color='green')
-        ax.plot([indonesia2[5][0], indonesia2[6][0]], [indonesia2[5][1], indonesia2[6][1]], [indonesia2[5][2], indonesia2[6][2]], color='green')
-        ax.plot([indonesia2[6][0], indonesia2[7][0]], [indonesia2[6][1], indonesia2[7][1]], [indonesia2[6][2], indonesia2[7][2]], color='green')
-        ax.plot([indonesia2[7][0], indonesia2[8][0]], [indonesia2[7][1], indonesia2[8][1]], [indonesia2[7][2], indonesia2[8][2]], color='green')
-        ax.plot([indonesia2[8][0], indonesia2[9][0]], [indonesia2[8][1], indonesia2[9][1]], [indonesia2[8][2], indonesia2[9][2]], color='green')
-
-        ax.plot([indonesia3[0][0], indonesia3[1][0]], [indonesia3[0][1], indonesia3[1][1]], [indonesia3[0][2], indonesia3[1][2]], color='green')
-        ax.plot([indonesia3[1][0], indonesia3[2][0]], [indonesia3[1][1], indonesia3[2][1]], [indonesia3[1][2], indonesia3[2][2]], color='green')
-        ax.plot([indonesia3[2][0], indonesia3[3][0]], [indonesia3[2][1], indonesia3[3][1]], [indonesia3[2][2], indonesia3[3][2]], color='green')
-        ax.plot([indonesia3[3][0], indonesia3[4][0]], [indonesia3[3][1], indonesia3[4][1]], [indonesia3[3][2], indonesia3[4][2]], color='green')
-        ax.plot([indonesia3[4][0], indonesia3[5][0]], [indonesia3[4][1], indonesia3[5][1]], [indonesia3[4][2], indonesia3[5][2]], color='green')
-        ax.plot([indonesia3[5][0], indonesia3[6][0]], [indonesia3[5][1], indonesia3[6][1]], [indonesia3[5][2], indonesia3[6][2]], color='green')
-        ax.plot([indonesia3[6][0], indonesia3[7][0]], [indonesia3[6][1], indonesia3[7][1]], [indonesia3[6][2], indonesia3[7][2]], color='green')
-        ax.plot([indonesia3[7][0], indonesia3[8][0]], [indonesia3[7][1], indonesia3[8][1]], [indonesia3[7][2], indonesia3[8][2]], color='green')
-        ax.plot([indonesia3[8][0], indonesia3[9][0]], [indonesia3[8][1], indonesia3[9][1]], [indonesia3[8][2], indonesia3[9][2]], color='green')
-        ax.plot([indonesia3[9][0], indonesia3[10][0]], [indonesia3[9][1], indonesia3[10][1]], [indonesia3[9][2], indonesia3[10][2]], color='green')
-        ax.plot([indonesia3[10][0], indonesia3[11][0]], [indonesia3[10][1], indonesia3[11][1]], [indonesia3[10][2], indonesia3[11][2]], color='green')
-        ax.plot([indonesia3[11][0], indonesia3[12][0]], [indonesia3[11][1], indonesia3[12][1]], [indonesia3[11][2], indonesia3[12][2]], color='green')
-        ax.plot([indonesia3[12][0], indonesia3[13][0]], [indonesia3[12][1], indonesia3[13][1]], [indonesia3[12][2], indonesia3[13][2]], color='green')
-        ax.plot([indonesia3[13][0], indonesia3[14][0]], [indonesia3[13][1], indonesia3[14][1]], [indonesia3[13][2], indonesia3[14][2]], color='green')
-        ax.plot([indonesia3[14][0], indonesia3[15][0]], [indonesia3[14][1], indonesia3[15][1]], [indonesia3[14][2], indonesia3[15][2]], color='green')
-
-        #Australia
-        ax.plot([australia[0][0], australia[1][0]], [australia[0][1], australia[1][1]], [australia[0][2], australia[1][2]], color='green')
-        ax.plot([australia[1][0], australia[2][0]], [australia[1][1], australia[2][1]], [australia[1][2], australia[2][2]], color='green')
-        ax.plot([australia[2][0], australia[3][0]], [australia[2][1], australia[3][1]], [australia[2][2], australia[3][2]], color='green')
-        ax.plot([australia[3][0], australia[4][0]], [australia[3][1], australia[4][1]], [australia[3][2], australia[4][2]], color='green')
-        ax.plot([australia[4][0], australia[5][0]], [australia[4][1], australia[5][1]], [australia[4][2], australia[5][2]], color='green')
-        ax.plot([australia[5][0], australia[6][0]], [australia[5][1], australia[6][1]], [australia[5][2], australia[6][2]], color='green')
-        ax.plot([australia[6][0], australia[7][0]], [australia[6][1], australia[7][1]], [australia[6][2], australia[7][2]], color='green')
-        ax.plot([australia[7][0], australia[8][0]], [australia[7][1], australia[8][1]], [australia[7][2], australia[8][2]], color='green')
-        ax.plot([australia[8][0], australia[9][0]], [australia[8][1], australia[9][1]], [australia[8][2], australia[9][2]], color='green')
-        ax.plot([australia[9][0], australia[10][0]], [australia[9][1], australia[10][1]], [australia[9][2], australia[10][2]], color='green')
-        ax.plot([australia[10][0], australia[11][0]], [australia[10][1], australia[11][1]], [australia[10][2], australia[11][2]], color='green')
-        ax.plot([australia[11][0], australia[12][0]], [australia[11][1], australia[12][1]], [australia[11][2], australia[12][2]], color='green')
-        ax.plot([australia[12][0], australia[13][0]], [australia[12][1], australia[13][1]], [australia[12][2], australia[13][2]], color='green')
-        ax.plot([australia[13][0], australia[14][0]], [australia[13][1], australia[14][1]], [australia[13][2], australia[14][2]], color='green')
-        ax.plot([australia[14][0], australia[15][0]], [australia[14][1], australia[15][1]], [australia[14][2], australia[15][2]], color='green')
-        ax.plot([australia[15][0], australia[16][0]], [australia[15][1], australia[16][1]], [australia[15][2], australia[16][2]], color='green')
-        ax.plot([australia[16][0], australia[17][0]], [australia[16][1], australia[17][1]], [australia[16][2], australia[17][2]], color='green')
-        ax.plot([australia[17][0], australia[18][0]], [australia[17][1], australia[18][1]], [australia[17][2], australia[18][2]], color='green')
-        ax.plot([australia[18][0], australia[19][0]], [australia[18][1], australia[19][1]], [australia[18][2], australia[19][2]], color='green')
-        ax.plot([australia[19][0], australia[20][0]], [australia[19][1], australia[20][1]], [australia[19][2], australia[20][2]], color='green')
-        ax.plot([australia[20][0], australia[21][0]], [australia[20][1], australia[21][1]], [australia[20][2], australia[21][2]], color='green')
-        ax.plot([australia[21][0], australia[22][0]], [australia[21][1], australia[22][1]], [australia[21][2], australia[22][2]], color='green')
-
-#Plots all of the routes connecting neighboring cities
-#Because the graph is undirected, can ignore duplicates
+        global landmassPoints, landmassLine
+        landmassPoints = np.concatenate([np.vstack([outline, np.full((1, 3), np.nan)]) for outline in landmasses])
+        landmassLine, = ax.plot(*landmassPoints.T, color='green')
+
+#Plots all of the routes connecting neighboring cities as great-circle arcs
+#Because the graph is undirected, each route is only listed once in cityRoutes
 def plotRoutes():
-        #Tokyo, Japan
-        ax.plot([cityCoords[0][0], cityCoords[9][0]], [cityCoords[0][1], cityCoords[9][1]], [cityCoords[0][2], cityCoords[9][2]], color='gold')
-        ax.plot([cityCoords[0][0], cityCoords[34][0]], [cityCoords[0][1], cityCoords[34][1]], [cityCoords[0][2], cityCoords[34][2]], color='gold')
-        ax.plot([cityCoords[0][0], cityCoords[33][0]], [cityCoords[0][1], cityCoords[33][1]], [cityCoords[0][2], cityCoords[33][2]], color='gold')
-        #Delhi, India
-        ax.plot([cityCoords[1][0], cityCoords[11][0]], [cityCoords[1][1], cityCoords[11][1]], [cityCoords[1][2], cityCoords[11][2]], color='gold')
-        ax.plot([cityCoords[1][0], cityCoords[15][0]], [cityCoords[1][1], cityCoords[15][1]], [cityCoords[1][2], cityCoords[15][2]], color='gold')
-        ax.plot([cityCoords[1][0], cityCoords[35][0]], [cityCoords[1][1], cityCoords[35][1]], [cityCoords[1][2], cityCoords[35][2]], color='gold')
-        #Shanghai, China
-        ax.plot([cityCoords[2][0], cityCoords[33][0]], [cityCoords[2][1], cityCoords[33][1]], [cityCoords[2][2], cityCoords[33][2]], color='gold')
-        ax.plot([cityCoords[2][0], cityCoords[13][0]], [cityCoords[2][1], cityCoords[13][1]], [cityCoords[2][2], cityCoords[13][2]], color='gold')
-        ax.plot([cityCoords[2][0], cityCoords[7][0]], [cityCoords[2][1], cityCoords[7][1]], [cityCoords[2][2], cityCoords[7][2]], color='gold')
-        ax.plot([cityCoords[2][0], cityCoords[19][0]], [cityCoords[2][1], cityCoords[19][1]], [cityCoords[2][2], cityCoords[19][2]], color='gold')
-        ax.plot([cityCoords[2][0], cityCoords[21][0]], [cityCoords[2][1], cityCoords[21][1]], [cityCoords[2][2], cityCoords[21][2]], color='gold')
-        #Sao Paulo, Brazil
-        ax.plot([cityCoords[3][0], cityCoords[18][0]], [cityCoords[3][1], cityCoords[18][1]], [cityCoords[3][2], cityCoords[18][2]], color='gold')
-        ax.plot([cityCoords[3][0], cityCoords[12][0]], [cityCoords[3][1], cityCoords[12][1]], [cityCoords[3][2], cityCoords[12][2]], color='gold')
-        ax.plot([cityCoords[3][0], cityCoords[28][0]], [cityCoords[3][1], cityCoords[28][1]], [cityCoords[3][2], cityCoords[28][2]], color='gold')
-        #Mexico City, Mexico
-        ax.plot([cityCoords[4][0], cityCoords[28][0]], [cityCoords[4][1], cityCoords[28][1]], [cityCoords[4][2], cityCoords[28][2]], color='gold')
-        ax.plot([cityCoords[4][0], cityCoords[22][0]], [cityCoords[4][1], cityCoords[22][1]], [cityCoords[4][2], cityCoords[22][2]], color='gold')
-        #Cairo, Egypt
-        ax.plot([cityCoords[5][0], cityCoords[14][0]], [cityCoords[5][1], cityCoords[14][1]], [cityCoords[5][2], cityCoords[14][2]], color='gold')
-        ax.plot([cityCoords[5][0], cityCoords[37][0]], [cityCoords[5][1], cityCoords[37][1]], [cityCoords[5][2], cityCoords[37][2]], color='gold')
-        ax.plot([cityCoords[5][0], cityCoords[17][0]], [cityCoords[5][1], cityCoords[17][1]], [cityCoords[5][2], cityCoords[17][2]], color='gold')
-        ax.plot([cityCoords[5][0], cityCoords[20][0]], [cityCoords[5][1], cityCoords[20][1]], [cityCoords[5][2], cityCoords[20][2]], color='gold')
-        #Mumbai, India
-        ax.plot([cityCoords[6][0], cityCoords[11][0]], [cityCoords[6][1], cityCoords[11][1]], [cityCoords[6][2], cityCoords[11][2]], color='gold')
-        ax.plot([cityCoords[6][0], cityCoords[35][0]], [cityCoords[6][1], cityCoords[35][1]], [cityCoords[6][2], cityCoords[35][2]], color='gold')
-        ax.plot([cityCoords[6][0], cityCoords[26][0]], [cityCoords[6][1], cityCoords[26][1]], [cityCoords[6][2], cityCoords[26][2]], color='gold')
-        #Beijing, China
-        ax.plot([cityCoords[7][0], cityCoords[19][0]], [cityCoords[7][1], cityCoords[19][1]], [cityCoords[7][2], cityCoords[19][2]], color='gold')
-        #Dhaka, Bangladesh
-        ax.plot([cityCoords[8][0], cityCoords[15][0]], [cityCoords[8][1], cityCoords[15][1]], [cityCoords[8][2], cityCoords[15][2]], color='gold')
-        ax.plot([cityCoords[8][0], cityCoords[39][0]], [cityCoords[8][1], cityCoords[39][1]], [cityCoords[8][2], cityCoords[39][2]], color='gold')
-        ax.plot([cityCoords[8][0], cityCoords[13][0]], [cityCoords[8][1], cityCoords[13][1]], [cityCoords[8][2], cityCoords[13][2]], color='gold')
-        ax.plot([cityCoords[8][0], cityCoords[32][0]], [cityCoords[8][1], cityCoords[32][1]], [cityCoords[8][2], cityCoords[32][2]], color='gold')
-        #Osaka, Japan
-        ax.plot([cityCoords[9][0], cityCoords[34][0]], [cityCoords[9][1], cityCoords[34][1]], [cityCoords[9][2], cityCoords[34][2]], color='gold')
-        #New York, USA
-        ax.plot([cityCoords[10][0], cityCoords[38][0]], [cityCoords[10][1], cityCoords[38][1]], [cityCoords[10][2], cityCoords[38][2]], color='gold')
-        ax.plot([cityCoords[10][0], cityCoords[36][0]], [cityCoords[10][1], cityCoords[36][1]], [cityCoords[10][2], cityCoords[36][2]], color='gold')
-        #Karachi, Pakistan
-        ax.plot([cityCoords[11][0], cityCoords[25][0]], [cityCoords[11][1], cityCoords[25][1]], [cityCoords[11][2], cityCoords[25][2]], color='gold')
-        ax.plot([cityCoords[11][0], cityCoords[37][0]], [cityCoords[11][1], cityCoords[37][1]], [cityCoords[11][2], cityCoords[37][2]], color='gold')
-        #Buenos Aires, Argentina
-        ax.plot([cityCoords[12][0], cityCoords[18][0]], [cityCoords[12][1], cityCoords[18][1]], [cityCoords[12][2], cityCoords[18][2]], color='gold')
-        ax.plot([cityCoords[12][0], cityCoords[31][0]], [cityCoords[12][1], cityCoords[31][1]], [cityCoords[12][2], cityCoords[31][2]], color='gold')
-        #Chongqing, China
-        ax.plot([cityCoords[13][0], cityCoords[39][0]], [cityCoords[13][1], cityCoords[39][1]], [cityCoords[13][2], cityCoords[39][2]], color='gold')
-        ax.plot([cityCoords[13][0], cityCoords[21][0]], [cityCoords[13][1], cityCoords[21][1]], [cityCoords[13][2], cityCoords[21][2]], color='gold')
-        #Istanbul, Turkey
-        ax.plot([cityCoords[14][0], cityCoords[23][0]], [cityCoords[14][1], cityCoords[23][1]], [cityCoords[14][2], cityCoords[23][2]], color='gold')
-        ax.plot([cityCoords[14][0], cityCoords[27][0]], [cityCoords[14][1], cityCoords[27][1]], [cityCoords[14][2], cityCoords[27][2]], color='gold')
-        #Kolkata, India
-        ax.plot([cityCoords[15][0], cityCoords[30][0]], [cityCoords[15][1], cityCoords[30][1]], [cityCoords[15][2], cityCoords[30][2]], color='gold')
-        ax.plot([cityCoords[15][0], cityCoords[35][0]], [cityCoords[15][1], cityCoords[35][1]], [cityCoords[15][2], cityCoords[35][2]], color='gold')
-        #Manila, Philippines
-        ax.plot([cityCoords[16][0], cityCoords[29][0]], [cityCoords[16][1], cityCoords[29][1]], [cityCoords[16][2], cityCoords[29][2]], color='gold')
-        ax.plot([cityCoords[16][0], cityCoords[32][0]], [cityCoords[16][1], cityCoords[32][1]], [cityCoords[16][2], cityCoords[32][2]], color='gold')
-        ax.plot([cityCoords[16][0], cityCoords[24][0]], [cityCoords[16][1], cityCoords[24][1]], [cityCoords[16][2], cityCoords[24][2]], color='gold')
-        #Lagos, Nigeria
-        ax.plot([cityCoords[17][0], cityCoords[20][0]], [cityCoords[17][1], cityCoords[20][1]], [cityCoords[17][2], cityCoords[20][2]], color='gold')
-        #Rio de Janeiro (18) (plotted)
-        #Tianjin, China (19) (plotted)
-        #Kinshasa, DR Congo (20) (plotted)
-        #Guangzhou, China
-        ax.plot([cityCoords[21][0], cityCoords[24][0]], [cityCoords[21][1], cityCoords[24][1]], [cityCoords[21][2], cityCoords[24][2]], color='gold')
-        #Los Angeles, USA
-        ax.plot([cityCoords[22][0], cityCoords[38][0]], [cityCoords[22][1], cityCoords[38][1]], [cityCoords[22][2], cityCoords[38][2]], color='gold')
-        #Moscow, Russia
-        ax.plot([cityCoords[23][0], cityCoords[27][0]], [cityCoords[23][1], cityCoords[27][1]], [cityCoords[23][2], cityCoords[27][2]], color='gold')
-        #Shenzhen, China (24) (plotted)
-        #Lahore, Pakistan (25) (plotted)
-        #Bangalore, India
-        ax.plot([cityCoords[26][0], cityCoords[30][0]], [cityCoords[26][1], cityCoords[30][1]], [cityCoords[26][2], cityCoords[30][2]], color='gold')
-        ax.plot([cityCoords[26][0], cityCoords[35][0]], [cityCoords[26][1], cityCoords[35][1]], [cityCoords[26][2], cityCoords[35][2]], color='gold')
-        #Paris, France
-        ax.plot([cityCoords[27][0], cityCoords[36][0]], [cityCoords[27][1], cityCoords[36][1]], [cityCoords[27][2], cityCoords[36][2]], color='gold')
-        #Bogotá, Colombia
-        ax.plot([cityCoords[28][0], cityCoords[31][0]], [cityCoords[28][1], cityCoords[31][1]], [cityCoords[28][2], cityCoords[31][2]], color='gold')
-        #Jakarta, Indonesia
-        ax.plot([cityCoords[29][0], cityCoords[32][0]], [cityCoords[29][1], cityCoords[32][1]], [cityCoords[29][2], cityCoords[32][2]], color='gold')
-        #Chennai, India
-        ax.plot([cityCoords[30][0], cityCoords[35][0]], [cityCoords[30][1], cityCoords[35][1]], [cityCoords[30][2], cityCoords[35][2]], color='gold')
-        #Lima, Peru (31) (plotted)
-        #Bangkok, Thailand (32) (plotted)
-        #Seoul, South Korea (33) (plotted)
-        #Nagoya, Japan (34) (plotted)
-        #Hyderabad, India (35) (plotted)
-        #London, United Kingdom (36) (plotted)
-        #Tehran, Iran (37) (plotted)
-        #Chicago, USA (38) (plotted)
-        #Chengdu, China (39) (plotted)
+        global routeGeometry, routeLine
+        routeGeometry = ArcGeometry([(cityA, cityB) for cityA, edges in cityRoutes.items() for cityB in edges])
+        routeLine, = ax.plot(*routeGeometry.vertices(routeGeometry.select()).T, color='gold')
 
 #Plots red lines/points for cities/routes along the shortest path
+#Returns the plotted artists so they can be removed when another path is shown
 def plotPath(path):
-        #Print highlighted lines/points for each line in the path
-        for i in range(0, len(path)-1):
-                ax.plot([cityCoords[list(longLat.keys()).index(path[i])][0], cityCoords[list(longLat.keys()).index(path[i+1])][0]], 
-                        [cityCoords[list(longLat.keys()).index(path[i])][1], cityCoords[list(longLat.keys()).index(path[i+1])][1]],
-                        [cityCoords[list(longLat.keys()).index(path[i])][2], cityCoords[list(longLat.keys()).index(path[i+1])][2]],
-                        color='red')
-                ax.scatter(cityCoords[list(longLat.keys()).index(path[i])][0], 
-                        cityCoords[list(longLat.keys()).index(path[i])][1], 
-                        cityCoords[list(longLat.keys()).index(path[i])][2], 
-                        color='red')
-        #plot highlighted destination point
-        ax.scatter(cityCoords[list(longLat.keys()).index(path[len(path)-1])][0], 
-                cityCoords[list(longLat.keys()).index(path[len(path)-1])][1], 
-                cityCoords[list(longLat.keys()).index(path[len(path)-1])][2], 
-                color='red')
+        #Every leg of the path is drawn as a great-circle arc in a single line
+        global pathGeometry, pathLine
+        pathGeometry = ArcGeometry(list(zip(path[:-1], path[1:])))
+        pathLine, = ax.plot(*pathGeometry.vertices(pathGeometry.select()).T, color='red')
+        #Highlighted points for each city in the path, including the destination
+        global pathPoints, pathCityLine
+        pathPoints = cities.coordsOf(path)
+        pathCityLine, = ax.plot(*pathPoints.T, marker='o', linestyle='none', color='red')
+        return [pathLine, pathCityLine]
+
+#Earth's radius in km, the same R used to convert the cities' latitude/longitude to (x, y, z)
+EARTH_RADIUS = 6378.1
+#Default camera speed along the path in km per frame
+CAMERA_SPEED = 100
+
+#Converts arrays of decimal latitude/longitude to unit vectors on the sphere
+def unitVectors(latLong):
+        lat = np.radians(latLong[..., 0])
+        long = np.radians(latLong[..., 1])
+        return np.stack([np.cos(lat)*np.cos(long), np.cos(lat)*np.sin(long), np.sin(lat)], axis=-1)
+
+"""
+Lazy sequence of camera rotations [latitude, longitude] along a path.
+Each leg gets frames in proportion to its great-circle length (speed km per frame), and the
+camera moves along the great circle (slerp) rather than straight across raw latitude/longitude,
+so legs across the antimeridian take the short way round.
+Only per-leg data is stored, so memory doesn't grow with the number of frames: frames can be
+iterated in chunks, or looked up directly by index (seeking), and len() is the exact frame count
+"""
+class CameraFrames(object):
+        def __init__(self, path, speed=CAMERA_SPEED, chunkSize=256):
+                self.path = path
+                self.chunkSize = chunkSize
+                self.latLong = cities.latLongOf(path)
+                self.points = unitVectors(self.latLong)
+                #Angle between the two cities of each leg
+                self.omega = np.arccos(np.clip(np.einsum('ij,ij->i', self.points[:-1], self.points[1:]), -1.0, 1.0))
+                self.frameCounts = np.maximum(1, np.ceil(self.omega*EARTH_RADIUS/speed)).astype(np.int64)
+                self.legStarts = np.cumsum(self.frameCounts) - self.frameCounts
+                #Longitude of every city unwrapped along the path, so the camera azimuth
+                #never jumps by 360 degrees at the antimeridian
+                self.cityLongs = np.degrees(np.unwrap(np.radians(self.latLong[:, 1])))
+                #One frame per step of every leg, plus the final destination
+                self.length = int(self.frameCounts.sum()) + 1
+
+        def __len__(self):
+                return self.length
+
+        #Returns the leg and interpolation fraction (0-1) along it of each frame index
+        def legAt(self, i):
+                leg = np.clip(np.searchsorted(self.legStarts, i, side='right') - 1, 0, len(self.omega) - 1)
+                return leg, np.minimum((i - self.legStarts[leg]) / self.frameCounts[leg], 1.0)
+
+        #Returns the camera rotations of frames start to stop (every step-th frame, like range)
+        #as an (n, 2) array
+        def frames(self, start, stop, step=1):
+                indices = np.arange(start, stop, step)
+                #A path with a single city never moves the camera
+                if len(self.omega) == 0:
+                        return np.tile([self.latLong[0, 0], self.cityLongs[0]], (len(indices), 1))
+                leg, t = self.legAt(indices)
+                omega = self.omega[leg]
+                sinOmega = np.sin(omega)
+                #Fall back to linear interpolation for legs too short for slerp to be stable
+                short = sinOmega < 1e-9
+                safeSin = np.where(short, 1.0, sinOmega)
+                weightA = np.where(short, 1 - t, np.sin((1 - t)*omega)/safeSin)
+                weightB = np.where(short, t, np.sin(t*omega)/safeSin)
+                frames = weightA[:, None]*self.points[leg] + weightB[:, None]*self.points[leg + 1]
+
+                lat = np.degrees(np.arcsin(np.clip(frames[:, 2]/np.linalg.norm(frames, axis=1), -1.0, 1.0)))
+                #Wrap each longitude to within 180 degrees of its leg's unwrapped starting city
+                legLong = self.cityLongs[leg]
+                long = np.degrees(np.arctan2(frames[:, 1], frames[:, 0]))
+                long = legLong + (long - legLong + 180) % 360 - 180
+                return np.column_stack([lat, long])
+
+        def __getitem__(self, i):
+                if isinstance(i, slice):
+                        return self.frames(*i.indices(self.length))
+                if i < 0:
+                        i += self.length
+                if not 0 <= i < self.length:
+                        raise IndexError(f"frame {i} out of range for {self.length} frames")
+                return self.frames(i, i + 1)[0]
+
+        #Yields frames one at a time, computing them chunkSize frames at a time
+        def __iter__(self):
+                for start in range(0, self.length, self.chunkSize):
+                        yield from self.frames(start, min(start + self.chunkSize, self.length))
+
+#Builds the camera rotations for the whole path as one (N, 2) array of [latitude, longitude]
+def cameraPath(path, speed=CAMERA_SPEED):
+        return CameraFrames(path, speed)[:]
+
+#Spacing in km between the vertices of the cached great-circle arcs
+ARC_STEP = 50
+#Cache of great-circle arc vertices for each leg, keyed by (cityA, cityB)
+arcCache = {}
+
+#Returns an (n, 3) array of points along the great circle between two (x, y, z) points,
+#with a vertex at least every step km
+def greatCircleArc(start, end, step):
+        start = np.asarray(start, dtype=np.float64)
+        end = np.asarray(end, dtype=np.float64)
+        radius = np.linalg.norm(start)
+        omega = np.arccos(np.clip(np.dot(start, end)/(radius*np.linalg.norm(end)), -1.0, 1.0))
+        t = np.linspace(0, 1, max(2, int(np.ceil(omega*radius/step)) + 1))
+        if np.sin(omega) < 1e-9:
+                return start + t[:, None]*(end - start)
+        return (np.sin((1 - t)*omega)[:, None]*start + np.sin(t*omega)[:, None]*end)/np.sin(omega)
+
+#Returns an (n, 3) array of points along the great circle from cityA to cityB on the
+#surface of the globe. Arcs are computed once and cached, and a leg travelled in the
+#opposite direction reuses the cached arc reversed
+def legArc(cityA, cityB):
+        if (cityA, cityB) in arcCache:
+                return arcCache[(cityA, cityB)]
+        if (cityB, cityA) in arcCache:
+                return arcCache[(cityB, cityA)][::-1]
+        arc = greatCircleArc(cities.coord(cityA), cities.coord(cityB), ARC_STEP)
+        arcCache[(cityA, cityB)] = arc
+        return arc
+
+#Spacing in km between arc vertices at each level of detail, coarsest first
+DETAIL_STEPS = [1000, 250, ARC_STEP]
+#Most vertices the routes, or the path, may draw in a single frame
+VERTEX_BUDGET = 2000
+
+"""
+Great-circle polylines for a list of edges (pairs of cities) at several levels of detail.
+Every level of every arc is stored in one contiguous (n, 3) buffer, with each arc followed by
+a row of NaNs, so any selection of arcs and levels can be drawn as a single line. Level 0 has
+no vertices, for arcs that aren't drawn, and level k is DETAIL_STEPS[k - 1].
+Each frame, select picks a level per arc from the arc's length and whether it faces the
+camera, keeping the total number of vertices within the budget
+"""
+class ArcGeometry(object):
+        def __init__(self, edges, steps=DETAIL_STEPS):
+                self.edges = list(edges)
+                ends = cities.coordsOf([city for edge in self.edges for city in edge]).reshape(-1, 2, 3)
+                self.starts = np.zeros((len(steps) + 1, len(self.edges)), dtype=np.int64)
+                self.counts = np.zeros((len(steps) + 1, len(self.edges)), dtype=np.int64)
+                separator = np.full((1, 3), np.nan)
+                pieces = [np.zeros((0, 3))]
+                offset = 0
+                for level, step in enumerate(steps, 1):
+                        for edge, (start, end) in enumerate(ends):
+                                arc = greatCircleArc(start, end, step)
+                                self.starts[level, edge] = offset
+                                self.counts[level, edge] = len(arc) + 1
+                                pieces += [arc, separator]
+                                offset += len(arc) + 1
+                self.buffer = np.concatenate(pieces)
+
+                #Length of each arc and the unit vector at its middle, for telling which arcs face the camera
+                first = self.buffer[self.starts[-1]]
+                last = self.buffer[self.starts[-1] + self.counts[-1] - 2]
+                middles = self.buffer[self.starts[-1] + (self.counts[-1] - 2)//2]
+                self.middles = middles/np.linalg.norm(middles, axis=1, keepdims=True)
+                cosines = np.einsum('ij,ij->i', first, last)/(np.linalg.norm(first, axis=1)*np.linalg.norm(last, axis=1))
+                self.lengths = np.arccos(np.clip(cosines, -1.0, 1.0))*EARTH_RADIUS
+                #Every point of an arc is within half its length of its middle
+                self.halfAngles = self.lengths/EARTH_RADIUS/2
+
+        #Returns a level of detail for every arc. Arcs wholly past the horizon of view (a unit
+        #vector toward the camera) get level 0 and no vertices. The others are given the
+        #coarsest level, then refined, the longest arcs facing the camera first, while the
+        #vertex count stays within budget. If even the coarsest level of every visible arc
+        #doesn't fit, the least important arcs are left out
+        def select(self, view=None, budget=VERTEX_BUDGET):
+                levels = np.zeros(len(self.edges), dtype=np.int64)
+                used = 0
+                if view is None:
+                        facing = np.ones(len(self.edges))
+                        visible = np.ones(len(self.edges), dtype=bool)
+                else:
+                        facing = self.middles @ view
+                        #Past the horizon means the angle to view is over 90 degrees plus the
+                        #HORIZON_MARGIN that cullBackFacing still draws
+                        horizon = np.pi/2 + np.arcsin(HORIZON_MARGIN)
+                        visible = np.arccos(np.clip(facing, -1.0, 1.0)) - self.halfAngles < horizon
+                importance = self.lengths*np.maximum(facing, 0)
+                candidates = np.flatnonzero(visible)
+                candidates = candidates[np.argsort(-importance[candidates], kind='stable')]
+                for level in range(1, len(self.counts)):
+                        extra = self.counts[level, candidates] - self.counts[level - 1, candidates]
+                        #Finer levels never have fewer vertices, so the arcs that fit are a prefix
+                        fits = np.cumsum(extra) <= budget - used
+                        used += extra[fits].sum()
+                        candidates = candidates[fits]
+                        levels[candidates] = level
+                return levels
+
+        #Returns the vertices of every arc at the given levels as one (n, 3) array
+        def vertices(self, levels):
+                edges = np.arange(len(self.edges))
+                starts = self.starts[levels, edges]
+                counts = self.counts[levels, edges]
+                offsets = np.cumsum(counts) - counts
+                return self.buffer[np.repeat(starts - offsets, counts) + np.arange(counts.sum())]
+
+#Route and path geometry and their lines, set by plotRoutes and plotPath
+routeGeometry = routeLine = None
+pathGeometry = pathLine = None
+#Points and lines of the cities, path cities and landmasses, set by plotCities, plotPath and plotLandmass
+cityPoints = cityLine = None
+pathPoints = pathCityLine = None
+landmassPoints = landmassLine = None
+#(points, line) of the overlays other modules plot with plotCulled (isochrones, depots,
+#betweenness), culled by updateScene like the cities
+overlayLines = []
+
+#How far past the horizon (as a fraction of the radius) geometry is still drawn, so lines
+#don't visibly stop short of the edge of the globe
+HORIZON_MARGIN = 0.05
+
+#Replaces every point on the far side of the globe from view (a unit vector toward the
+#camera) with NaN, which matplotlib skips when drawing, using a single dot product
+def cullBackFacing(points, view):
+        visible = points @ view > -HORIZON_MARGIN*EARTH_RADIUS
+        return np.where(visible[:, None], points, np.nan)
+
+#Plots (x, y, z) points as a line with the given matplotlib style (markers only unless a
+#linestyle is given) and registers it with updateScene, so its points on the far side of the
+#globe are hidden. Returns the line
+def plotCulled(points, **style):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        style.setdefault('linestyle', 'none')
+        line, = ax.plot(*points.T, **style)
+        overlayLines.append((points, line))
+        return line
+
+#Redraws the scene for a camera centered on lat/long: routes and path at the level of detail
+#for the view, and only the cities, routes, path and landmasses on the near side of the globe
+def updateScene(lat, long):
+        view = unitVectors(np.array([lat, long]))
+        for geometry, line in ((routeGeometry, routeLine), (pathGeometry, pathLine)):
+                if geometry is not None:
+                        line.set_data_3d(*cullBackFacing(geometry.vertices(geometry.select(view)), view).T)
+        for points, line in [(cityPoints, cityLine), (pathPoints, pathCityLine), (landmassPoints, landmassLine)] + overlayLines:
+                if line is not None:
+                        line.set_data_3d(*cullBackFacing(points, view).T)
+
+#Returns Santa's (x, y, z) position at frame i, following the cached arc of the current leg
+def santaPosition(frames, i):
+        if len(frames.path) < 2:
+                return cities.coord(frames.path[0])
+        leg, t = frames.legAt(i)
+        arc = legArc(frames.path[leg], frames.path[leg + 1])
+        #Interpolate between the two arc vertices either side of Santa
+        position = t*(len(arc) - 1)
+        vertex = min(int(position), len(arc) - 2)
+        fraction = position - vertex
+        return arc[vertex]*(1 - fraction) + arc[vertex + 1]*fraction
 
 def makeAnimation(path):
-        #Array to store all animation frames 
-        global animationArray
-        animationArray = []
-        #For each city in the path, calculate the degree of rotation for the frame in the animation
-        for i in range(0, len(path)-1):
-                longDiff = longLat[path[i+1]][0] - longLat[path[i]][0]
-                latDiff = longLat[path[i+1]][1] - longLat[path[i]][1]
-                longInc = longDiff/10
-                latInc = latDiff/10
-                #appends the rotation of the starting city for each move
-                animationArray.append([longLat[path[i]][0], longLat[path[i]][1]])
-                #for 10 frames
-                for j in range(1, 11):
-                        #appends rotation for each frame incremented by longInc and latInc
-                        #to arrie at the destination in 10 frames
-                        animationArray.append([longLat[path[i]][0] + longInc*j, longLat[path[i]][1] + latInc*j])
+        #Lazy source of animation frames as [latitude, longitude] camera rotations
+        global cameraFrames
+        cameraFrames = CameraFrames(path)
+        #Santa's marker is created once, each frame only moves it
+        global santaMarker
+        if santaMarker is None:
+                santaMarker, = ax.plot([], [], [], marker='*', markersize=14, color='crimson',
+                                       markeredgecolor='white', linestyle='none', zorder=10)
+
+#Marker showing Santa's position, created by the first call to makeAnimation
+santaMarker = None
+
+#Returns the city picked by the user: by its number in the menu, by a "latitude, longitude"
+#that is snapped to the nearest city, or by (part of) its name, which may be misspelled
+def pickCity(choice):
+        choice = choice.strip()
+        if choice.isdigit():
+                return cities.name(int(choice))
+        try:
+                lat, long = (float(value) for value in choice.split(","))
+        except ValueError:
+                return findCity(choice)
+        global cityIndex
+        if cityIndex is None:
+                from SantaSpatial import CityIndex
+                cityIndex = CityIndex(cities.names, cities.latLong, radius=EARTH_RADIUS)
+        city, distance = cityIndex.snap(lat, long)
+        print(f"Nearest city: {city} ({distance:.2f}km away)")
+        return city
+
+#Returns the best match for a typed city name, e.g. "sao paulo" or "Bangkock"
+def findCity(name):
+        global nameIndex
+        if nameIndex is None:
+                from SantaNames import NameIndex
+                nameIndex = NameIndex(cities.names)
+        matches = nameIndex.search(name, 1)
+        if not matches:
+                raise KeyError(name)
+        print(f"Matched city: {matches[0]}")
+        return matches[0]
+
+#Spatial index used to snap coordinates to cities, built the first time it's needed
+cityIndex = None
+#Search index of the city names, built the first time a name is typed
+nameIndex = None
 
 def main():
         print("\n                      ╔══════════════════╗")
@@ -1302,18 +1234,20 @@ path between them so Santa can deliver presents on time.""")
                         37. Tehran, Iran
                         38. Chicago, USA
                         39. Chengdu, China\n""")
+        print("   Or type a city's name, or a latitude, longitude to start from")
+        print("                       the nearest city")
         print(  "═══════════════════════════════════════════════════════════════\n")
 
         #Get origin city and destination from user input
         while (True):
                 try:
                         source = input("Origin: ")
-                        sourceCity = list(longLat.keys())[int(source)]
+                        sourceCity = pickCity(source)
                         destination = input("Destination: ")
-                        destinationCity = list(longLat.keys())[int(destination)]
+                        destinationCity = pickCity(destination)
                         break
                 except:
-                        print("Please input numbers between 0-39")
+                        print("Please input numbers between 0-39, a city name, or a latitude, longitude")
                         
         #Plot base city/land/route layout
         plotCities()
@@ -1321,27 +1255,41 @@ path between them so Santa can deliver presents on time.""")
         plotRoutes()
         #Initialize graph with set cityRoutes
         graph = Graph(nodes, cityRoutes)
+        #Cities in different components can't be reached, so don't search at all
+        if not graph.connected(sourceCity, destinationCity):
+                print(f"\nBah humbug! There is no route from {sourceCity} to {destinationCity}.\n")
+                sys.exit()
         #Calculate all shortestPaths from the source
         prevNodeInPath, shortestDistance = dijkstra_algorithm(graph=graph, source=sourceCity)
         #Declare path array to hold order of cities to travel from source -> destination
         global path
-        path = printPath(prevNodeInPath, shortestDistance, source=sourceCity, destination=destinationCity).copy()
+        path = printPath(prevNodeInPath, shortestDistance, source=sourceCity, destination=destinationCity)
+        #printPath has already said there's no route
+        if path is None:
+                sys.exit()
         #Plot red path highlighting the shortest path
         plotPath(path)
-        #Prepare animationArray for animating
+        #Prepare cameraFrames for animating
         makeAnimation(path)
 
-main()
-
 #azimuth: latitude
 #elevation: longitude
 #Animate rotation
 def animate(i):
-        ax.view_init(azim=animationArray[i%len(animationArray)][1], elev=animationArray[i%len(animationArray)][0])
+        lat, long = cameraFrames[i%len(cameraFrames)]
+        ax.view_init(azim=long, elev=lat)
+        updateScene(lat, long)
+        x, y, z = santaPosition(cameraFrames, i%len(cameraFrames))
+        santaMarker.set_data_3d([x], [y], [z])
         ax.set_title(f'{path[0]} to {path[len(path)-1]}')
         return fig,
 
-anim = animation.FuncAnimation(fig, animate,
-                                frames=len(path)*10, interval=5, blit=False)
+#Only run the program when executed directly, so the graph, coordinates and
+#plotting functions can be imported by the other Santa modules
+if __name__ == "__main__":
+        main()
+
+        anim = animation.FuncAnimation(fig, animate,
+                                        frames=len(cameraFrames), interval=5, blit=False)
 
-plt.show()
+        plt.show()
@@ -0,0 +1,238 @@
+import numpy as np
+
+import json, math, os, shutil, sys, tempfile, time
+
+from SantaGraph import Graph, dijkstra_algorithm, nodes, cityRoutes, cities, longLat
+from SantaSearch import shortestRoute, tracePath
+from SantaEngine import QueryEngine
+from SantaLandmarks import Landmarks, landmarkRoute
+from SantaDelta import DeltaStepping
+from SantaMatrix import distanceMatrix
+from SantaSnapshot import writeGraphSnapshot, loadSnapshot
+from SantaSynthetic import SyntheticGraph
+
+"""
+Correctness and performance regression harness for the routing engines.
+Every engine answers the same queries as dijkstra_algorithm: all 1,560 ordered pairs of the
+demo cities, and a seeded sample of pairs on small synthetic graphs. Distances (and which
+cities are unreachable) must match dijkstra_algorithm's, and every path an engine returns must
+be a real route from source to destination adding up to its distance, so engines breaking ties
+differently still pass. Each engine's time per graph (setup included, best of REPEATS runs) is
+compared with a stored baseline, and the run fails if an engine got more than SLOWDOWN slower.
+python SantaHarness.py checks; python SantaHarness.py --update records a new baseline
+"""
+
+#Relative difference allowed between distances, so tied routes summed in a different order still match
+TOLERANCE = 1e-9
+#An engine fails if it's this much slower than its baseline (1.0 is twice as slow; shared machines are noisy)...
+SLOWDOWN = 1.0
+#...and at least this many seconds slower, so timer noise on fast engines doesn't fail the run
+MIN_SLOWDOWN = 0.02
+#Timed runs of each engine; the fastest one is compared with the baseline
+REPEATS = 3
+#Origins per task handed to distanceMatrix's worker processes
+MATRIX_CHUNK = 2
+#(cities, seed, sources, destinations per source) of the synthetic graphs
+SYNTHETIC = [(400, 0, 8, 40), (400, 1, 8, 40)]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SantaHarness.json")
+
+#Each engine takes the graph, the same graph loaded from a snapshot and the {source: destinations}
+#queries it will be asked, and returns a function answering one source's queries:
+#routes(source, destinations) -> [(distance, path) or None]. Engines that only compute
+#distances return a path of None
+
+#The original O(V^2) search the other engines are checked against
+def dijkstraEngine(graph, snapshot, queries):
+        def routes(source, destinations):
+                prevNodeInPath, shortestDistance = dijkstra_algorithm(graph, source)
+                return [None if shortestDistance[destination] == sys.maxsize
+                        else (shortestDistance[destination], tracePath(prevNodeInPath, source, destination))
+                        for destination in destinations]
+        return routes
+
+def heapEngine(graph, snapshot, queries):
+        return lambda source, destinations: [shortestRoute(graph, source, destination) for destination in destinations]
+
+def queryEngine(graph, snapshot, queries):
+        engine = QueryEngine(graph)
+        return lambda source, destinations: [engine.route(source, destination) for destination in destinations]
+
+def landmarkEngine(graph, snapshot, queries):
+        landmarks = Landmarks(graph, 4)
+        return lambda source, destinations: [landmarkRoute(graph, source, destination, landmarks) for destination in destinations]
+
+#The same with the half-size float32 table, whose rounding must not break the bounds
+def landmark32Engine(graph, snapshot, queries):
+        landmarks = Landmarks(graph, 4, dtype=np.float32)
+        return lambda source, destinations: [landmarkRoute(graph, source, destination, landmarks) for destination in destinations]
+
+def snapshotEngine(graph, snapshot, queries):
+        return lambda source, destinations: [shortestRoute(snapshot, source, destination) for destination in destinations]
+
+def deltaEngine(graph, snapshot, queries):
+        engine = DeltaStepping(graph)
+        def routes(source, destinations):
+                prevNodeInPath, shortestDistance = engine.search(source)
+                return [None if shortestDistance[destination] == sys.maxsize
+                        else (shortestDistance[destination], tracePath(prevNodeInPath, source, destination))
+                        for destination in destinations]
+        return routes
+
+#distanceMatrix computes every query of a graph in one call, so with workers >= 2 the rows are
+#split between worker processes sharing the arrays through shared memory. Rows are handed out
+#MATRIX_CHUNK at a time so every worker gets some even on the 8 source synthetic graphs
+def matrixEngine(workers):
+        def engine(graph, snapshot, queries):
+                sources = list(queries)
+                destinations = list(dict.fromkeys(destination for targets in queries.values() for destination in targets))
+                matrix = distanceMatrix(graph, sources, destinations, workers=workers, chunkSize=MATRIX_CHUNK)
+                rows = dict(zip(sources, matrix.tolist()))
+                column = {destination: j for j, destination in enumerate(destinations)}
+                def routes(source, targets):
+                        row = rows[source]
+                        return [(row[column[target]], None) if math.isfinite(row[column[target]]) else None for target in targets]
+                return routes
+        return engine
+
+#dijkstra_algorithm comes first: its answers are the expected ones
+ENGINES = {"dijkstra_algorithm": dijkstraEngine,
+           "shortestRoute": heapEngine,
+           "QueryEngine": queryEngine,
+           "landmarkRoute": landmarkEngine,
+           "landmarkRoute float32": landmark32Engine,
+           "Snapshot": snapshotEngine,
+           "DeltaStepping": deltaEngine,
+           "distanceMatrix": matrixEngine(1),
+           "distanceMatrix 2 workers": matrixEngine(2)}
+
+#Returns the graphs to check as (label, graph, snapshot, {source: destinations}). Snapshots
+#are written to directory
+def harnessCases(directory):
+        cases = []
+        graph = Graph(nodes, cityRoutes)
+        path = os.path.join(directory, "demo.snap")
+        writeGraphSnapshot(path, graph, cities.coordsOf(nodes), longLat)
+        queries = {source: [destination for destination in nodes if destination != source] for source in nodes}
+        cases.append(("Demo", graph, loadSnapshot(path), queries))
+
+        for count, seed, sourceCount, destinationCount in SYNTHETIC:
+                synthetic = SyntheticGraph(count, seed=seed)
+                path = os.path.join(directory, f"synthetic{count}-{seed}.snap")
+                synthetic.writeSnapshot(path)
+                names = synthetic.get_names()
+                #Every city is picked with the same step from a seeded start, so the queries never change
+                queries = {names[(seed + 97*i) % count]: [names[(seed + 31*i + 7*j + 1) % count] for j in range(destinationCount)]
+                           for i in range(sourceCount)}
+                cases.append((f"Synthetic {count} (seed {seed})", synthetic.toGraph()[0], loadSnapshot(path), queries))
+        return cases
+
+#Returns None if found is a correct answer for the route from source to destination, or else
+#what's wrong with it. expected is dijkstra_algorithm's (distance, path), or None if unreachable
+def checkRoute(graph, source, destination, expected, found):
+        if expected is None or found is None:
+                return None if expected is found else f"expected {expected and expected[0]}, got {found and found[0]}"
+        distance, path = found
+        if abs(distance - expected[0]) > TOLERANCE*max(1.0, abs(expected[0])):
+                return f"expected {expected[0]!r}km, got {distance!r}km"
+        if path is None:
+                return None
+        if path[0] != source or path[-1] != destination:
+                return f"path runs from {path[0]} to {path[-1]}"
+        try:
+                length = sum(graph.value(cityA, cityB) for cityA, cityB in zip(path, path[1:]))
+        except KeyError:
+                return "path uses a route that doesn't exist"
+        if abs(length - distance) > TOLERANCE*max(1.0, abs(distance)):
+                return f"path is {length!r}km long, not {distance!r}km"
+        return None
+
+#Returns a list of the queries where a landmark lower bound (float64 or float32 table) is
+#larger than dijkstra_algorithm's distance. Such a bound only changes the route A* returns
+#when it's off by enough, so the bounds are checked directly
+def checkBounds(graph, queries, expected):
+        wrong = []
+        for dtype in (np.float64, np.float32):
+                landmarks = Landmarks(graph, 4, dtype=dtype)
+                for source, destinations in queries.items():
+                        for destination, right in zip(destinations, expected[source]):
+                                bound = landmarks.heuristic(destination)(source)
+                                if right is not None and bound > right[0]:
+                                        wrong.append(f"{np.dtype(dtype).name} bound {source} -> {destination} is {bound!r}km, over {right[0]!r}km")
+        return wrong
+
+#Runs every engine over every case. Returns {label: {engine: seconds}} and a list of failures
+#(wrong answers and inadmissible landmark bounds) as strings
+def runHarness(cases, engines=ENGINES, repeats=REPEATS):
+        timings = {}
+        failures = []
+        for label, graph, snapshot, queries in cases:
+                timings[label] = {}
+                expected = None
+                for name, engine in engines.items():
+                        best = math.inf
+                        for _ in range(repeats):
+                                start = time.perf_counter()
+                                routes = engine(graph, snapshot, queries)
+                                answers = {source: routes(source, destinations) for source, destinations in queries.items()}
+                                best = min(best, time.perf_counter() - start)
+                        timings[label][name] = best
+                        if expected is None:
+                                expected = answers
+                                continue
+                        wrong = [(source, destination, problem) for source, destinations in queries.items()
+                                 for destination, right, found in zip(destinations, expected[source], answers[source])
+                                 for problem in [checkRoute(graph, source, destination, right, found)] if problem]
+                        for source, destination, problem in wrong[:5]:
+                                failures.append(f"{label}: {name} {source} -> {destination}: {problem}")
+                        if len(wrong) > 5:
+                                failures.append(f"{label}: {name} has {len(wrong) - 5} more wrong answers")
+                if expected is not None:
+                        wrong = checkBounds(graph, queries, expected)
+                        failures += [f"{label}: landmark {problem}" for problem in wrong[:5]]
+                        if len(wrong) > 5:
+                                failures.append(f"{label}: {len(wrong) - 5} more landmark bounds are too large")
+        return timings, failures
+
+#Returns a list of the engines more than SLOWDOWN slower than in baseline, as strings
+def compareTimings(timings, baseline, slowdown=SLOWDOWN):
+        slower = []
+        for label, engines in timings.items():
+                for name, seconds in engines.items():
+                        before = baseline.get(label, {}).get(name)
+                        if before is not None and seconds > before*(1 + slowdown) and seconds - before > MIN_SLOWDOWN:
+                                slower.append(f"{label}: {name} took {seconds:.3f}s, {seconds/before:.2f}x its baseline of {before:.3f}s")
+        return slower
+
+#Prints the timings next to the baseline, then the failures. Exits with status 1 on any wrong
+#answer or slowdown, so it can gate a change: python SantaHarness.py [--update]
+if __name__ == "__main__":
+        directory = tempfile.mkdtemp()
+        try:
+                cases = harnessCases(directory)
+                timings, failures = runHarness(cases)
+                for _, _, snapshot, _ in cases:
+                        snapshot.close()
+        finally:
+                shutil.rmtree(directory)
+
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+                with open(BASELINE_PATH) as file:
+                        baseline = json.load(file)
+        for label, engines in timings.items():
+                print(label)
+                for name, seconds in engines.items():
+                        before = baseline.get(label, {}).get(name)
+                        compared = f" (baseline {before:.3f}s, {seconds/before:.2f}x)" if before else ""
+                        print(f"  {name:>24}: {seconds:.3f}s{compared}")
+
+        if "--update" in sys.argv[1:]:
+                with open(BASELINE_PATH, "w") as file:
+                        json.dump(timings, file, indent=2)
+                print(f"Wrote the baseline to {BASELINE_PATH}")
+        else:
+                failures += compareTimings(timings, baseline)
+        for failure in failures:
+                print(failure)
+        print("FAILED" if failures else "OK")
+        sys.exit(1 if failures else 0)
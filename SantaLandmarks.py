@@ -0,0 +1,158 @@
+import numpy as np
+
+import heapq, sys, time
+
+from SantaSearch import boundedSearch, tracePath
+
+"""
+ALT (A*, Landmarks and the Triangle inequality) route search.
+A few landmark cities are picked far apart from each other, and the exact route distance from
+every landmark to every city is stored in one (cities, landmarks) array. For any landmark L,
+the triangle inequality gives |d(L, target) - d(L, city)| <= d(city, target), so the largest of
+these over the landmarks is a lower bound on the remaining distance that A* can use to head
+for the destination. Unlike the straight-line distance, it follows the routes, so detours
+around oceans don't mislead it. More landmarks give tighter bounds for more memory
+"""
+class Landmarks(object):
+        #count landmarks are picked by farthest-point selection. dtype=np.float32 halves the
+        #table; the bounds are lowered by its rounding error so they stay admissible
+        def __init__(self, graph, count=8, dtype=np.float64, distances=None, landmarks=None):
+                self.nodes = list(graph.get_nodes())
+                self.index = {node: i for i, node in enumerate(self.nodes)}
+                if distances is not None:
+                        self.landmarks = [self.nodes[i] for i in landmarks]
+                        self.distances = np.asarray(distances)
+                        self.slack = self.roundingSlack()
+                        return
+
+                columns = []
+                self.landmarks = []
+                #Distance from each city to its closest landmark so far (inf when no landmark reaches it)
+                closest = np.full(len(self.nodes), np.inf)
+                for _ in range(min(count, len(self.nodes))):
+                        #The first landmark is the city furthest from the first node, then each
+                        #next one is the city furthest from every landmark picked so far. A city
+                        #no landmark reaches yet (another island) is picked before any other
+                        if not self.landmarks:
+                                start = self.column(graph, self.nodes[0])
+                                landmark = self.nodes[int(np.argmax(np.where(np.isfinite(start), start, -1)))]
+                        else:
+                                unreached = np.flatnonzero(np.isinf(closest))
+                                landmark = self.nodes[unreached[0] if len(unreached) else int(np.argmax(closest))]
+                        if landmark in self.landmarks:
+                                break
+                        column = self.column(graph, landmark)
+                        columns.append(column)
+                        closest = np.minimum(closest, column)
+                        self.landmarks.append(landmark)
+
+                table = np.column_stack(columns) if columns else np.zeros((len(self.nodes), 0))
+                self.distances = np.ascontiguousarray(table.astype(dtype))
+                self.slack = self.roundingSlack()
+
+        #Returns how much each landmark's bounds are lowered to stay admissible. Storing a
+        #distance in the table's dtype moves it by at most half a unit in the last place of the
+        #landmark's largest distance, so a difference of two of them is off by at most one.
+        #Twice that also covers rounding the difference
+        def roundingSlack(self):
+                if not self.distances.size:
+                        return np.zeros(self.distances.shape[1])
+                finite = np.where(np.isfinite(self.distances), self.distances, 0)
+                return 2*np.spacing(finite.max(axis=0)).astype(np.float64)
+
+        #Returns the exact distance from landmark to every city (inf if unreachable)
+        def column(self, graph, landmark):
+                column = np.full(len(self.nodes), np.inf)
+                for node, distance in boundedSearch(graph, landmark)[1].items():
+                        column[self.index[node]] = distance
+                return column
+
+        #Returns the bytes used by the distance table
+        def nbytes(self):
+                return self.distances.nbytes
+
+        #Returns a function giving a lower bound on the route distance from a city to target
+        def heuristic(self, target):
+                distances = self.distances
+                index = self.index
+                slack = self.slack
+                targetRow = distances[index[target]].astype(np.float64)
+                def bound(node):
+                        #Landmarks that reach neither city give NaN, which fmax skips
+                        gap = np.fmax.reduce(np.abs(distances[index[node]] - targetRow) - slack)
+                        return 0.0 if not gap > 0 else float(gap)
+                return bound
+
+        #Returns the table and landmark ids as arrays to store with writeSnapshot(tables=...)
+        def tables(self):
+                return {"landmarkDistances": self.distances,
+                        "landmarkIds": np.array([self.index[landmark] for landmark in self.landmarks], dtype=np.int32)}
+
+#Loads the landmarks stored with a snapshot, or returns None if it has none. The table is
+#read straight from the memory map
+def loadLandmarks(snapshot):
+        distances = snapshot.getTable("landmarkDistances")
+        if distances is None:
+                return None
+        return Landmarks(snapshot, distances=distances, landmarks=snapshot.getTable("landmarkIds"))
+
+#A* from source to target, guided by the landmark lower bounds. Returns prevNodeInPath and
+#shortestDistance like boundedSearch (shortestDistance holds the settled cities)
+def landmarkSearch(graph, source, target, landmarks):
+        bound = landmarks.heuristic(target)
+        shortestDistance = {}
+        prevNodeInPath = {}
+        frontier = {source: 0}
+        #Queue entries are (distance + lower bound, distance, city)
+        queue = [(bound(source), 0, source)]
+        while queue:
+                _, distance, node = heapq.heappop(queue)
+                if node in shortestDistance:
+                        continue
+                shortestDistance[node] = distance
+                if node == target:
+                        break
+                for neighbor in graph.getNeighbors(node):
+                        if neighbor in shortestDistance:
+                                continue
+                        newDistance = distance + graph.value(node, neighbor)
+                        if newDistance < frontier.get(neighbor, sys.maxsize):
+                                frontier[neighbor] = newDistance
+                                prevNodeInPath[neighbor] = node
+                                heapq.heappush(queue, (newDistance + bound(neighbor), newDistance, neighbor))
+        return prevNodeInPath, shortestDistance
+
+#Returns the shortest route from source to destination as (distance, path) using ALT,
+#or None if the destination can't be reached
+def landmarkRoute(graph, source, destination, landmarks):
+        if not graph.connected(source, destination):
+                return None
+        prevNodeInPath, shortestDistance = landmarkSearch(graph, source, destination, landmarks)
+        if destination not in shortestDistance:
+                return None
+        return shortestDistance[destination], tracePath(prevNodeInPath, source, destination)
+
+#Compares cities settled and query time between Dijkstra and ALT with more and more landmarks
+#on a synthetic graph: python SantaLandmarks.py [cities] [queries]
+if __name__ == "__main__":
+        from SantaSnapshot import loadSnapshot
+        from SantaSynthetic import SyntheticGraph
+
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+        queryCount = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+        SyntheticGraph(count, seed=0).writeSnapshot("SantaLandmarks.snap")
+        graph = loadSnapshot("SantaLandmarks.snap")
+        rng = np.random.default_rng(1)
+        pairs = [(graph.name(a), graph.name(b)) for a, b in rng.integers(0, count, (queryCount, 2))]
+
+        start = time.perf_counter()
+        settled = sum(len(boundedSearch(graph, source, target=destination)[1]) for source, destination in pairs)
+        print(f"Dijkstra:      {settled/queryCount:8.0f} cities settled, {1000*(time.perf_counter() - start)/queryCount:7.2f}ms per query")
+        for landmarkCount in (1, 4, 8, 16):
+                start = time.perf_counter()
+                landmarks = Landmarks(graph, landmarkCount, dtype=np.float32)
+                built = time.perf_counter() - start
+                start = time.perf_counter()
+                settled = sum(len(landmarkSearch(graph, source, destination, landmarks)[1]) for source, destination in pairs)
+                print(f"{landmarkCount:2} landmarks: {settled/queryCount:8.0f} cities settled, {1000*(time.perf_counter() - start)/queryCount:7.2f}ms per query"
+                      f" ({landmarks.nbytes()/1024:.0f}KB table built in {built:.2f}s)")
@@ -0,0 +1,146 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import heapq, math, os, sys, time
+
+"""
+Many-to-many route distance matrices computed across a process pool.
+The graph's CSR arrays and the result matrix live in shared memory: every worker attaches to
+them by name once, runs a single-source search for each origin in its chunk of rows and writes
+the distances straight into its rows of the matrix. Nothing but the row ranges is pickled, so
+workers scale with cores until the searches are bound by memory bandwidth
+"""
+
+#Shared arrays attached by each worker process, set once per worker by initWorker
+workerArrays = None
+
+#Returns the graph's CSR arrays (indptr, indices, weights): straight from a Snapshot,
+#from Graph.toCSR, or built through the get_nodes/getNeighbors/value interface
+def csrArrays(graph):
+        if hasattr(graph, "indptr"):
+                return graph.indptr, graph.indices, graph.weights
+        if hasattr(graph, "toCSR"):
+                return graph.toCSR()
+        nodes = list(graph.get_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        indptr = [0]
+        indices = []
+        weights = []
+        for node in nodes:
+                for neighbor in graph.getNeighbors(node):
+                        indices.append(index[neighbor])
+                        weights.append(graph.value(node, neighbor))
+                indptr.append(len(indices))
+        return np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int32), np.array(weights, dtype=np.float64)
+
+#Copies an array into a new shared memory block. Returns the block and a view of it
+def shareArray(array):
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        return block, view
+
+#Attaches a worker to the shared arrays. specs maps each array's name to its
+#(shared memory name, dtype, shape)
+def initWorker(specs):
+        global workerArrays
+        workerArrays = {}
+        for name, (blockName, dtype, shape) in specs.items():
+                block = shared_memory.SharedMemory(name=blockName)
+                #Keep the block open for as long as the worker uses the view
+                workerArrays[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+#Fills rows start:stop of the shared matrix, one Dijkstra search per origin. Each search stops
+#once every destination has been settled
+def fillRows(start, stop, arrays=None):
+        arrays = arrays or {name: view for name, (_, view) in workerArrays.items()}
+        indptr, indices, weights = arrays["indptr"], arrays["indices"], arrays["weights"]
+        origins, destinations, matrix = arrays["origins"], arrays["destinations"], arrays["matrix"]
+        nodeCount = len(indptr) - 1
+        targets = set(destinations.tolist())
+        for row in range(start, stop):
+                distances = [math.inf]*nodeCount
+                settled = [False]*nodeCount
+                remaining = len(targets)
+                source = int(origins[row])
+                distances[source] = 0.0
+                queue = [(0.0, source)]
+                while queue and remaining:
+                        distance, node = heapq.heappop(queue)
+                        if settled[node]:
+                                continue
+                        settled[node] = True
+                        if node in targets:
+                                remaining -= 1
+                        first, last = indptr[node], indptr[node + 1]
+                        for neighbor, weight in zip(indices[first:last].tolist(), weights[first:last].tolist()):
+                                newDistance = distance + weight
+                                if newDistance < distances[neighbor]:
+                                        distances[neighbor] = newDistance
+                                        heapq.heappush(queue, (newDistance, neighbor))
+                matrix[row] = np.array(distances)[destinations]
+        return stop - start
+
+#Returns the (len(origins), len(destinations)) matrix of route distances between cities,
+#with inf where there's no route. Origins are split into chunks of chunkSize rows across
+#worker processes (workers=1 runs in this process)
+def distanceMatrix(graph, origins, destinations, workers=None, chunkSize=8):
+        nodes = list(graph.get_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        indptr, indices, weights = csrArrays(graph)
+        arrays = {"indptr": np.asarray(indptr, dtype=np.int64),
+                  "indices": np.asarray(indices, dtype=np.int32),
+                  "weights": np.asarray(weights, dtype=np.float64),
+                  "origins": np.array([index[city] for city in origins], dtype=np.int64),
+                  "destinations": np.array([index[city] for city in destinations], dtype=np.int64),
+                  "matrix": np.full((len(origins), len(destinations)), np.inf)}
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+                fillRows(0, len(origins), arrays)
+                return arrays["matrix"]
+
+        blocks = []
+        try:
+                specs = {}
+                for name, array in arrays.items():
+                        block, arrays[name] = shareArray(array)
+                        blocks.append(block)
+                        specs[name] = (block.name, arrays[name].dtype.str, arrays[name].shape)
+                starts = range(0, len(origins), chunkSize)
+                stops = [min(start + chunkSize, len(origins)) for start in starts]
+                with ProcessPoolExecutor(max_workers=workers, initializer=initWorker, initargs=(specs,)) as pool:
+                        list(pool.map(fillRows, starts, stops))
+                return arrays["matrix"].copy()
+        finally:
+                arrays.clear()
+                for block in blocks:
+                        block.close()
+                        block.unlink()
+
+#Times a distance matrix between random cities of a synthetic graph with 1, 2, 4 ... workers
+#up to the number of cores: python SantaMatrix.py [cities] [origins/destinations]
+if __name__ == "__main__":
+        from SantaSynthetic import SyntheticGraph
+        from SantaSnapshot import loadSnapshot
+
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+        size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+        SyntheticGraph(count, seed=0).writeSnapshot("SantaMatrix.snap")
+        graph = loadSnapshot("SantaMatrix.snap")
+        rng = np.random.default_rng(1)
+        origins = [graph.name(i) for i in rng.choice(count, size, replace=False)]
+        destinations = [graph.name(i) for i in rng.choice(count, size, replace=False)]
+
+        baseline = None
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+                start = time.perf_counter()
+                matrix = distanceMatrix(graph, origins, destinations, workers=workers)
+                seconds = time.perf_counter() - start
+                baseline = baseline or seconds
+                print(f"{workers:2} workers: {size}x{size} matrix in {seconds:.2f}s ({baseline/seconds:.2f}x)")
+                workers *= 2
+        print(f"{np.isfinite(matrix).mean():.1%} of pairs have a route")
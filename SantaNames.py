@@ -0,0 +1,132 @@
+import numpy as np
+
+import bisect, math, random, sys, time, unicodedata
+
+"""
+Search index over city names, built once when the names are loaded.
+Names are normalized (accents stripped, case folded, punctuation collapsed to spaces) so
+"Sao Paulo" finds "São Paulo, Brazil".
+  - Prefix search binary searches a sorted array holding the normalized name from the start
+    of every word, so "paulo" and "sao pa" both find São Paulo in O(log(V)).
+  - Fuzzy search scores names by the trigrams (three letter pieces) they share with the query,
+    using posting lists of the names containing each trigram, so typos still find a match
+"""
+
+#Returns a name without accents, in lower case, with every run of punctuation or spaces as one space
+def normalize(name):
+        decomposed = unicodedata.normalize("NFKD", name)
+        stripped = "".join(character for character in decomposed if not unicodedata.combining(character)).casefold()
+        return " ".join("".join(character if character.isalnum() else " " for character in stripped).split())
+
+#Returns the set of trigrams of a normalized name, padded so word starts count more
+def trigrams(key):
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameIndex(object):
+        def __init__(self, names):
+                self.names = list(names)
+                normalized = [normalize(name) for name in self.names]
+
+                #Sorted (key, id) pairs with a key starting at every word of every name
+                entries = sorted((key[start:], i) for i, key in enumerate(normalized)
+                                 for start in [0] + [k + 1 for k, character in enumerate(key) if character == " "])
+                self.keys = [key for key, _ in entries]
+                self.keyIds = [i for _, i in entries]
+
+                #Posting lists in CSR form: trigramNames[trigramPtr[t]:trigramPtr[t+1]] are the
+                #ids of the names containing trigram t
+                self.trigramIds = {}
+                gramIds = []
+                counts = []
+                for key in normalized:
+                        grams = trigrams(key)
+                        counts.append(len(grams))
+                        gramIds += [self.trigramIds.setdefault(gram, len(self.trigramIds)) for gram in grams]
+                self.trigramCounts = np.array(counts, dtype=np.int32)
+                gramIds = np.array(gramIds, dtype=np.int64)
+                #Each name's trigrams are listed in id order, so a stable sort keeps every posting list sorted by id
+                order = np.argsort(gramIds, kind='stable')
+                self.trigramNames = np.repeat(np.arange(len(self.names), dtype=np.int32), self.trigramCounts)[order]
+                self.trigramPtr = np.zeros(len(self.trigramIds) + 1, dtype=np.int64)
+                np.cumsum(np.bincount(gramIds, minlength=len(self.trigramIds)), out=self.trigramPtr[1:])
+
+        #Returns up to limit names with a word starting with query, in alphabetical order
+        def prefix(self, query, limit=10):
+                key = normalize(query)
+                if not key:
+                        return []
+                start = bisect.bisect_left(self.keys, key)
+                stop = bisect.bisect_left(self.keys, key + "\U0010ffff", start)
+                found = []
+                seen = set()
+                for i in self.keyIds[start:stop]:
+                        if i not in seen:
+                                seen.add(i)
+                                found.append(self.names[i])
+                                if len(found) == limit:
+                                        break
+                return found
+
+        #Returns up to limit (name, score) pairs for the names sharing the most trigrams with
+        #query, best first. The score is the Dice coefficient of the two trigram sets (0-1).
+        #Shared trigrams are counted for every name at once by concatenating the query's posting
+        #lists, and a name scoring minScore must share at least required of them
+        def fuzzy(self, query, limit=10, minScore=0.4):
+                grams = trigrams(normalize(query))
+                postings = [self.trigramNames[self.trigramPtr[t]:self.trigramPtr[t + 1]]
+                            for t in (self.trigramIds.get(gram) for gram in grams) if t is not None]
+                required = max(1, math.ceil(minScore*len(grams)/(2 - minScore)))
+                if len(postings) < required:
+                        return []
+                shared = np.bincount(np.concatenate(postings), minlength=len(self.names))
+                ids = np.flatnonzero(shared >= required)
+                scores = 2*shared[ids]/(len(grams) + self.trigramCounts[ids])
+                keep = scores >= minScore
+                ids, scores = ids[keep], scores[keep]
+                best = np.argsort(-scores, kind='stable')[:limit]
+                return [(self.names[i], float(scores[k])) for k, i in zip(best, ids[best])]
+
+        #Returns up to limit names matching query: prefix matches first, then fuzzy matches
+        def search(self, query, limit=10):
+                found = self.prefix(query, limit)
+                if len(found) < limit:
+                        found += [name for name, _ in self.fuzzy(query, limit) if name not in found][:limit - len(found)]
+                return found
+
+#Returns count random place names made of random syllables (some accented), like "Brãoluvé Tanor, Quibé"
+def syntheticNames(count, seed=0):
+        rng = random.Random(seed)
+        onsets = ["b", "br", "c", "ch", "d", "dr", "f", "g", "gr", "h", "j", "k", "kr", "l", "m", "n", "p", "pl",
+                  "qu", "r", "s", "sh", "st", "t", "tr", "v", "w", "z", ""]
+        vowels = ["a", "e", "i", "o", "u", "y", "á", "é", "ã", "ü", "ö", "ô", "ñe", "ai", "ou"]
+        codas = ["", "", "", "n", "r", "s", "l", "m", "k", "t", "rg", "nd", "ssel", "dorf", "ków"]
+        syllable = lambda: rng.choice(onsets) + rng.choice(vowels) + rng.choice(codas)
+        word = lambda low, high: "".join(syllable() for _ in range(rng.randint(low, high))).capitalize()
+        return [f"{' '.join(word(2, 3) for _ in range(rng.randint(1, 2)))}, {word(2, 3)}" for _ in range(count)]
+
+#Benchmarks building the index and prefix/fuzzy lookups: python SantaNames.py [count]
+if __name__ == "__main__":
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+        names = syntheticNames(count)
+
+        start = time.perf_counter()
+        index = NameIndex(names)
+        print(f"Indexed {count} names in {time.perf_counter() - start:.2f}s")
+
+        rng = random.Random(1)
+        #Prefixes typed without accents, and names with one letter dropped (a typo)
+        prefixes = [normalize(name)[:rng.randint(3, 8)] for name in rng.sample(names, 10000)]
+        originals = rng.sample(names, 1000)
+        typos = []
+        for name in originals:
+                k = rng.randrange(len(name))
+                typos.append(name[:k] + name[k + 1:])
+        for label, queries, lookup in (("Prefix", prefixes, index.prefix), ("Fuzzy", typos, index.fuzzy)):
+                start = time.perf_counter()
+                for query in queries:
+                        lookup(query)
+                print(f"{label} lookup: {1e6*(time.perf_counter() - start)/len(queries):.1f}us per query")
+
+        found = sum(name in [match for match, _ in index.fuzzy(typo, 5)] for name, typo in zip(originals, typos))
+        print(f"Typos whose intended name is in the top 5 fuzzy matches: {found} of {len(typos)}")
@@ -0,0 +1,212 @@
+import heapq, bisect, itertools, sys
+
+"""
+Search routines over any graph with the get_nodes/getNeighbors/value/connected interface
+(Graph, FrozenGraph, or a Snapshot loaded from disk)
+"""
+
+#Dijkstra's algorithm with a min heap that stops once the closest unexplored city is
+#further than budget km from the source, or once target (if given) is reached.
+#Returns prevNodeInPath and shortestDistance like dijkstra_algorithm, but shortestDistance
+#only holds the cities settled before stopping, in the order they were settled (closest first)
+def boundedSearch(graph, source, budget=sys.maxsize, target=None):
+        shortestDistance = {}
+        prevNodeInPath = {}
+        #Best distance found so far to cities that haven't been settled yet
+        frontier = {source: 0}
+        queue = [(0, source)]
+        while queue:
+                distance, node = heapq.heappop(queue)
+                #Skip stale queue entries for cities already settled by a shorter path
+                if node in shortestDistance:
+                        continue
+                #Everything left in the queue is further away, so stop expanding
+                if distance > budget:
+                        break
+                shortestDistance[node] = distance
+                if node == target:
+                        break
+                for neighbor in graph.getNeighbors(node):
+                        if neighbor in shortestDistance:
+                                continue
+                        newDistance = distance + graph.value(node, neighbor)
+                        if newDistance <= budget and newDistance < frontier.get(neighbor, sys.maxsize):
+                                frontier[neighbor] = newDistance
+                                prevNodeInPath[neighbor] = node
+                                heapq.heappush(queue, (newDistance, neighbor))
+        return prevNodeInPath, shortestDistance
+
+#Returns the shortest route from source to destination as (distance, path), or None if
+#the destination can't be reached
+def shortestRoute(graph, source, destination):
+        #Every graph tracks its connected components, so unreachable pairs are rejected without searching
+        if not graph.connected(source, destination):
+                return None
+        prevNodeInPath, shortestDistance = boundedSearch(graph, source, target=destination)
+        if destination not in shortestDistance:
+                return None
+        return shortestDistance[destination], tracePath(prevNodeInPath, source, destination)
+
+#Walks prevNodeInPath back from destination, returning the path from source to destination
+def tracePath(prevNodeInPath, source, destination):
+        path = [destination]
+        while path[-1] != source:
+                path.append(prevNodeInPath[path[-1]])
+        path.reverse()
+        return path
+
+#Returns the cities reachable from source within budget km as a dictionary of city: distance
+def reachable(graph, source, budget):
+        return boundedSearch(graph, source, budget)[1]
+
+#Nested isochrones for several budgets in one search. Returns a dictionary mapping each
+#budget to the cities reachable within it and their distances. Cities are settled closest
+#first, so each budget's cities are a prefix of the next larger budget's. Budgets can be given
+#in any order; no budgets gives an empty dictionary without searching
+def isochrones(graph, source, budgets):
+        budgets = sorted(budgets)
+        if not budgets:
+                return {}
+        settled = list(boundedSearch(graph, source, budgets[-1])[1].items())
+        result = {}
+        count = 0
+        for budget in budgets:
+                while count < len(settled) and settled[count][1] <= budget:
+                        count += 1
+                result[budget] = dict(settled[:count])
+        return result
+
+#Returns the index of the smallest isochrone band each reachable city falls in
+def isochroneBands(result):
+        bands = {}
+        for band, budget in enumerate(sorted(result)):
+                for city in result[budget]:
+                        bands.setdefault(city, band)
+        return bands
+
+BAND_COLORS = ['red', 'darkorange', 'gold', 'yellowgreen', 'teal', 'slateblue', 'purple']
+
+#Recolors the cities plotted by plotCities by the isochrone band they fall in.
+#Cities outside every budget keep their orange color
+def plotIsochrones(result, colors=BAND_COLORS):
+        from SantaGraph import cities, plotCulled
+
+        #Group the cities by band so each band is a single line, culled with the other cities
+        bandCities = {}
+        for city, band in isochroneBands(result).items():
+                bandCities.setdefault(band, []).append(city)
+        for band, names in bandCities.items():
+                plotCulled(cities.coordsOf(names), marker='o', color=colors[band % len(colors)])
+
+#Multi-source Dijkstra: every depot starts in the queue at distance 0, so one pass labels each
+#city with its nearest depot by route (a Voronoi partition of the graph). Returns two
+#dictionaries {city: depot} and {city: distance to that depot} for the cities within budget km
+#of a depot. Ties between equally close depots go to the depot that comes first in depots
+def nearestDepots(graph, depots, budget=sys.maxsize):
+        nearestDepot = {}
+        shortestDistance = {}
+        #Best (distance, depot rank) found so far for cities that haven't been settled yet. Comparing
+        #the pair, here and in the queue, hands a city reached equally soon to the first listed depot
+        frontier = {}
+        queue = []
+        #Queue entries are (distance, depot rank, city, depot)
+        for rank, depot in enumerate(depots):
+                if depot not in frontier:
+                        frontier[depot] = (0, rank)
+                        queue.append((0, rank, depot, depot))
+        heapq.heapify(queue)
+        while queue:
+                distance, rank, node, depot = heapq.heappop(queue)
+                if node in shortestDistance:
+                        continue
+                if distance > budget:
+                        break
+                shortestDistance[node] = distance
+                nearestDepot[node] = depot
+                for neighbor in graph.getNeighbors(node):
+                        if neighbor in shortestDistance:
+                                continue
+                        newDistance = distance + graph.value(node, neighbor)
+                        if newDistance <= budget and (newDistance, rank) < frontier.get(neighbor, (sys.maxsize, 0)):
+                                frontier[neighbor] = (newDistance, rank)
+                                heapq.heappush(queue, (newDistance, rank, neighbor, depot))
+        return nearestDepot, shortestDistance
+
+#Colors that stand out from the orange cities and gold routes
+DEPOT_COLORS = ['royalblue', 'crimson', 'forestgreen', 'darkviolet', 'teal', 'saddlebrown', 'magenta']
+
+#Recolors the cities plotted by plotCities by their nearest depot, and marks the depots.
+#Cities no depot can reach keep their orange color
+def plotDepots(nearestDepot, colors=DEPOT_COLORS):
+        from SantaGraph import cities, plotCulled
+
+        regions = {}
+        for city, depot in nearestDepot.items():
+                regions.setdefault(depot, []).append(city)
+        for k, (depot, names) in enumerate(regions.items()):
+                color = colors[k % len(colors)]
+                plotCulled(cities.coordsOf(names), marker='o', color=color)
+                plotCulled(cities.coord(depot), marker='P', markersize=11, color=color, markeredgecolor='black')
+
+"""
+Non-dominated (Pareto optimal) labels of every node for a multi-criteria search.
+Labels are grouped by hop count, and each hop count keeps a staircase of (distance, risk)
+pairs sorted by distance with strictly decreasing risk, so checking whether a label is
+dominated is a binary search per hop count rather than a scan of every label
+"""
+class ParetoBag(object):
+        def __init__(self):
+                self.staircases = {}
+
+        #Returns True if some label in the bag is at least as good in every criterion
+        def dominates(self, distance, hops, risk):
+                for labelHops, (distances, risks) in self.staircases.items():
+                        if labelHops > hops:
+                                continue
+                        #The lowest risk among labels no longer than distance is the last of them
+                        k = bisect.bisect_right(distances, distance)
+                        if k > 0 and risks[k - 1] <= risk:
+                                return True
+                return False
+
+        #Adds a label. Labels must be added in increasing (distance, hops, risk) order,
+        #which means a new label can never dominate one already in the bag
+        def add(self, distance, hops, risk):
+                distances, risks = self.staircases.setdefault(hops, ([], []))
+                distances.append(distance)
+                risks.append(risk)
+
+#Multi-criteria label-setting search that trades off total distance, number of legs and total
+#risk, where risk(cityA, cityB) scores each route (e.g. routeRisk for ocean crossings).
+#Returns the Pareto front of routes from source to destination as a list of
+#(distance, hops, risk, path) sorted by distance
+def paretoRoutes(graph, source, destination, risk):
+        bags = {}
+        front = []
+        #Labels are (distance, hops, risk, tie breaker, node, parent label)
+        counter = itertools.count()
+        queue = [(0, 0, 0, next(counter), source, None)]
+        while queue:
+                label = heapq.heappop(queue)
+                distance, hops, labelRisk, _, node, parent = label
+                bag = bags.setdefault(node, ParetoBag())
+                #Labels are popped in lexicographic order, so a label that isn't dominated now
+                #never will be. Labels dominated by a route already found to the destination are dropped too
+                if bag.dominates(distance, hops, labelRisk) or (node != destination and destination in bags and bags[destination].dominates(distance, hops, labelRisk)):
+                        continue
+                bag.add(distance, hops, labelRisk)
+                if node == destination:
+                        path = []
+                        while label is not None:
+                                path.append(label[4])
+                                label = label[5]
+                        path.reverse()
+                        front.append((distance, hops, labelRisk, path))
+                        continue
+                for neighbor in graph.getNeighbors(node):
+                        newLabel = (distance + graph.value(node, neighbor), hops + 1,
+                                    labelRisk + risk(node, neighbor), next(counter), neighbor, label)
+                        if neighbor in bags and bags[neighbor].dominates(*newLabel[:3]):
+                                continue
+                        heapq.heappush(queue, newLabel)
+        return front
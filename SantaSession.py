@@ -0,0 +1,101 @@
+import matplotlib.pyplot as plt
+from matplotlib import animation
+
+import itertools, queue, threading, time
+
+import SantaGraph
+from SantaGraph import (fig, Graph, nodes, cityRoutes, dijkstra_algorithm, printPath, pickCity,
+                        plotCities, plotLandmass, plotRoutes, plotPath, makeAnimation, animate)
+
+"""
+Interactive session that keeps the figure open between queries.
+The cities, landmasses and routes are drawn once. Each new origin/destination only removes
+the previous red path, draws the new one and swaps the animation's frame source, so there's
+no need to restart Python and redraw the whole globe for every route.
+Queries are typed into the terminal on a background thread while the animation keeps running
+"""
+class Session(object):
+        def __init__(self):
+                #Base map, drawn once for the whole session
+                plotCities()
+                plotLandmass()
+                plotRoutes()
+                self.graph = Graph(nodes, cityRoutes)
+                self.pathArtists = []
+                self.queries = queue.Queue()
+                self.closed = False
+                #Animation frame the current path started on, set when its first frame is drawn
+                self.firstFrame = None
+                #When the current query was received, until its first frame has been drawn
+                self.queryStart = None
+                #Seconds from each query to its first drawn frame
+                self.latencies = []
+                fig.canvas.mpl_connect('draw_event', self.onDraw)
+
+        #Finds and shows the shortest path between two cities, replacing the previous one
+        def query(self, sourceCity, destinationCity):
+                self.queryStart = time.perf_counter()
+                if not self.graph.connected(sourceCity, destinationCity):
+                        print(f"\nBah humbug! There is no route from {sourceCity} to {destinationCity}.\n")
+                        self.queryStart = None
+                        return
+                prevNodeInPath, shortestDistance = dijkstra_algorithm(graph=self.graph, source=sourceCity)
+                path = printPath(prevNodeInPath, shortestDistance, source=sourceCity, destination=destinationCity)
+
+                #Only the red path artists are replaced, the base map stays as it is
+                for artist in self.pathArtists:
+                        artist.remove()
+                self.pathArtists = plotPath(path)
+                SantaGraph.path = path
+                makeAnimation(path)
+                self.firstFrame = None
+
+        #Animates the current path from its first frame, or leaves the globe still before the first query
+        def animate(self, i):
+                if not self.pathArtists:
+                        return fig,
+                if self.firstFrame is None:
+                        self.firstFrame = i
+                return animate(i - self.firstFrame)
+
+        #Records the time from a query to the first frame drawn for it
+        def onDraw(self, event):
+                if self.queryStart is not None and self.firstFrame is not None:
+                        self.latencies.append(time.perf_counter() - self.queryStart)
+                        print(f"First frame drawn {1000*self.latencies[-1]:.1f}ms after the query")
+                        self.queryStart = None
+
+        #Reads origin/destination pairs from the terminal until the user quits
+        def readQueries(self):
+                while not self.closed:
+                        try:
+                                source = input("Origin (q to quit): ")
+                                if source.strip().lower() == "q":
+                                        break
+                                sourceCity = pickCity(source)
+                                destinationCity = pickCity(input("Destination: "))
+                        except EOFError:
+                                break
+                        except:
+                                print("Please input numbers between 0-39, a city name, or a latitude, longitude")
+                                continue
+                        self.queries.put((sourceCity, destinationCity))
+                self.closed = True
+
+        #Runs the animation, answering queries as they arrive until the window is closed or the user quits
+        def run(self):
+                self.anim = animation.FuncAnimation(fig, self.animate, frames=itertools.count(),
+                                                    interval=5, blit=False, cache_frame_data=False)
+                plt.show(block=False)
+                threading.Thread(target=self.readQueries, daemon=True).start()
+                while not self.closed and plt.fignum_exists(fig.number):
+                        try:
+                                self.query(*self.queries.get_nowait())
+                        except queue.Empty:
+                                pass
+                        plt.pause(0.02)
+                self.closed = True
+
+if __name__ == "__main__":
+        print("Stranded Santa session: enter origins and destinations by number (0-39), name or latitude, longitude")
+        Session().run()
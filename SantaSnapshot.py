@@ -0,0 +1,248 @@
+import numpy as np
+
+import os, sys, mmap, json, struct, hashlib, zlib
+
+"""
+Binary snapshot of a city graph so it can be memory-mapped at startup
+instead of being rebuilt from the coordinate literals and distance() calls.
+
+File layout (all sections are aligned to 64 bytes):
+        magic "SANTASNP" | version (uint32) | table length (uint32) | JSON section table | sections...
+The JSON table records the node count, the content hash of the graph, a CRC32 of
+the payload, and the dtype/shape/offset of every section. Each city's connected component
+is stored with the routes, so unreachable pairs are rejected without a search. Arrays are read back
+with np.frombuffer over the mmap, so loading never copies the payload.
+"""
+
+SNAPSHOT_MAGIC = b"SANTASNP"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_ALIGN = 64
+HEADER = struct.Struct("<8sII")
+
+#Returns a hash of the graph contents, used to detect snapshots that no longer
+#match the graph they were written from
+def contentHash(names, coords, indptr, indices, weights):
+        digest = hashlib.sha256()
+        for name in names:
+                digest.update(name.encode("utf-8") + b"\0")
+        digest.update(np.ascontiguousarray(coords, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(indptr, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(indices, dtype=np.int32).tobytes())
+        digest.update(np.ascontiguousarray(weights, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+#Returns the connected component of every node of a CSR graph, labelled by its lowest node
+#index. Each round hooks every component's root onto the lowest root it has a route to,
+#then points every node straight at its new root, so it takes few rounds on any graph
+def componentLabels(indptr, indices):
+        nodeCount = len(indptr) - 1
+        labels = np.arange(nodeCount, dtype=np.int64)
+        sources = np.repeat(labels, np.diff(indptr))
+        targets = np.asarray(indices, dtype=np.int64)
+        while True:
+                roots = labels.copy()
+                np.minimum.at(roots, labels[sources], labels[targets])
+                while True:
+                        jumped = roots[roots]
+                        if np.array_equal(jumped, roots):
+                                break
+                        roots = jumped
+                if np.array_equal(roots, labels):
+                        return labels.astype(np.int32)
+                labels = roots
+
+#Packs the city names into one utf-8 byte blob plus an offsets array
+def packNames(names):
+        encoded = [name.encode("utf-8") for name in names]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(name) for name in encoded])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+#Writes a snapshot of the graph to path. tables is an optional dictionary of
+#extra precomputed arrays (distance matrices, landmark tables, ...) stored alongside it
+def writeSnapshot(path, names, coords, longLat, indptr, indices, weights, tables=None, nodeIds=None):
+        names = list(names)
+        if nodeIds is None:
+                nodeIds = np.arange(len(names), dtype=np.int32)
+        nameBytes, nameOffsets = packNames(names)
+
+        sections = {"nodeIds": np.ascontiguousarray(nodeIds, dtype=np.int32),
+                    "nameBytes": nameBytes,
+                    "nameOffsets": nameOffsets,
+                    "coords": np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 3),
+                    "longLat": np.ascontiguousarray(longLat, dtype=np.float64).reshape(-1, 2),
+                    "indptr": np.ascontiguousarray(indptr, dtype=np.int64),
+                    "indices": np.ascontiguousarray(indices, dtype=np.int32),
+                    "weights": np.ascontiguousarray(weights, dtype=np.float64)}
+        sections["components"] = componentLabels(sections["indptr"], sections["indices"])
+        for name, table in (tables or {}).items():
+                sections["table:" + name] = np.ascontiguousarray(table)
+
+        #Lay out every section at an aligned offset relative to the start of the payload
+        layout = {}
+        offset = 0
+        for name, array in sections.items():
+                offset = -(-offset // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+                layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+                offset += array.nbytes
+        payload = bytearray(offset)
+        for name, array in sections.items():
+                start = layout[name]["offset"]
+                payload[start:start + array.nbytes] = array.tobytes()
+
+        table = {"nodeCount": len(names),
+                 "edgeCount": int(len(sections["indices"])),
+                 "contentHash": contentHash(names, sections["coords"], sections["indptr"],
+                                            sections["indices"], sections["weights"]),
+                 "payloadCrc": zlib.crc32(payload),
+                 "sections": layout}
+        tableBytes = json.dumps(table).encode("utf-8")
+        #Pad the header so the payload itself starts on an aligned boundary
+        headerLength = HEADER.size + len(tableBytes)
+        tableBytes += b" " * (-(-headerLength // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN - headerLength)
+
+        #Write a temporary file and swap it in, so a process with the old snapshot mapped keeps
+        #reading the old file instead of one truncated under it
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+                with open(temporary, "wb") as file:
+                        file.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(tableBytes)))
+                        file.write(tableBytes)
+                        file.write(payload)
+                os.replace(temporary, path)
+        except BaseException:
+                if os.path.exists(temporary):
+                        os.remove(temporary)
+                raise
+        return table["contentHash"]
+
+#Writes a snapshot of a Graph. cityCoords is in the same order as the graph's nodes,
+#longLat is the dictionary of decimal latitude/longitude keyed by city
+def writeGraphSnapshot(path, graph, cityCoords, longLat, tables=None):
+        indptr, indices, weights = graph.toCSR()
+        nodes = graph.get_nodes()
+        return writeSnapshot(path, nodes, cityCoords, [longLat[node] for node in nodes],
+                             indptr, indices, weights, tables=tables)
+
+"""
+A memory-mapped, read-only graph loaded from a snapshot file.
+Implements the same get_nodes/getNeighbors/value/connected interface as Graph, so it can be
+passed straight to dijkstra_algorithm, and exposes the raw CSR arrays for array engines
+"""
+class Snapshot(object):
+        def __init__(self, path, expectedHash=None, verify=False):
+                self.path = path
+                with open(path, "rb") as file:
+                        self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+                magic, version, tableLength = HEADER.unpack_from(self.mmap, 0)
+                if magic != SNAPSHOT_MAGIC:
+                        raise ValueError(f"{path} is not a Santa graph snapshot")
+                if version != SNAPSHOT_VERSION:
+                        raise ValueError(f"{path} has snapshot version {version}, expected {SNAPSHOT_VERSION}")
+                self.table = json.loads(bytes(self.mmap[HEADER.size:HEADER.size + tableLength]))
+                self.payloadStart = HEADER.size + tableLength
+
+                self.contentHash = self.table["contentHash"]
+                if expectedHash is not None and expectedHash != self.contentHash:
+                        raise ValueError(f"{path} is stale: it was written from a different graph")
+                #Checking the CRC reads the whole payload, so it is only done on request
+                if verify and zlib.crc32(memoryview(self.mmap)[self.payloadStart:]) != self.table["payloadCrc"]:
+                        raise ValueError(f"{path} is corrupt: payload checksum does not match")
+
+                self.nodeIds = self.section("nodeIds")
+                self.nameBytes = self.section("nameBytes")
+                self.nameOffsets = self.section("nameOffsets")
+                self.coords = self.section("coords")
+                self.longLat = self.section("longLat")
+                self.indptr = self.section("indptr")
+                self.indices = self.section("indices")
+                self.weights = self.section("weights")
+                self.components = self.section("components")
+                self.nodeCount = self.table["nodeCount"]
+                #Name lookups are only built the first time they are needed
+                self.names = None
+                self.index = None
+
+        #Returns a zero-copy view of a section of the payload
+        def section(self, name):
+                layout = self.table["sections"][name]
+                count = int(np.prod(layout["shape"], dtype=np.int64))
+                array = np.frombuffer(self.mmap, dtype=np.dtype(layout["dtype"]), count=count,
+                                      offset=self.payloadStart + layout["offset"])
+                return array.reshape(layout["shape"])
+
+        #Returns a precomputed table stored with the snapshot, or None if it wasn't saved
+        def getTable(self, name):
+                if "table:" + name not in self.table["sections"]:
+                        return None
+                return self.section("table:" + name)
+
+        #Returns the name of the node with the given index
+        def name(self, i):
+                return bytes(self.nameBytes[self.nameOffsets[i]:self.nameOffsets[i + 1]]).decode("utf-8")
+
+        #Returns the index of the node with the given name
+        def nodeIndex(self, node):
+                if self.index is None:
+                        self.index = {name: i for i, name in enumerate(self.get_nodes())}
+                return self.index[node]
+
+        #Returns the list of every city in the graph
+        def get_nodes(self):
+                if self.names is None:
+                        self.names = [self.name(i) for i in range(self.nodeCount)]
+                return self.names
+
+        #Returns a list of nodes neighboring the provided node
+        def getNeighbors(self, node):
+                i = self.nodeIndex(node)
+                names = self.get_nodes()
+                return [names[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+        #Returns the distance stored in the graph between two city nodes
+        def value(self, cityA, cityB):
+                i = self.nodeIndex(cityA)
+                j = self.nodeIndex(cityB)
+                start, end = self.indptr[i], self.indptr[i + 1]
+                k = start + np.searchsorted(self.indices[start:end], j)
+                if k == end or self.indices[k] != j:
+                        raise KeyError(cityB)
+                return float(self.weights[k])
+
+        #Returns True if there is a route between two cities
+        def connected(self, cityA, cityB):
+                return self.components[self.nodeIndex(cityA)] == self.components[self.nodeIndex(cityB)]
+
+        #Releases the memory map. Arrays taken from the snapshot (coords, tables, ...) are views
+        #of it, so while a caller still holds one the map can't be closed yet: it's then left to
+        #close by itself once the last view is released. Returns True if it closed right away.
+        #Safe to call again
+        def close(self):
+                self.nodeIds = self.nameBytes = self.nameOffsets = None
+                self.coords = self.longLat = self.indptr = self.indices = self.weights = self.components = None
+                if self.mmap is None:
+                        return True
+                try:
+                        self.mmap.close()
+                        return True
+                except BufferError:
+                        return False
+                finally:
+                        #Dropping the reference lets the views' own references close the map when they go
+                        self.mmap = None
+
+#Memory-maps a snapshot. Pass expectedHash (from contentHash or writeSnapshot) to reject
+#snapshots written from a different graph, and verify=True to check the payload CRC
+def loadSnapshot(path, expectedHash=None, verify=False):
+        return Snapshot(path, expectedHash=expectedHash, verify=verify)
+
+#Writes a snapshot of the demo graph: python SantaSnapshot.py [path]. By default it's written
+#next to this module rather than into the current directory
+if __name__ == "__main__":
+        from SantaGraph import Graph, nodes, cityRoutes, cityCoords, longLat
+
+        path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "SantaGraph.snap")
+        graph = Graph(nodes, cityRoutes)
+        digest = writeGraphSnapshot(path, graph, cityCoords, longLat)
+        print(f"Wrote {len(nodes)} cities to {path} ({digest[:12]})")
@@ -0,0 +1,209 @@
+import numpy as np
+
+import math
+
+"""
+Spatial index that snaps arbitrary latitude/longitude points to the nearest city.
+Cities are stored as unit (x, y, z) vectors, where straight-line (chord) distance orders
+points the same way as great-circle distance.
+  - Single points are snapped through a KD-tree in O(log(V)).
+  - Batches are snapped through a cube-map cell index: every cell stores the few cities that
+    could be nearest to any point inside it, so millions of points are snapped with a handful
+    of vectorized dot products each
+"""
+
+#Converts decimal latitude/longitude (scalars or arrays) to unit (x, y, z) vectors
+def toUnitVectors(lat, long):
+        lat = np.radians(np.asarray(lat, dtype=np.float64))
+        long = np.radians(np.asarray(long, dtype=np.float64))
+        return np.stack([np.cos(lat)*np.cos(long), np.cos(lat)*np.sin(long), np.sin(lat)], axis=-1)
+
+#Fewest cube-map cells per face side. Cells holding every city make snapMany a brute-force search
+MIN_RESOLUTION = 16
+
+"""
+KD-tree over (x, y, z) points. Nodes are stored as tuples of
+(split dimension, split value, left child, right child, start, end), where start:end slices
+order to the points under the node. Leaves have a split dimension of -1
+"""
+class KDTree(object):
+        def __init__(self, points, leafSize=16):
+                self.points = np.ascontiguousarray(points, dtype=np.float64)
+                self.leafSize = leafSize
+                self.order = np.arange(len(self.points))
+                self.nodes = []
+                self.build(0, len(self.points))
+
+        def build(self, start, end):
+                node = len(self.nodes)
+                self.nodes.append(None)
+                if end - start <= self.leafSize:
+                        self.nodes[node] = (-1, 0.0, -1, -1, start, end)
+                        return node
+                #Split on the widest dimension at the median point
+                indices = self.order[start:end]
+                points = self.points[indices]
+                dim = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+                mid = (end - start)//2
+                self.order[start:end] = indices[np.argpartition(points[:, dim], mid)]
+                split = self.points[self.order[start + mid], dim]
+                left = self.build(start, start + mid)
+                right = self.build(start + mid, end)
+                self.nodes[node] = (dim, split, left, right, start, end)
+                return node
+
+        #Returns the index of the point closest to point and the squared distance to it
+        def nearest(self, point):
+                bestDistance = math.inf
+                best = -1
+                #Each entry is a node and a lower bound on the squared distance to its points
+                stack = [(0, 0.0)]
+                while stack:
+                        node, bound = stack.pop()
+                        if bound >= bestDistance:
+                                continue
+                        dim, split, left, right, start, end = self.nodes[node]
+                        if dim < 0:
+                                indices = self.order[start:end]
+                                distances = ((self.points[indices] - point)**2).sum(axis=1)
+                                k = int(np.argmin(distances))
+                                if distances[k] < bestDistance:
+                                        bestDistance = float(distances[k])
+                                        best = int(indices[k])
+                                continue
+                        diff = point[dim] - split
+                        near, far = (left, right) if diff < 0 else (right, left)
+                        #Push the far side first so the near side is searched first
+                        stack.append((far, max(bound, diff*diff)))
+                        stack.append((near, bound))
+                return best, bestDistance
+
+        #Returns the indices of every point within radius of point
+        def within(self, point, radius):
+                found = []
+                stack = [0]
+                while stack:
+                        dim, split, left, right, start, end = self.nodes[stack.pop()]
+                        if dim < 0:
+                                indices = self.order[start:end]
+                                distances = ((self.points[indices] - point)**2).sum(axis=1)
+                                found.append(indices[distances <= radius*radius])
+                                continue
+                        diff = point[dim] - split
+                        if diff - radius <= 0:
+                                stack.append(left)
+                        if diff + radius >= 0:
+                                stack.append(right)
+                return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+#Returns the cube face and (i, j) cell of each unit vector on a cube map with
+#resolution x resolution cells per face
+def cubeCells(vectors, resolution):
+        absolute = np.abs(vectors)
+        axis = np.argmax(absolute, axis=-1)
+        major = np.take_along_axis(vectors, axis[..., None], axis=-1)[..., 0]
+        face = axis*2 + (major < 0)
+        #Project onto the face: the two remaining coordinates divided by the major one
+        u = np.take_along_axis(vectors, ((axis + 1) % 3)[..., None], axis=-1)[..., 0]/np.abs(major)
+        v = np.take_along_axis(vectors, ((axis + 2) % 3)[..., None], axis=-1)[..., 0]/np.abs(major)
+        i = np.clip(((u + 1)/2*resolution).astype(np.int64), 0, resolution - 1)
+        j = np.clip(((v + 1)/2*resolution).astype(np.int64), 0, resolution - 1)
+        return face, i, j
+
+#Returns the unit vectors of points (u, v) on cube faces, the inverse of cubeCells
+def cubeFacePoints(face, u, v):
+        face, u, v = np.broadcast_arrays(face, u, v)
+        axis, negative = np.divmod(face, 2)
+        points = np.zeros(face.shape + (3,))
+        np.put_along_axis(points, axis[..., None], np.where(negative, -1.0, 1.0)[..., None], axis=-1)
+        np.put_along_axis(points, ((axis + 1) % 3)[..., None], u[..., None], axis=-1)
+        np.put_along_axis(points, ((axis + 2) % 3)[..., None], v[..., None], axis=-1)
+        return points/np.linalg.norm(points, axis=-1, keepdims=True)
+
+"""
+Snaps latitude/longitude points to the nearest of the given cities. radius is the sphere
+radius used to report great-circle distances in km, and resolution the number of cube-map
+cells per face side used by snapMany (by default about one city per cell, and at least
+MIN_RESOLUTION so small city sets aren't searched by brute force)
+"""
+class CityIndex(object):
+        def __init__(self, names, latLong, radius=6378.1, resolution=None):
+                self.names = list(names)
+                self.radius = radius
+                latLong = np.asarray(latLong, dtype=np.float64).reshape(-1, 2)
+                self.vectors = toUnitVectors(latLong[:, 0], latLong[:, 1])
+                self.tree = KDTree(self.vectors)
+                #Aim for roughly one city per cell
+                if resolution is None:
+                        resolution = max(MIN_RESOLUTION, int(math.sqrt(len(self.names)/6)))
+                self.resolution = resolution
+                self.buildCells()
+
+        #Builds the candidate cities of every cube-map cell. For a cell with center c and
+        #radius r, the nearest city to any point in the cell is within nearest(c) + 2r of c.
+        #Cells hold different numbers of candidates, so they're stored as ragged lists in CSR
+        #form: cell c's candidates are cellCities[cellStart[c]:cellStart[c + 1]]
+        def buildCells(self):
+                resolution = self.resolution
+                edges = np.linspace(-1, 1, resolution + 1)
+                middles = (edges[:-1] + edges[1:])/2
+                #Cells are numbered (face*resolution + i)*resolution + j, matching cubeCells
+                face, i, j = [index.ravel() for index in np.meshgrid(np.arange(6), np.arange(resolution), np.arange(resolution), indexing='ij')]
+                centers = cubeFacePoints(face, middles[i], middles[j])
+                cellRadius = np.zeros(len(centers))
+                for a in (0, 1):
+                        for b in (0, 1):
+                                corners = cubeFacePoints(face, edges[i + a], edges[j + b])
+                                cellRadius = np.maximum(cellRadius, np.linalg.norm(corners - centers, axis=1))
+                cellRadius *= 1.0001
+
+                candidates = []
+                for center, radius in zip(centers, cellRadius):
+                        nearest = math.sqrt(self.tree.nearest(center)[1])
+                        candidates.append(self.tree.within(center, nearest + 2*radius))
+                self.cellStart = np.zeros(len(candidates) + 1, dtype=np.int64)
+                np.cumsum([len(cell) for cell in candidates], out=self.cellStart[1:])
+                self.cellCities = np.concatenate(candidates).astype(np.int64)
+
+        #Converts chord lengths between unit vectors to great-circle distances in km
+        def arcDistance(self, chord):
+                return 2*self.radius*np.arcsin(np.minimum(np.asarray(chord)/2, 1.0))
+
+        #Returns the nearest city to a latitude/longitude and the great-circle distance to it
+        def snap(self, lat, long):
+                city, distance = self.tree.nearest(toUnitVectors(lat, long))
+                return self.names[city], float(self.arcDistance(math.sqrt(distance)))
+
+        #Snaps arrays of latitudes/longitudes to their nearest cities. Returns the city indices
+        #and great-circle distances in km, processing chunkSize points at a time. The points of a
+        #chunk are grouped by how many candidates their cells have, rounded up to a power of two,
+        #and each group is padded only to that width by repeating its cells' last candidate
+        def snapMany(self, lats, longs, chunkSize=1 << 16):
+                lats = np.asarray(lats, dtype=np.float64).ravel()
+                longs = np.asarray(longs, dtype=np.float64).ravel()
+                cities = np.empty(len(lats), dtype=np.int64)
+                distances = np.empty(len(lats), dtype=np.float64)
+                for start in range(0, len(lats), chunkSize):
+                        stop = min(start + chunkSize, len(lats))
+                        points = toUnitVectors(lats[start:stop], longs[start:stop])
+                        face, i, j = cubeCells(points, self.resolution)
+                        cells = (face*self.resolution + i)*self.resolution + j
+                        first = self.cellStart[cells]
+                        counts = self.cellStart[cells + 1] - first
+                        widths = 1 << np.ceil(np.log2(counts)).astype(np.int64)
+                        for width in np.unique(widths).tolist():
+                                group = np.flatnonzero(widths == width)
+                                #Keep each batch to about chunkSize candidates
+                                step = max(1, chunkSize//width)
+                                for batch in range(0, len(group), step):
+                                        rows = group[batch:batch + step]
+                                        offsets = np.minimum(np.arange(width), counts[rows, None] - 1)
+                                        candidates = self.cellCities[first[rows, None] + offsets]
+                                        #The nearest city has the largest dot product with the point
+                                        dots = np.einsum('nkd,nd->nk', self.vectors[candidates], points[rows])
+                                        best = np.argmax(dots, axis=1)
+                                        everyRow = np.arange(len(rows))
+                                        cities[start + rows] = candidates[everyRow, best]
+                                        chords = np.sqrt(np.maximum(2 - 2*dots[everyRow, best], 0.0))
+                                        distances[start + rows] = self.arcDistance(chords)
+                return cities, distances
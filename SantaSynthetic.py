@@ -0,0 +1,170 @@
+import numpy as np
+
+import sys, time
+
+from SantaSnapshot import writeSnapshot
+from SantaSpatial import toUnitVectors
+
+"""
+Generates synthetic city graphs of any size for load testing.
+Cities are sampled on a sphere of radius 6378.1km (the same (x, y, z) convention as cityCoords),
+either uniformly or clustered around the demo cities, and every city gets routes to its
+nearest neighbors. Routes are found without a per-city search: the cities are sorted along a
+Morton (Z-order) curve under a few random rotations, and each city only compares itself
+with the cities next to it in those orders. The neighbors found this way are approximate, but
+every step is a vectorized numpy operation, so a million cities take a few seconds.
+The same seed always gives the same graph
+"""
+
+EARTH_RADIUS = 6378.1
+
+#Spreads the low 21 bits of each value out to every third bit
+def spreadBits(values):
+        values = values.astype(np.uint64) & np.uint64(0x1fffff)
+        for shift, mask in ((32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff), (8, 0x100f00f00f00f00f),
+                            (4, 0x10c30c30c30c30c3), (2, 0x1249249249249249)):
+                values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+        return values
+
+#Returns the Morton (Z-order) key of each unit vector, so sorting by key keeps nearby points together
+def mortonKeys(vectors):
+        grid = ((vectors + 1)/2*((1 << 21) - 1)).astype(np.uint64)
+        return spreadBits(grid[:, 0]) | (spreadBits(grid[:, 1]) << np.uint64(1)) | (spreadBits(grid[:, 2]) << np.uint64(2))
+
+#Returns count unit vectors. A clustered fraction of them are scattered around centers (unit
+#vectors, picked with probability proportional to weights) with a spread of spread km,
+#and the rest are uniform over the sphere
+def sampleSphere(count, rng, centers=None, weights=None, clustered=0.0, spread=300.0):
+        vectors = rng.standard_normal((count, 3))
+        clusteredCount = int(count*clustered) if centers is not None else 0
+        if clusteredCount:
+                centers = np.asarray(centers, dtype=np.float64)
+                weights = np.ones(len(centers)) if weights is None else np.asarray(weights, dtype=np.float64)
+                picks = rng.choice(len(centers), size=clusteredCount, p=weights/weights.sum())
+                vectors[:clusteredCount] = centers[picks] + vectors[:clusteredCount]*(spread/EARTH_RADIUS)
+        return vectors/np.linalg.norm(vectors, axis=1, keepdims=True)
+
+#Returns random rotation matrices
+def randomRotations(count, rng):
+        rotations = []
+        for _ in range(count):
+                q, r = np.linalg.qr(rng.standard_normal((3, 3)))
+                rotations.append(q*np.sign(np.diag(r)))
+        return rotations
+
+#Returns undirected routes (cityA, cityB, straight-line km) joining every city to (about) its
+#neighbors nearest cities. Candidates are the window cities on either side of each city along
+#the Morton curve under each rotation; pairs are returned once each, with cityA < cityB
+def proximityRoutes(vectors, neighbors, rng, rotations=4, window=8, chunkSize=1 << 16):
+        count = len(vectors)
+        #positions[r][order[r][p]] = p: where each city sits in each Morton order
+        orders = []
+        positions = []
+        for rotation in randomRotations(rotations, rng):
+                order = np.argsort(mortonKeys(vectors @ rotation.T), kind='stable')
+                position = np.empty(count, dtype=np.int64)
+                position[order] = np.arange(count)
+                orders.append(order)
+                positions.append(position)
+        offsets = np.concatenate([np.arange(-window, 0), np.arange(1, window + 1)])
+
+        cityA = []
+        cityB = []
+        for start in range(0, count, chunkSize):
+                cities = np.arange(start, min(start + chunkSize, count))
+                candidates = np.concatenate([order[np.clip(position[cities, None] + offsets, 0, count - 1)]
+                                             for order, position in zip(orders, positions)], axis=1)
+                #Candidates found by several orders (or clipped at the ends) only count once
+                candidates.sort(axis=1)
+                dots = np.einsum('nkd,nd->nk', vectors[candidates], vectors[cities])
+                dots[candidates == cities[:, None]] = -np.inf
+                dots[:, 1:][candidates[:, 1:] == candidates[:, :-1]] = -np.inf
+                k = min(neighbors, candidates.shape[1])
+                best = np.argpartition(-dots, k - 1, axis=1)[:, :k]
+                found = np.take_along_axis(candidates, best, axis=1)
+                valid = np.isfinite(np.take_along_axis(dots, best, axis=1))
+                a = np.broadcast_to(cities[:, None], found.shape)[valid]
+                b = found[valid]
+                cityA.append(np.minimum(a, b))
+                cityB.append(np.maximum(a, b))
+
+        #A route found from both of its ends is kept once
+        pairs = np.concatenate(cityA)*count + np.concatenate(cityB)
+        pairs.sort()
+        pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])]
+        cityA, cityB = np.divmod(pairs, count)
+        chords = np.sqrt(np.maximum(2 - 2*np.einsum('nd,nd->n', vectors[cityA], vectors[cityB]), 0.0))
+        return cityA, cityB, chords*EARTH_RADIUS
+
+"""
+A synthetic city graph of count cities, each joined to about neighbors of its nearest cities.
+clustered is the fraction of cities scattered around the demo cities in longLat (weighted
+toward the larger ones), spread km around them; the rest are spread uniformly over the globe.
+The arrays are kept as-is so the graph can go straight to a Graph or a snapshot
+"""
+class SyntheticGraph(object):
+        def __init__(self, count, seed=0, neighbors=6, clustered=0.0, spread=300.0):
+                rng = np.random.default_rng(seed)
+                self.count = count
+                self.seed = seed
+                centers = weights = None
+                if clustered:
+                        from SantaGraph import cities
+
+                        centers = toUnitVectors(cities.latLong[:, 0], cities.latLong[:, 1])
+                        #The demo cities are listed largest first, so weight them by rank (Zipf's law)
+                        weights = 1/np.arange(1, len(centers) + 1)
+                vectors = sampleSphere(count, rng, centers, weights, clustered, spread)
+                #Number the cities along the Morton curve, so nearby cities have nearby indices. This keeps
+                #the neighbor search (and searches on the finished graph) working on nearby memory
+                vectors = vectors[np.argsort(mortonKeys(vectors), kind='stable')]
+                self.coords = vectors*EARTH_RADIUS
+                self.latLong = np.stack([np.degrees(np.arcsin(np.clip(vectors[:, 2], -1, 1))),
+                                         np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0]))], axis=1)
+                self.cityA, self.cityB, self.distances = proximityRoutes(vectors, neighbors, rng)
+                self.names = None
+
+        #Returns the city names, "City 0" to "City {count - 1}"
+        def get_names(self):
+                if self.names is None:
+                        self.names = [f"City {i}" for i in range(self.count)]
+                return self.names
+
+        #Returns the graph in the same CSR form as Graph.toCSR, with every route in both directions
+        def toCSR(self):
+                source = np.concatenate([self.cityA, self.cityB])
+                target = np.concatenate([self.cityB, self.cityA])
+                weights = np.concatenate([self.distances, self.distances])
+                order = np.lexsort((target, source))
+                indptr = np.zeros(self.count + 1, dtype=np.int64)
+                np.cumsum(np.bincount(source, minlength=self.count), out=indptr[1:])
+                return indptr, target[order].astype(np.int32), weights[order]
+
+        #Returns the graph as a Graph (and the matching cityRoutes dictionary)
+        def toGraph(self):
+                from SantaGraph import Graph
+
+                names = self.get_names()
+                cityRoutes = {}
+                for a, b, distance in zip(self.cityA.tolist(), self.cityB.tolist(), self.distances.tolist()):
+                        cityRoutes.setdefault(names[a], {})[names[b]] = distance
+                return Graph(names, cityRoutes), cityRoutes
+
+        #Writes the graph as a snapshot that loadSnapshot can memory-map. Returns its content hash
+        def writeSnapshot(self, path, tables=None):
+                indptr, indices, weights = self.toCSR()
+                return writeSnapshot(path, self.get_names(), self.coords, self.latLong, indptr, indices, weights, tables=tables)
+
+#Writes a synthetic snapshot: python SantaSynthetic.py count [path] [seed] [clustered fraction]
+if __name__ == "__main__":
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+        path = sys.argv[2] if len(sys.argv) > 2 else "SantaSynthetic.snap"
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        clustered = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0
+
+        start = time.perf_counter()
+        graph = SyntheticGraph(count, seed=seed, clustered=clustered)
+        generated = time.perf_counter() - start
+        digest = graph.writeSnapshot(path)
+        print(f"Generated {count} cities and {len(graph.distances)} routes in {generated:.2f}s")
+        print(f"Wrote {path} ({digest[:12]}) in {time.perf_counter() - start - generated:.2f}s")